@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+from functools import partial
 import json
 import logging
 import os
 import pathlib
-from random import randint
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_call_later, async_track_time_change
+from homeassistant.helpers.event import async_track_time_change
 
+from .common.session_pool import async_get_session_pool, async_release_session_pool
 from .const.const import (
     CONF_DEFAULT_LABEL,
     CONF_EXCLUDE_LIST,
@@ -139,8 +140,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     options = _migrate_options_if_needed(hass, entry)
     effective_config = _build_effective_config(entry, options)
 
+    session_pool = async_get_session_pool(hass, entry.entry_id)
+    entry.async_on_unload(partial(async_release_session_pool, hass, entry.entry_id))
+
     coordinator = AfvalwijzerDataUpdateCoordinator(
-        hass, effective_config, entry.entry_id
+        hass, effective_config, entry.entry_id, session_pool=session_pool
     )
 
     # Pre-load translations (avoids blocking I/O in sensor callbacks).
@@ -149,6 +153,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     cache_loaded = await coordinator.async_load_cache()
+    # Cache saves are delayed; write a pending one before the entry goes away
+    entry.async_on_unload(coordinator.async_flush_cache)
 
     if not cache_loaded:
         await coordinator.async_config_entry_first_refresh()
@@ -164,34 +170,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    # Holds the cancel callback of a pending jittered refresh, so unload can
-    # cancel it without registering a new async_on_unload every midnight.
-    pending_refresh: list[Any] = []
-
     @callback
-    def _schedule_midnight_update(now: Any) -> None:
-        """Trigger an update at midnight with a randomized jitter."""
-        jitter = randint(1, 600)
-        _LOGGER.debug("Scheduling midnight refresh in %s seconds", jitter)
-
-        async def _do_update(_: Any) -> None:
-            pending_refresh.clear()
-            await coordinator.async_request_refresh()
+    def _midnight_recompute(now: Any) -> None:
+        """Shift today/tomorrow/next pickup at midnight from the cached schedule.
 
-        pending_refresh.clear()
-        pending_refresh.append(async_call_later(hass, jitter, _do_update))
+        The schedule does not change at the day boundary, so this makes no
+        requests; the regular polling interval picks up schedule changes.
+        """
+        hass.async_create_task(coordinator.async_recompute())
 
-    @callback
-    def _cancel_pending_refresh() -> None:
-        for cancel in pending_refresh:
-            cancel()
-        pending_refresh.clear()
-
-    entry.async_on_unload(_cancel_pending_refresh)
     entry.async_on_unload(
-        async_track_time_change(
-            hass, _schedule_midnight_update, hour=0, minute=0, second=0
-        )
+        async_track_time_change(hass, _midnight_recompute, hour=0, minute=0, second=0)
     )
 
     if PLATFORMS:
@@ -11,6 +11,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.translation import async_get_translations
 from homeassistant.util import dt as dt_util, slugify
 
+from .common.schedule_index import ScheduleIndex, build_schedule_index
 from .common.sensor_utils import (
     address_key,
     build_device_info,
@@ -49,61 +50,20 @@ def _display_type(waste_type: str) -> str:
     return name.capitalize()
 
 
-def _to_date(value) -> date | None:
-    """Coerce a waste data value (str, datetime or date) into a date.
+def _schedule_index(coordinator) -> ScheduleIndex:
+    """Return the coordinator's schedule index.
 
-    Cached coordinator data stores datetimes as ISO strings (e.g.
-    "2026-07-22T00:00:00"), so plain dates and full timestamps must
-    both be accepted.
+    Coordinators that do not build one (e.g. in tests) get an index built
+    from their current data on the fly.
     """
-    if isinstance(value, datetime):
-        return value.date()
-    if isinstance(value, date):
-        return value
-    if isinstance(value, str):
-        parsed_dt = dt_util.parse_datetime(value)
-        if parsed_dt is not None:
-            return parsed_dt.date()
-        return dt_util.parse_date(value)
-    return None
-
-
-def _raw_schedule(
-    coordinator, *, waste_type: str | None = None
-) -> list[tuple[str, date]]:
-    """Return the pickup schedule as (waste_type, date) pairs.
-
-    Prefers the raw schedule (every future date for every type). Falls back
-    to the next-date-per-type data for caches written before the raw
-    schedule was stored. If waste_type is given, only that type's pickups
-    are returned.
-    """
-    raw = getattr(coordinator, "waste_data_raw", None) or []
-    if raw:
-        items = ((item.get("type", ""), item.get("date")) for item in raw)
-    else:
-        _LOGGER.debug(
-            "No raw schedule on coordinator; falling back to next-per-type data"
-        )
-        source = coordinator.waste_data_with_today or {}
-        items = source.items()
-
-    exclude_raw = str(coordinator.config.get(CONF_EXCLUDE_LIST, ""))
-    exclude = {x.strip() for x in exclude_raw.lower().split(",") if x.strip()}
-
-    schedule: list[tuple[str, date]] = []
-    for item_type, value in items:
-        if not item_type:
-            continue
-        if waste_type is not None and item_type.strip().lower() != waste_type.lower():
-            continue
-        if item_type.strip().lower() in exclude:
-            continue
-        event_date = _to_date(value)
-        if event_date is None:
-            continue
-        schedule.append((item_type, event_date))
-    return schedule
+    index = getattr(coordinator, "schedule_index", None)
+    if isinstance(index, ScheduleIndex):
+        return index
+    return build_schedule_index(
+        getattr(coordinator, "waste_data_raw", None),
+        coordinator.waste_data_with_today,
+        coordinator.config.get(CONF_EXCLUDE_LIST, ""),
+    )
 
 
 @callback
@@ -234,6 +194,11 @@ class _AfvalwijzerCalendarBase(CalendarEntity):
     def __init__(self, coordinator):
         """Initialize the calendar base."""
         self.coordinator = coordinator
+        # (index, today, event) of the last event lookup; a new index means
+        # the coordinator updated, a new day that the next pickup may differ
+        self._event_cache: tuple[ScheduleIndex, date, CalendarEvent | None] | None = (
+            None
+        )
 
     @property
     def device_info(self):
@@ -243,28 +208,27 @@ class _AfvalwijzerCalendarBase(CalendarEntity):
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
+        index = _schedule_index(self.coordinator)
         today = dt_util.now().date()
+        cached = self._event_cache
+        if cached is not None and cached[0] is index and cached[1] == today:
+            return cached[2]
+
+        event = self._next_event(index, today)
+        self._event_cache = (index, today, event)
+        return event
+
+    def _next_event(self, index: ScheduleIndex, today: date) -> CalendarEvent | None:
+        """Return the event for the first pickup day from today."""
         include_today = self.coordinator.config.get("include_today", True)
         collector = self.coordinator.config.get(CONF_COLLECTOR, "Afvalwijzer")
 
-        upcoming_events = [
-            (event_date, waste_type)
-            for waste_type, event_date in _raw_schedule(
-                self.coordinator, waste_type=self._waste_type
-            )
-            if event_date >= today and (include_today or event_date != today)
-        ]
-
-        if not upcoming_events:
+        first_day = today if include_today else today + timedelta(days=1)
+        next_pickup = index.next_pickup(first_day, waste_type=self._waste_type)
+        if next_pickup is None:
             return None
 
-        upcoming_events.sort(key=lambda x: x[0])
-        next_event_date = upcoming_events[0][0]
-
-        types_on_next_date = []
-        for event_date, waste_type in upcoming_events:
-            if event_date == next_event_date and waste_type not in types_on_next_date:
-                types_on_next_date.append(waste_type)
+        next_event_date, types_on_next_date = next_pickup
         summary_text = f"{collector.capitalize()}: {', '.join([_display_type(wt) for wt in types_on_next_date])}"
 
         return CalendarEvent(
@@ -283,31 +247,28 @@ class _AfvalwijzerCalendarBase(CalendarEntity):
         include_today = self.coordinator.config.get("include_today", True)
         collector = self.coordinator.config.get(CONF_COLLECTOR, "Afvalwijzer")
 
-        schedule = _raw_schedule(self.coordinator, waste_type=self._waste_type)
-        for waste_type, event_date in schedule:
-            if not include_today and event_date == today:
+        index = _schedule_index(self.coordinator)
+        for waste_type, start in index.between(
+            start_date.date(), end_date.date(), waste_type=self._waste_type
+        ):
+            if not include_today and start == today:
                 continue
 
-            start = event_date
-            end = start + timedelta(days=1)
-
-            if start_date.date() <= start <= end_date.date():
-                summary_text = f"{collector.capitalize()}: {_display_type(waste_type)}"
-
-                events.append(
-                    CalendarEvent(
-                        summary=summary_text,
-                        start=start,
-                        end=end,
-                    )
+            summary_text = f"{collector.capitalize()}: {_display_type(waste_type)}"
+            events.append(
+                CalendarEvent(
+                    summary=summary_text,
+                    start=start,
+                    end=start + timedelta(days=1),
                 )
+            )
 
         _LOGGER.debug(
             "Calendar returning %d event(s) between %s and %s (full schedule: %d entries)",
             len(events),
             start_date.date(),
             end_date.date(),
-            len(schedule),
+            len(index),
         )
         return events
 
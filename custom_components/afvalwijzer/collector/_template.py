@@ -10,6 +10,7 @@ _LOGGER = logging.getLogger(__name__)
 
 # from ..const.const import SENSOR_COLLECTORS_<NAME>
 # from ..common.main_functions import format_postal_code, waste_type_rename, ...
+# from ..common.refresh_timings import phase
 
 
 _DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 20.0)
@@ -39,6 +40,7 @@ def _fetch_waste_data_raw_temp(
     raise NotImplementedError
 
 
+# Decorate with @phase("parse"), so diagnostics show the time spent parsing
 def _parse_waste_data_raw(
     waste_data_raw_temp: Any, postal_code: str = ""
 ) -> list[dict[str, Any]]:
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 from typing import Any
 
 import requests
 
+from ..common.address_cache import address_key, fetch_with_address
+from ..common.fan_out import first_accepted
 from ..common.main_functions import format_postal_code, waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_AMSTERDAM
 
 _LOGGER = logging.getLogger(__name__)
@@ -149,6 +153,27 @@ def _check_response_is_valid(text: str) -> bool:
     return bool(text) and len(text) > 220
 
 
+def _fetch_variant(
+    session: requests.Session,
+    base_url: str,
+    params: dict[str, str],
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+) -> dict[str, Any] | None:
+    """Return the data found with one suffix variant, or None if not valid."""
+    response = session.get(
+        f"{base_url}/",
+        params=params,
+        timeout=timeout,
+        verify=verify,
+    )
+    response.raise_for_status()
+    if not _check_response_is_valid(response.text):
+        return None
+    return response.json()
+
+
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
     base_url: str,
@@ -156,26 +181,48 @@ def _fetch_waste_data_raw_temp(
     *,
     timeout: tuple[float, float],
     verify: bool,
+    address_cache: dict[str, Any] | None = None,
+    cache_key: str = "",
 ) -> dict[str, Any]:
-    """Fetch raw waste data using multiple suffix variants."""
-    last_url = None
+    """Fetch raw waste data using multiple suffix variants.
+
+    The variants are tried in params_list order and the first valid response
+    wins; the next variant is already requested while one is in flight. With
+    address_cache the winning variant is remembered and requested on its
+    own next time; all variants are tried again once it stops returning
+    valid data.
+    """
+    fetch_variant = partial(
+        _fetch_variant, session, base_url, timeout=timeout, verify=verify
+    )
+    probed: dict[str, Any] = {}
 
-    for params in params_list:
-        response = session.get(
-            f"{base_url}/",
-            params=params,
-            timeout=timeout,
-            verify=verify,
+    def _try_variant(params: dict[str, str]) -> tuple[dict[str, str], Any]:
+        return params, fetch_variant(params)
+
+    def _probe_variants() -> dict[str, Any] | None:
+        found = first_accepted(
+            [partial(_try_variant, params) for params in params_list],
+            lambda result: result[1] is not None,
         )
-        response.raise_for_status()
-        last_url = str(response.url)
+        if found is None:
+            return None
+        params, probed["data"] = found
+        return {"params": params}
 
-        if _check_response_is_valid(response.text):
-            return response.json()
+    def _fetch(ids: dict[str, Any]) -> dict[str, Any] | None:
+        # The probe that just found the variant already has its data
+        if "data" in probed:
+            return probed.pop("data")
+        return fetch_variant(ids["params"])
 
-    raise ValueError(f"Invalid and/or no data received from {last_url or base_url}")
+    data = fetch_with_address(address_cache, cache_key, _probe_variants, _fetch)
+    if data is None:
+        raise ValueError(f"Invalid and/or no data received from {base_url}")
+    return data
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: list[dict[str, Any]],
     postal_code: str = "",
@@ -265,8 +312,13 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With address_cache (see common.address_cache), the suffix variant that
+    found the address is remembered and tried first.
+    """
     session = session or requests.Session()
 
     try:
@@ -282,6 +334,10 @@ def get_waste_data_raw(
             params_list,
             timeout=timeout,
             verify=verify,
+            address_cache=address_cache,
+            cache_key=address_key(
+                "amsterdam", base_url, postal_code, house_number, suffix
+            ),
         )
 
         embedded = (waste_data_raw_temp.get("_embedded") or {}).get("afvalwijzer") or []
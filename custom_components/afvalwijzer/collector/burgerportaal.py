@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 import logging
 from typing import Any
 
 import requests
 
+from ..common.address_cache import address_key, fetch_with_address
 from ..common.main_functions import waste_type_rename
+from ..common.refresh_timings import phase
+from ..common.token_store import (
+    forget_token,
+    is_unauthorized,
+    remember_token,
+    valid_token,
+)
 from ..const.const import SENSOR_COLLECTORS_BURGERPORTAAL
 
 _LOGGER = logging.getLogger(__name__)
@@ -54,7 +63,8 @@ def _refresh_id_token(
     *,
     timeout: tuple[float, float],
     verify: bool,
-) -> str:
+) -> tuple[str, float | None]:
+    """Return a fresh id_token and its lifetime in seconds (if reported)."""
     response = session.post(
         f"{_BASE_GOOGLE_SECURETOKEN_URL}?key={_API_KEY}",
         headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -68,9 +78,29 @@ def _refresh_id_token(
     id_token = data.get("id_token")
     if not id_token:
         raise KeyError("Missing id_token in securetoken response")
-    return id_token
+    expires_in = data.get("expires_in")
+    return id_token, float(expires_in) if expires_in else None
 
 
+def _renew_id_token(
+    session: requests.Session,
+    refresh_token: str,
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+    token_store: dict[str, Any] | None,
+) -> tuple[str, str]:
+    id_token, expires_in = _refresh_id_token(
+        session, refresh_token, timeout=timeout, verify=verify
+    )
+    # Cheap to renew and short-lived: no reason on its own to rewrite the cache
+    remember_token(
+        token_store, "id_token", id_token, expires_in=expires_in, durable=False
+    )
+    return id_token, refresh_token
+
+
+@phase("auth")
 def _get_auth_token(
     session: requests.Session,
     *,
@@ -78,12 +108,13 @@ def _get_auth_token(
     verify: bool,
     id_token: str | None = None,
     refresh_token: str | None = None,
+    token_store: dict[str, Any] | None = None,
 ) -> tuple[str, str | None]:
     """Obtain an authentication token.
 
     Do not log in if a token is already present.
-    - Reuse id_token if provided.
-    - Refresh id_token using refresh_token if provided.
+    - Reuse id_token if provided, or stored in token_store and not near expiry.
+    - Refresh id_token using refresh_token if provided or stored.
     - Otherwise create a new anonymous user and refresh to obtain tokens.
 
     Return a tuple of (id_token, refresh_token).
@@ -92,9 +123,30 @@ def _get_auth_token(
         return id_token, refresh_token
 
     if refresh_token:
-        return _refresh_id_token(
+        id_token, _expires_in = _refresh_id_token(
             session, refresh_token, timeout=timeout, verify=verify
-        ), refresh_token
+        )
+        return id_token, refresh_token
+
+    refresh_token = valid_token(token_store, "refresh_token")
+    if refresh_token:
+        id_token = valid_token(token_store, "id_token")
+        if id_token:
+            return id_token, refresh_token
+        try:
+            return _renew_id_token(
+                session,
+                refresh_token,
+                timeout=timeout,
+                verify=verify,
+                token_store=token_store,
+            )
+        except requests.exceptions.HTTPError as err:
+            # A revoked or expired refresh token answers 400
+            if err.response is None or err.response.status_code >= 500:
+                raise
+            _LOGGER.debug("Burgerportaal: stored refresh token rejected")
+            forget_token(token_store, "refresh_token")
 
     signup = _signup_anonymous(session, timeout=timeout, verify=verify)
     if not signup:
@@ -104,8 +156,10 @@ def _get_auth_token(
     if not refresh_token:
         raise KeyError("Missing refreshToken in signup response")
 
-    id_token = _refresh_id_token(session, refresh_token, timeout=timeout, verify=verify)
-    return id_token, refresh_token
+    remember_token(token_store, "refresh_token", refresh_token)
+    return _renew_id_token(
+        session, refresh_token, timeout=timeout, verify=verify, token_store=token_store
+    )
 
 
 def _fetch_address_list(
@@ -147,6 +201,38 @@ def _select_address_id(
     return address_list[0].get("addressId")
 
 
+def _resolve_address(
+    session: requests.Session,
+    org_id: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    id_token: str,
+    timeout: tuple[float, float],
+    verify: bool,
+) -> dict[str, str] | None:
+    """Resolve the address to {"address_id": ...}, or None if it is unknown."""
+    address_list = _fetch_address_list(
+        session,
+        org_id,
+        postal_code,
+        house_number,
+        id_token,
+        timeout=timeout,
+        verify=verify,
+    )
+    if not address_list:
+        _LOGGER.error("Burgerportaal: Unable to fetch address list!")
+        return None
+
+    address_id = _select_address_id(address_list, suffix)
+    if not address_id:
+        _LOGGER.warning("Burgerportaal: Address not found!")
+        return None
+    return {"address_id": address_id}
+
+
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
     org_id: str,
@@ -167,6 +253,7 @@ def _fetch_waste_data_raw_temp(
     return data or []
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: list[dict[str, Any]],
     postal_code: str = "",
@@ -209,48 +296,72 @@ def get_waste_data_raw(
     # Optional reuse to avoid re-login (requirement)
     id_token: str | None = None,
     refresh_token: str | None = None,
+    token_store: dict[str, Any] | None = None,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With token_store (see common.token_store), the anonymous account and its
+    id token are reused until they expire. With address_cache (see
+    common.address_cache), a remembered address id skips the address lookup.
+    """
     session = session or requests.Session()
     suffix = (suffix or "").strip().upper()
     org_id = _build_org_id(provider)
+    # Tokens passed in by the caller are used as-is, never renewed here
+    uses_token_store = token_store is not None and not (id_token or refresh_token)
+
+    def fetch(id_token: str) -> list[dict[str, Any]] | None:
+        return fetch_with_address(
+            address_cache,
+            address_key("burgerportaal", org_id, postal_code, house_number, suffix),
+            partial(
+                _resolve_address,
+                session,
+                org_id,
+                postal_code,
+                house_number,
+                suffix,
+                id_token=id_token,
+                timeout=timeout,
+                verify=verify,
+            ),
+            lambda ids: _fetch_waste_data_raw_temp(
+                session,
+                org_id,
+                ids["address_id"],
+                id_token,
+                timeout=timeout,
+                verify=verify,
+            ),
+        )
 
     try:
-        id_token, refresh_token = _get_auth_token(
+        id_token, _refresh_token = _get_auth_token(
             session,
             timeout=timeout,
             verify=verify,
             id_token=id_token,
             refresh_token=refresh_token,
+            token_store=token_store,
         )
 
-        address_list = _fetch_address_list(
-            session,
-            org_id,
-            postal_code,
-            house_number,
-            id_token,
-            timeout=timeout,
-            verify=verify,
-        )
-        if not address_list:
-            _LOGGER.error("Burgerportaal: Unable to fetch address list!")
-            return []
-
-        address_id = _select_address_id(address_list, suffix)
-        if not address_id:
-            _LOGGER.warning("Burgerportaal: Address not found!")
+        try:
+            waste_data_raw_temp = fetch(id_token)
+        except requests.exceptions.HTTPError as err:
+            if not uses_token_store or not is_unauthorized(err):
+                raise
+            # The stored id token was revoked before its expiry
+            _LOGGER.debug("Burgerportaal: stored id token rejected, renewing")
+            forget_token(token_store, "id_token")
+            id_token, _refresh_token = _get_auth_token(
+                session, timeout=timeout, verify=verify, token_store=token_store
+            )
+            waste_data_raw_temp = fetch(id_token)
+
+        if waste_data_raw_temp is None:
             return []
 
-        waste_data_raw_temp = _fetch_waste_data_raw_temp(
-            session,
-            org_id,
-            address_id,
-            id_token,
-            timeout=timeout,
-            verify=verify,
-        )
-
         waste_data_raw = _parse_waste_data_raw(waste_data_raw_temp, postal_code)
         return waste_data_raw
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import re
 from typing import Any
@@ -10,6 +12,13 @@ from typing import Any
 import requests
 
 from ..common.main_functions import waste_type_rename
+from ..common.refresh_timings import phase
+from ..common.token_store import (
+    forget_token,
+    is_unauthorized,
+    remember_token,
+    valid_token,
+)
 from ..const.const import SENSOR_COLLECTORS_CIRCULUS
 
 _LOGGER = logging.getLogger(__name__)
@@ -123,17 +132,69 @@ def _ensure_authenticated_address(
     ).raise_for_status()
 
 
+@phase("auth")
+def _login(
+    session: requests.Session,
+    url: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+    token_store: dict[str, Any] | None,
+) -> dict[str, str] | None:
+    """Log in and select the address; return (and remember) the cookies.
+
+    Return None when no session could be established.
+    """
+    response, logged_in_cookies = _get_session_cookie(
+        session,
+        url,
+        postal_code,
+        house_number,
+        timeout=timeout,
+        verify=verify,
+    )
+
+    if not response or not logged_in_cookies:
+        return None
+
+    _ensure_authenticated_address(
+        session,
+        url,
+        response,
+        logged_in_cookies,
+        house_number=house_number,
+        suffix=suffix,
+        timeout=timeout,
+        verify=verify,
+    )
+
+    # The cookies the schedule request sends: the session's, with the
+    # logged-in ones taking precedence
+    cookies = {
+        **requests.utils.dict_from_cookiejar(session.cookies),
+        **requests.utils.dict_from_cookiejar(logged_in_cookies),
+    }
+    remember_token(token_store, "cookies", cookies)
+    return cookies
+
+
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
     url: str,
-    logged_in_cookies: requests.cookies.RequestsCookieJar,
+    logged_in_cookies: Mapping[str, str] | requests.cookies.RequestsCookieJar,
     *,
     days_back: int = 14,
     days_forward: int = 90,
     timeout: tuple[float, float],
     verify: bool,
-) -> list[dict[str, Any]]:
-    """Fetch the raw garbage list from the API response."""
+) -> list[dict[str, Any]] | None:
+    """Fetch the raw garbage list from the API response.
+
+    Return None when the cookies are not (or no longer) logged in.
+    """
     start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
     end_date = (datetime.now() + timedelta(days=days_forward)).strftime("%Y-%m-%d")
 
@@ -144,14 +205,27 @@ def _fetch_waste_data_raw_temp(
         timeout=timeout,
         verify=verify,
     )
-    response.raise_for_status()
+    try:
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as err:
+        if is_unauthorized(err):
+            return None
+        raise
+
+    try:
+        data = response.json()
+    except ValueError:
+        # An expired session is answered with the login page
+        return None
+    if not isinstance(data, dict) or "customData" not in data:
+        return None
 
-    data = response.json()
     garbage = (data.get("customData") or {}).get("response", {}).get("garbage", [])
 
     return garbage or []
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: list[dict[str, Any]],
     postal_code: str = "",
@@ -182,45 +256,53 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    token_store: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With token_store (see common.token_store), the logged-in cookies are
+    reused, and the login and address selection only run again once the
+    schedule request reports the session as expired.
+    """
     session = session or requests.Session()
     suffix = (suffix or "").strip().upper()
     url = _build_url(provider)
+    login = partial(
+        _login,
+        session,
+        url,
+        postal_code,
+        house_number,
+        suffix,
+        timeout=timeout,
+        verify=verify,
+        token_store=token_store,
+    )
+    fetch = partial(
+        _fetch_waste_data_raw_temp, session, url, timeout=timeout, verify=verify
+    )
 
     try:
-        response, logged_in_cookies = _get_session_cookie(
-            session,
-            url,
-            postal_code,
-            house_number,
-            timeout=timeout,
-            verify=verify,
-        )
-
-        if not response or not logged_in_cookies:
+        stored = valid_token(token_store, "cookies")
+        if stored:
+            _LOGGER.debug("Circulus: reusing stored session, skipping login")
+            waste_data_raw_temp = fetch(stored)
+            if waste_data_raw_temp is None:
+                _LOGGER.debug("Circulus: stored session expired, logging in")
+                forget_token(token_store, "cookies")
+        else:
+            waste_data_raw_temp = None
+
+        if waste_data_raw_temp is None:
+            logged_in_cookies = login()
+            if logged_in_cookies is not None:
+                waste_data_raw_temp = fetch(logged_in_cookies)
+
+        if waste_data_raw_temp is None:
             _LOGGER.error("Circulus: No waste data found (login/session failed)")
+            forget_token(token_store, "cookies")
             return []
 
-        _ensure_authenticated_address(
-            session,
-            url,
-            response,
-            logged_in_cookies,
-            house_number=house_number,
-            suffix=suffix,
-            timeout=timeout,
-            verify=verify,
-        )
-
-        waste_data_raw_temp = _fetch_waste_data_raw_temp(
-            session,
-            url,
-            logged_in_cookies,
-            timeout=timeout,
-            verify=verify,
-        )
-
         if not waste_data_raw_temp:
             _LOGGER.error("Circulus: No Waste data found!")
             return []
@@ -8,6 +8,7 @@ import logging
 import requests
 
 from ..common.main_functions import waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_DEAFVALAPP
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ def _fetch_waste_data_raw_temp(
     return response.text or ""
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: str, postal_code: str = ""
 ) -> list[dict[str, str]]:
@@ -4,15 +4,29 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
+from typing import Any
 
+import aiohttp
 import requests
 
-from ..common.main_functions import parse_ical_waste_data
+from ..common.conditional_request import (
+    check_not_modified,
+    conditional_headers,
+    update_validators,
+)
+from ..common.ical_parser import (
+    ICAL_CHUNK_SIZE,
+    async_iter_ical_waste_data,
+    default_horizon,
+    default_since,
+    iter_ical_waste_data,
+)
 from ..const.const import SENSOR_COLLECTORS_ICALENDAR
 
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 60.0)
+_DEFAULT_ASYNC_TIMEOUT = aiohttp.ClientTimeout(total=60.0, connect=5.0)
 
 
 def _build_url(
@@ -29,16 +43,69 @@ def _build_url(
     )
 
 
+def _invalid_data(url: str) -> ValueError:
+    # ValueError can occur on datetime parsing if upstream format changes
+    _LOGGER.error("iCalendar invalid and/or no data received from %s", url)
+    return ValueError(f"Invalid and/or no data received from {url}")
+
+
 def _fetch_waste_data_raw(
     session: requests.Session,
     url: str,
+    postal_code: str,
     *,
     timeout: tuple[float, float],
     verify: bool,
-) -> str:
-    response = session.get(url, timeout=timeout, verify=verify)
-    response.raise_for_status()
-    return response.text or ""
+    headers: dict[str, str],
+) -> tuple[list[dict[str, str]], dict[str, str]]:
+    """Stream the calendar through the iCal parser; return pickups and headers."""
+    response = session.get(
+        url, headers=headers, timeout=timeout, verify=verify, stream=True
+    )
+    try:
+        check_not_modified(response.status_code, url)
+        response.raise_for_status()
+        try:
+            waste_data_raw = list(
+                iter_ical_waste_data(
+                    response.iter_content(chunk_size=ICAL_CHUNK_SIZE),
+                    postal_code,
+                    horizon=default_horizon(),
+                    since=default_since(),
+                )
+            )
+        except (ValueError, KeyError) as err:
+            raise _invalid_data(url) from err
+        return waste_data_raw, dict(response.headers)
+    finally:
+        response.close()
+
+
+async def _async_fetch_waste_data_raw(
+    session: aiohttp.ClientSession,
+    url: str,
+    postal_code: str,
+    *,
+    timeout: aiohttp.ClientTimeout,
+    headers: dict[str, str],
+) -> tuple[list[dict[str, str]], dict[str, str]]:
+    """Async counterpart of _fetch_waste_data_raw."""
+    async with session.get(url, headers=headers, timeout=timeout) as response:
+        check_not_modified(response.status, url)
+        response.raise_for_status()
+        try:
+            waste_data_raw = [
+                pickup
+                async for pickup in async_iter_ical_waste_data(
+                    response.content.iter_chunked(ICAL_CHUNK_SIZE),
+                    postal_code,
+                    horizon=default_horizon(),
+                    since=default_since(),
+                )
+            ]
+        except (ValueError, KeyError) as err:
+            raise _invalid_data(url) from err
+        return waste_data_raw, dict(response.headers)
 
 
 def get_waste_data_raw(
@@ -50,8 +117,13 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    validators: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With validators, the request is conditional and NotModified is raised
+    when the calendar did not change since the previous poll.
+    """
 
     session = session or requests.Session()
 
@@ -59,25 +131,57 @@ def get_waste_data_raw(
     url = _build_url(provider, year, postal_code, house_number, suffix)
 
     try:
-        waste_data_raw_temp = _fetch_waste_data_raw(
+        waste_data_raw, headers = _fetch_waste_data_raw(
             session,
             url,
+            postal_code,
             timeout=timeout,
             verify=verify,
+            headers=conditional_headers(validators, url),
         )
 
     except requests.exceptions.RequestException as err:
         _LOGGER.error("iCalendar request error: %s", err)
         raise ValueError(err) from err
 
-    if not waste_data_raw_temp:
+    if not waste_data_raw:
         _LOGGER.error("No waste data found!")
         return []
 
+    update_validators(validators, url, headers)
+    return waste_data_raw
+
+
+async def async_get_waste_data_raw(
+    provider: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    session: aiohttp.ClientSession,
+    timeout: aiohttp.ClientTimeout = _DEFAULT_ASYNC_TIMEOUT,
+    validators: dict[str, Any] | None = None,
+) -> list[dict[str, str]]:
+    """Return waste_data_raw using the shared aiohttp session."""
+
+    year = datetime.today().year
+    url = _build_url(provider, year, postal_code, house_number, suffix)
+
     try:
-        waste_data_raw = parse_ical_waste_data(waste_data_raw_temp, postal_code)
-        return waste_data_raw
-    except (ValueError, KeyError) as err:
-        # ValueError can occur on datetime parsing if upstream format changes
-        _LOGGER.error("iCalendar invalid and/or no data received from %s", url)
-        raise ValueError(f"Invalid and/or no data received from {url}") from err
+        waste_data_raw, headers = await _async_fetch_waste_data_raw(
+            session,
+            url,
+            postal_code,
+            timeout=timeout,
+            headers=conditional_headers(validators, url),
+        )
+    except (aiohttp.ClientError, TimeoutError) as err:
+        _LOGGER.error("iCalendar request error: %s", err)
+        raise ValueError(err) from err
+
+    if not waste_data_raw:
+        _LOGGER.error("No waste data found!")
+        return []
+
+    update_validators(validators, url, headers)
+    return waste_data_raw
@@ -9,6 +9,7 @@ from typing import Any
 import requests
 
 from ..common.main_functions import waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_KLIKOGROEP
 
 _LOGGER = logging.getLogger(__name__)
@@ -50,6 +51,7 @@ def _fetch_waste_data_raw_temp(
     return response.json()
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: dict[str, Any], postal_code: str = ""
 ) -> list[dict[str, str]]:
@@ -1,9 +1,27 @@
 """Afvalwijzer main collector."""
 
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
 import logging
+from typing import Any
 
+import aiohttp
 import requests
 
+from ..common.address_cache import has_fresh_address
+from ..common.conditional_request import NotModified
+from ..common.fan_out import run_concurrently
+from ..common.pickup_event import PickupEvent, pickup_events
+from ..common.refresh_timings import (
+    TrackedClientSession,
+    current_timings,
+    phase,
+    track_session,
+)
+from ..common.single_flight import SingleFlight
 from ..common.waste_data_transformer import WasteDataTransformer
 from ..const.const import (
     SENSOR_COLLECTORS_AMSTERDAM,
@@ -24,6 +42,7 @@ from ..const.const import (
     SENSOR_COLLECTORS_ROVA,
     SENSOR_COLLECTORS_RWM,
     SENSOR_COLLECTORS_STRAATBEELD,
+    SENSOR_COLLECTORS_XIMMIO,
     SENSOR_COLLECTORS_XIMMIO_IDS,
 )
 
@@ -62,6 +81,81 @@ NOTIFICATION_PROVIDERS = [
     (SENSOR_COLLECTORS_MIJNAFVALWIJZER, mijnafvalwijzer.get_notification_data_raw),
 ]
 
+# Providers ported to the native asyncio collector API, paired with their async
+# getters. Providers not listed here still run their requests-based getter in
+# an executor thread (see AfvalwijzerDataUpdateCoordinator._async_fetch_data).
+ASYNC_PROVIDERS = [
+    (SENSOR_COLLECTORS_ICALENDAR, icalendar.async_get_waste_data_raw),
+    (SENSOR_COLLECTORS_OPZET, opzet.async_get_waste_data_raw),
+    (SENSOR_COLLECTORS_RD4, rd4.async_get_waste_data_raw),
+]
+
+ASYNC_NOTIFICATION_PROVIDERS = [
+    (SENSOR_COLLECTORS_OPZET, opzet.async_get_notification_data_raw),
+]
+
+# Providers whose schedule response also carries the notifications, paired
+# with a getter returning (waste_data_raw, notification_data) from a single
+# request. They are fetched through these instead of the lists above.
+COMBINED_PROVIDERS = [
+    (
+        SENSOR_COLLECTORS_MIJNAFVALWIJZER,
+        mijnafvalwijzer.get_waste_and_notification_data_raw,
+    ),
+]
+
+ASYNC_COMBINED_PROVIDERS = [
+    (
+        SENSOR_COLLECTORS_MIJNAFVALWIJZER,
+        mijnafvalwijzer.async_get_waste_and_notification_data_raw,
+    ),
+]
+
+# Providers whose getters accept validators= and send conditional requests
+# (ETag / If-Modified-Since), raising NotModified on a 304.
+CONDITIONAL_PROVIDERS = [
+    SENSOR_COLLECTORS_ICALENDAR,
+    SENSOR_COLLECTORS_MIJNAFVALHULP,
+    SENSOR_COLLECTORS_OPZET,
+    SENSOR_COLLECTORS_RD4,
+]
+
+# Providers whose getters accept address_cache= and remember the ids the
+# configured address resolves to (see common.address_cache).
+ADDRESS_CACHE_PROVIDERS = [
+    SENSOR_COLLECTORS_AMSTERDAM,
+    SENSOR_COLLECTORS_BURGERPORTAAL,
+    SENSOR_COLLECTORS_MIJNAFVALHULP,
+    SENSOR_COLLECTORS_MONTFERLAND,
+    SENSOR_COLLECTORS_OPZET,
+    SENSOR_COLLECTORS_RECYCLEAPP,
+    SENSOR_COLLECTORS_REINIS,
+    SENSOR_COLLECTORS_RWM,
+    SENSOR_COLLECTORS_XIMMIO_IDS,
+]
+
+# Providers whose getters accept token_store= and reuse their login tokens
+# or session cookies until they expire (see common.token_store).
+TOKEN_PROVIDERS = [
+    SENSOR_COLLECTORS_BURGERPORTAAL,
+    SENSOR_COLLECTORS_CIRCULUS,
+    SENSOR_COLLECTORS_OMRIN,
+]
+
+
+# Process-wide, so entries whose providers resolve to the same endpoint and
+# address share one in-flight fetch instead of each fetching separately.
+_SINGLE_FLIGHT = SingleFlight()
+
+
+def _find_provider(providers, provider: str):
+    """Return the (sensor_set, getter) pair registered for provider, or None."""
+    for sensor_set, getter in providers:
+        keys = sensor_set.keys() if isinstance(sensor_set, dict) else sensor_set
+        if provider in keys:
+            return sensor_set, getter
+    return None
+
 
 class MainCollector:
     """MainCollector collects and transforms waste data from various providers."""
@@ -81,6 +175,33 @@ class MainCollector:
                 return True
         return False
 
+    @staticmethod
+    def provider_supports_async(provider: str) -> bool:
+        """Return True if the provider has a native asyncio collector."""
+        provider = str(provider).strip().lower()
+        return any(
+            _find_provider(providers, provider) is not None
+            for providers in (ASYNC_COMBINED_PROVIDERS, ASYNC_PROVIDERS)
+        )
+
+    @staticmethod
+    def provider_supports_conditional(provider: str) -> bool:
+        """Return True if the provider sends conditional schedule requests."""
+        provider = str(provider).strip().lower()
+        return any(provider in sensor_set for sensor_set in CONDITIONAL_PROVIDERS)
+
+    @staticmethod
+    def provider_supports_address_cache(provider: str) -> bool:
+        """Return True if the provider remembers its resolved address ids."""
+        provider = str(provider).strip().lower()
+        return any(provider in sensor_set for sensor_set in ADDRESS_CACHE_PROVIDERS)
+
+    @staticmethod
+    def provider_supports_token_store(provider: str) -> bool:
+        """Return True if the provider reuses its login tokens."""
+        provider = str(provider).strip().lower()
+        return any(provider in sensor_set for sensor_set in TOKEN_PROVIDERS)
+
     def __init__(
         self,
         provider: str,
@@ -92,9 +213,191 @@ class MainCollector:
         exclude_pickup_today,
         exclude_list: str,
         default_label: str,
+        session: requests.Session | None = None,
+        validators: dict[str, Any] | None = None,
+        cached_waste_data_raw: list[PickupEvent] | None = None,
+        address_cache: dict[str, Any] | None = None,
+        token_store: dict[str, Any] | None = None,
     ):
-        """Initialize MainCollector with parameters and fetch waste data."""
-        # Normalize input parameters
+        """Initialize MainCollector with parameters and fetch waste data.
+
+        Pass session to send the requests over a shared connection pool;
+        a private session is created otherwise. validators (see
+        common.conditional_request) makes the schedule request conditional;
+        when the server answers 304, cached_waste_data_raw is transformed
+        again instead of a freshly parsed schedule. address_cache (see
+        common.address_cache) holds the address ids resolved by earlier
+        fetches, token_store (see common.token_store) their login tokens.
+        """
+        self._init_params(
+            provider,
+            postal_code,
+            house_number,
+            suffix,
+            street_name,
+            exclude_pickup_today=exclude_pickup_today,
+            exclude_list=exclude_list,
+            default_label=default_label,
+            validators=validators,
+            address_cache=address_cache,
+            token_store=token_store,
+        )
+
+        # One session for all requests in this refresh (waste + notifications)
+        self._session = track_session(session or requests.Session())
+
+        def _fetch_waste_data_raw():
+            # Get raw waste data using the appropriate provider method
+            with phase("schedule"):
+                try:
+                    return self._get_waste_data_raw()
+                except NotModified:
+                    return self._reuse_cached(cached_waste_data_raw)
+
+        if self._overlaps_notifications(NOTIFICATION_PROVIDERS):
+            # Independent requests: overlap the schedule and the notifications
+            waste_data_raw, self._notification_data = run_concurrently(
+                _fetch_waste_data_raw, self._get_notification_data_raw
+            )
+        else:
+            waste_data_raw = _fetch_waste_data_raw()
+            self._notification_data = self._get_notification_data_raw()
+
+        # Transform raw waste data
+        self._waste_data = self._transform(waste_data_raw)
+
+    @classmethod
+    async def async_create(
+        cls,
+        provider: str,
+        postal_code: str,
+        house_number: str,
+        suffix: str,
+        street_name: str,
+        *,
+        exclude_pickup_today,
+        exclude_list: str,
+        default_label: str,
+        websession: aiohttp.ClientSession,
+        validators: dict[str, Any] | None = None,
+        cached_waste_data_raw: list[PickupEvent] | None = None,
+        address_cache: dict[str, Any] | None = None,
+        token_store: dict[str, Any] | None = None,
+    ) -> MainCollector:
+        """Build a MainCollector using the provider's native asyncio getters.
+
+        Only valid for providers where provider_supports_async() is True; callers
+        fall back to the sync constructor (in an executor) for the others.
+        """
+        self = cls.__new__(cls)
+        self._init_params(
+            provider,
+            postal_code,
+            house_number,
+            suffix,
+            street_name,
+            exclude_pickup_today=exclude_pickup_today,
+            exclude_list=exclude_list,
+            default_label=default_label,
+            validators=validators,
+            address_cache=address_cache,
+            token_store=token_store,
+        )
+
+        combined = _find_provider(ASYNC_COMBINED_PROVIDERS, self.provider)
+        found = combined or _find_provider(ASYNC_PROVIDERS, self.provider)
+        if found is None:
+            raise ValueError(f"No async collector for provider: {self.provider}")
+        sensor_set, getter = found
+        if current_timings() is not None:
+            # Count the responses of a refresh being recorded
+            websession = TrackedClientSession(websession)
+
+        async def _fetch_waste_data_raw():
+            with phase("schedule"):
+                try:
+                    fetched = await self._async_single_flight(
+                        sensor_set,
+                        getter,
+                        partial(
+                            getter,
+                            self.provider,
+                            self.postal_code,
+                            self.house_number,
+                            self.suffix,
+                            session=websession,
+                            **self._conditional_kwargs(),
+                            **self._address_kwargs(),
+                        ),
+                    )
+                except NotModified:
+                    fetched = self._reuse_cached(cached_waste_data_raw)
+                return self._unpack_combined(fetched) if combined else fetched
+
+        if self._overlaps_notifications(ASYNC_NOTIFICATION_PROVIDERS):
+            waste_data_raw, self._notification_data = await asyncio.gather(
+                _fetch_waste_data_raw(),
+                self._async_get_notification_data_raw(websession),
+            )
+        else:
+            waste_data_raw = await _fetch_waste_data_raw()
+            self._notification_data = await self._async_get_notification_data_raw(
+                websession
+            )
+        self._waste_data = self._transform(waste_data_raw)
+        return self
+
+    @classmethod
+    def from_cache(
+        cls,
+        provider: str,
+        postal_code: str,
+        house_number: str,
+        suffix: str,
+        street_name: str,
+        *,
+        exclude_pickup_today,
+        exclude_list: str,
+        default_label: str,
+        waste_data_raw: list[PickupEvent],
+        notification_data: list[Any],
+    ) -> MainCollector:
+        """Build a MainCollector from an already fetched schedule.
+
+        Makes no requests: only the date-relative derivation (today, tomorrow,
+        next pickup, ...) is redone, e.g. when the day rolls over.
+        """
+        self = cls.__new__(cls)
+        self._init_params(
+            provider,
+            postal_code,
+            house_number,
+            suffix,
+            street_name,
+            exclude_pickup_today=exclude_pickup_today,
+            exclude_list=exclude_list,
+            default_label=default_label,
+        )
+        self._waste_data = self._transform(waste_data_raw)
+        self._notification_data = notification_data
+        return self
+
+    def _init_params(
+        self,
+        provider: str,
+        postal_code: str,
+        house_number: str,
+        suffix: str,
+        street_name: str,
+        *,
+        exclude_pickup_today,
+        exclude_list: str,
+        default_label: str,
+        validators: dict[str, Any] | None = None,
+        address_cache: dict[str, Any] | None = None,
+        token_store: dict[str, Any] | None = None,
+    ) -> None:
+        """Normalize and store the input parameters."""
         self.provider = str(provider).strip().lower()
         self.postal_code = str(postal_code).strip().upper()
         self.house_number = str(house_number).strip()
@@ -103,23 +406,174 @@ class MainCollector:
         self.exclude_pickup_today = self._normalize_bool_param(exclude_pickup_today)
         self.exclude_list = str(exclude_list).strip().lower()
         self.default_label = str(default_label).strip()
+        self._validators = validators
+        # Without a persisted cache, still share the ids resolved by the
+        # schedule fetch with the notification fetch of this run
+        self._address_cache = address_cache if address_cache is not None else {}
+        self._token_store = token_store
+        # Notifications that came with the schedule (see COMBINED_PROVIDERS)
+        self._combined_notification_data: list[Any] | None = None
+        self.not_modified = False
+
+    def _conditional_kwargs(self) -> dict[str, Any]:
+        """Return the extra getter kwargs for a conditional schedule request."""
+        if self._validators is None or not self.provider_supports_conditional(
+            self.provider
+        ):
+            return {}
+        return {"validators": self._validators}
+
+    def _address_kwargs(self) -> dict[str, Any]:
+        """Return the extra getter kwargs for remembering address ids."""
+        if not self.provider_supports_address_cache(self.provider):
+            return {}
+        return {"address_cache": self._address_cache}
+
+    def _token_kwargs(self) -> dict[str, Any]:
+        """Return the extra getter kwargs for reusing login tokens."""
+        if self._token_store is None or not self.provider_supports_token_store(
+            self.provider
+        ):
+            return {}
+        return {"token_store": self._token_store}
+
+    def _fetches_notifications_separately(self, notification_providers) -> bool:
+        """Return True if notifications need a request of their own.
+
+        That request does not depend on the schedule request, so the two can
+        run concurrently. Combined providers get both from one request.
+        """
+        return (
+            _find_provider(notification_providers, self.provider) is not None
+            and _find_provider(COMBINED_PROVIDERS, self.provider) is None
+        )
 
-        # One session for all requests in this refresh (waste + notifications)
-        self._session = requests.Session()
+    def _overlaps_notifications(self, notification_providers) -> bool:
+        """Return True if the notifications can be fetched with the schedule.
 
-        # Get raw waste data using the appropriate provider method
-        waste_data_raw = self._get_waste_data_raw()
+        Both look up the address ids through the shared address cache. Until
+        the ids are remembered they would each resolve them, so on a cold
+        cache the notifications wait for the schedule fetch to store them.
+        """
+        return self._fetches_notifications_separately(notification_providers) and (
+            not self.provider_supports_address_cache(self.provider)
+            or has_fresh_address(self._address_cache)
+        )
 
-        # Transform raw waste data
-        self._waste_data = WasteDataTransformer(
-            waste_data_raw,
-            self.exclude_pickup_today,
-            self.exclude_list,
-            self.default_label,
+    def _unpack_combined(self, fetched: tuple[list[Any], list[Any]]) -> list[Any]:
+        """Keep the notifications of a combined fetch; return its schedule."""
+        waste_data_raw, self._combined_notification_data = fetched
+        return waste_data_raw
+
+    def _reuse_cached(self, cached_waste_data_raw):
+        """Return the cached schedule after the server answered 304."""
+        if cached_waste_data_raw is None:
+            raise ValueError(f"{self.provider}: not modified, but no cached schedule")
+        _LOGGER.debug("Schedule for %s not modified, reusing cache", self.provider)
+        self.not_modified = True
+        return cached_waste_data_raw
+
+    def _coalesce_key(self, sensor_set, getter) -> tuple[str, ...]:
+        """Return the single-flight key for a fetch through getter.
+
+        Built from the endpoint the provider resolves to rather than from the
+        provider name, so aliases of one endpoint (e.g. "prezero" and "suez")
+        share a fetch for the same address.
+        """
+        endpoint = (
+            sensor_set.get(self.provider) if isinstance(sensor_set, dict) else None
+        )
+        if self.provider in SENSOR_COLLECTORS_XIMMIO_IDS:
+            # Ximmio companies are identified by company id *and* API host
+            host = SENSOR_COLLECTORS_XIMMIO.get(
+                self.provider, SENSOR_COLLECTORS_XIMMIO["ximmio"]
+            )
+            endpoint = f"{host}#{endpoint}"
+
+        return (
+            getattr(getter, "__module__", ""),
+            getattr(getter, "__qualname__", repr(getter)),
+            str(endpoint or self.provider),
+            self.postal_code,
+            self.house_number,
+            self.suffix,
+            self.street_name,
+            # Only callers holding the same schedule version may share a 304
+            repr(sorted((self._validators or {}).items())),
         )
 
-        # Get notification data
-        self._notification_data = self._get_notification_data_raw()
+    def _single_flight(self, sensor_set, getter, fetch: Callable[[], Any]) -> Any:
+        """Call fetch, or share the in-flight fetch of another collector.
+
+        The getters store what they learn (validators, address ids, login
+        tokens) in the dicts of the collector that called them. A collector
+        that shared another's fetch takes those over, as if it had made the
+        requests itself.
+        """
+        led = False
+
+        def _lead() -> tuple[Any, tuple[dict[str, Any] | None, ...]]:
+            nonlocal led
+            led = True
+            return fetch(), self._shared_state()
+
+        result, state = _SINGLE_FLIGHT.do(self._coalesce_key(sensor_set, getter), _lead)
+        if not led:
+            self._adopt_shared_state(state)
+        return result
+
+    async def _async_single_flight(
+        self, sensor_set, getter, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Async counterpart of _single_flight."""
+        led = False
+
+        async def _lead() -> tuple[Any, tuple[dict[str, Any] | None, ...]]:
+            nonlocal led
+            led = True
+            return await fetch(), self._shared_state()
+
+        result, state = await _SINGLE_FLIGHT.async_do(
+            self._coalesce_key(sensor_set, getter), _lead
+        )
+        if not led:
+            self._adopt_shared_state(state)
+        return result
+
+    def _shared_state(self) -> tuple[dict[str, Any] | None, ...]:
+        """Return copies of the validators, address cache and token store."""
+        return tuple(
+            None if store is None else dict(store)
+            for store in (self._validators, self._address_cache, self._token_store)
+        )
+
+    def _adopt_shared_state(self, state: tuple[dict[str, Any] | None, ...]) -> None:
+        """Take over what the fetch of another collector stored."""
+        validators, address_cache, token_store = state
+        if self._validators is not None and validators is not None:
+            # Both started from the same validators, see _coalesce_key
+            self._validators.clear()
+            self._validators.update(validators)
+        if address_cache:
+            self._address_cache.update(address_cache)
+        if self._token_store is not None and token_store:
+            self._token_store.update(token_store)
+
+    def _transform(self, waste_data_raw) -> WasteDataTransformer:
+        """Transform raw waste data into the structures used by the sensors.
+
+        This is where collector output becomes PickupEvents; a cached schedule
+        already consists of them.
+        """
+        with phase("parse"):
+            events = pickup_events(waste_data_raw)
+        with phase("transform"):
+            return WasteDataTransformer(
+                events,
+                self.exclude_pickup_today,
+                self.exclude_list,
+                self.default_label,
+            )
 
     def _normalize_bool_param(self, param) -> str:
         """Normalize a parameter that might be a boolean or string into a lowercase string."""
@@ -130,9 +584,26 @@ class MainCollector:
     def _get_waste_data_raw(self):
         """Determine the correct provider module to call based on the provider and retrieves raw waste data."""
         try:
+            combined = _find_provider(COMBINED_PROVIDERS, self.provider)
+            if combined is not None:
+                sensor_set, getter = combined
+                return self._unpack_combined(
+                    self._single_flight(
+                        sensor_set,
+                        getter,
+                        partial(
+                            getter,
+                            self.provider,
+                            self.postal_code,
+                            self.house_number,
+                            self.suffix,
+                            session=self._session,
+                        ),
+                    )
+                )
+
             # list of providers with common parameter signatures
             common_providers = [
-                (SENSOR_COLLECTORS_MIJNAFVALWIJZER, mijnafvalwijzer.get_waste_data_raw),
                 (SENSOR_COLLECTORS_AMSTERDAM, amsterdam.get_waste_data_raw),
                 (SENSOR_COLLECTORS_BURGERPORTAAL, burgerportaal.get_waste_data_raw),
                 (SENSOR_COLLECTORS_CIRCULUS, circulus.get_waste_data_raw),
@@ -164,7 +635,18 @@ class MainCollector:
                     ]
                     if self.provider in SENSOR_COLLECTORS_RECYCLEAPP:
                         args.append(self.street_name)
-                    return getter(*args, session=self._session)
+                    return self._single_flight(
+                        sensor_set,
+                        getter,
+                        partial(
+                            getter,
+                            *args,
+                            session=self._session,
+                            **self._conditional_kwargs(),
+                            **self._address_kwargs(),
+                            **self._token_kwargs(),
+                        ),
+                    )
             _LOGGER.error("Unknown provider: %s", self.provider)
             raise ValueError(f"Unknown provider: {self.provider}")
 
@@ -172,22 +654,31 @@ class MainCollector:
             _LOGGER.error("Check afvalwijzer platform settings: %s", err)
             raise
 
+    @phase("notifications")
     def _get_notification_data_raw(self):
         """Retrieve notification data from providers that support it.
 
         Returns an empty list if provider doesn't support notifications.
         """
+        if self._combined_notification_data is not None:
+            return self._combined_notification_data
 
         try:
             for sensor_set, getter in NOTIFICATION_PROVIDERS:
                 keys = sensor_set.keys() if isinstance(sensor_set, dict) else sensor_set
                 if self.provider in keys:
-                    return getter(
-                        self.provider,
-                        self.postal_code,
-                        self.house_number,
-                        self.suffix,
-                        session=self._session,
+                    return self._single_flight(
+                        sensor_set,
+                        getter,
+                        partial(
+                            getter,
+                            self.provider,
+                            self.postal_code,
+                            self.house_number,
+                            self.suffix,
+                            session=self._session,
+                            **self._address_kwargs(),
+                        ),
                     )
 
             # Provider doesn't support notifications
@@ -200,9 +691,41 @@ class MainCollector:
             )
             return []
 
+    async def _async_get_notification_data_raw(self, websession: aiohttp.ClientSession):
+        """Async counterpart of _get_notification_data_raw."""
+        if self._combined_notification_data is not None:
+            return self._combined_notification_data
+
+        found = _find_provider(ASYNC_NOTIFICATION_PROVIDERS, self.provider)
+        if found is None:
+            _LOGGER.debug("Provider %s does not support notifications", self.provider)
+            return []
+        sensor_set, getter = found
+
+        try:
+            with phase("notifications"):
+                return await self._async_single_flight(
+                    sensor_set,
+                    getter,
+                    partial(
+                        getter,
+                        self.provider,
+                        self.postal_code,
+                        self.house_number,
+                        self.suffix,
+                        session=websession,
+                        **self._address_kwargs(),
+                    ),
+                )
+        except Exception as err:
+            _LOGGER.warning(
+                "Could not fetch notification data for %s: %s", self.provider, err
+            )
+            return []
+
     @property
     def waste_data_raw(self):
-        """Return the full parsed pickup schedule (all future dates, all types)."""
+        """Return the full pickup schedule as date-sorted PickupEvents."""
         return self._waste_data.waste_data_raw
 
     @property
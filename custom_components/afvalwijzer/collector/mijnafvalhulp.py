@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 import re
+from typing import Any
 
 import requests
 
-from ..common.main_functions import format_postal_code, parse_ical_waste_data
+from ..common.address_cache import address_key, fetch_with_address, is_expired_link
+from ..common.conditional_request import (
+    check_not_modified,
+    conditional_headers,
+    update_validators,
+)
+from ..common.ical_parser import (
+    ICAL_CHUNK_SIZE,
+    IcalWasteParser,
+    default_horizon,
+    default_since,
+)
+from ..common.main_functions import format_postal_code
 from ..const.const import SENSOR_COLLECTORS_MIJNAFVALHULP
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,7 +59,7 @@ def _get_ical_url(html: str) -> str:
     return match.group(0)
 
 
-def _fetch_waste_data_raw(
+def _resolve_ical_url(
     session: requests.Session,
     url: str,
     postal_code: str,
@@ -53,9 +67,8 @@ def _fetch_waste_data_raw(
     suffix: str,
     *,
     timeout: tuple[float, float],
-    verify: bool,
-) -> str:
-    """Login to mijnafvalhulp and return raw iCal content."""
+) -> dict[str, str]:
+    """Login to mijnafvalhulp and return {"ical_url": ...} for the address."""
     headers = {
         "User-Agent": "Mozilla/5.0",
         "Referer": f"{url}/",
@@ -90,12 +103,51 @@ def _fetch_waste_data_raw(
         timeout=timeout,
     )
     schedule_page.raise_for_status()
-    ical_url = _get_ical_url(schedule_page.text)
+    return {"ical_url": _get_ical_url(schedule_page.text)}
 
-    ical_response = session.get(ical_url, headers=headers, timeout=timeout)
-    ical_response.raise_for_status()
 
-    return ical_response.text or ""
+def _fetch_ical(
+    session: requests.Session,
+    ical_url: str,
+    *,
+    timeout: tuple[float, float],
+    headers: dict[str, str],
+    postal_code: str,
+) -> tuple[list[dict[str, str]], dict[str, str]] | None:
+    """Stream ical_url through the iCal parser; return pickups and headers.
+
+    Return None when the URL no longer serves a calendar.
+    """
+    response = session.get(
+        ical_url,
+        headers={"User-Agent": "Mozilla/5.0", **headers},
+        timeout=timeout,
+        stream=True,
+    )
+    try:
+        check_not_modified(response.status_code, ical_url)
+        response.raise_for_status()
+        parser = IcalWasteParser(
+            postal_code, horizon=default_horizon(), since=default_since()
+        )
+        waste_data_raw: list[dict[str, str]] = []
+        try:
+            for chunk in response.iter_content(chunk_size=ICAL_CHUNK_SIZE):
+                waste_data_raw.extend(parser.feed(chunk))
+            waste_data_raw.extend(parser.close())
+        except (ValueError, KeyError) as err:
+            _LOGGER.error(
+                "mijnafvalhulp invalid and/or no data received from %s", ical_url
+            )
+            raise ValueError(
+                f"Invalid and/or no data received from {ical_url}"
+            ) from err
+    finally:
+        response.close()
+
+    if not parser.calendar_seen:
+        return None
+    return waste_data_raw, dict(response.headers)
 
 
 def get_waste_data_raw(
@@ -107,34 +159,59 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    validators: dict[str, Any] | None = None,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw for mijnafvalhulp."""
+    """Return waste_data_raw for mijnafvalhulp.
+
+    With address_cache (see common.address_cache), the iCal URL found by
+    logging in is remembered, and the login flow only runs again when that
+    URL stops serving a calendar or answers 401, 403, 404 or 410. With
+    validators, the iCal request is conditional and NotModified is raised
+    when it did not change.
+    """
 
     session = session or requests.Session()
 
     url = _build_url(provider)
+    ical_url = ""
 
-    try:
-        waste_data_raw_temp = _fetch_waste_data_raw(
+    def _fetch(ids: dict[str, Any]) -> tuple[list, dict[str, str]] | None:
+        nonlocal ical_url
+        ical_url = ids["ical_url"]
+        return _fetch_ical(
             session,
-            url,
-            postal_code,
-            house_number,
-            suffix,
+            ical_url,
             timeout=timeout,
-            verify=verify,
+            headers={"Referer": f"{url}/", **conditional_headers(validators, ical_url)},
+            postal_code=postal_code,
+        )
+
+    try:
+        fetched = fetch_with_address(
+            address_cache,
+            address_key("mijnafvalhulp", url, postal_code, house_number, suffix),
+            partial(
+                _resolve_ical_url,
+                session,
+                url,
+                postal_code,
+                house_number,
+                suffix,
+                timeout=timeout,
+            ),
+            _fetch,
+            # iCal links expire or are rotated; the login flow finds the new one
+            is_stale=is_expired_link,
         )
     except requests.exceptions.RequestException as err:
         _LOGGER.error("mijnafvalhulp request error: %s", err)
         raise ValueError(err) from err
 
-    if not waste_data_raw_temp:
+    waste_data_raw, headers = fetched or ([], {})
+    if not waste_data_raw:
         _LOGGER.error("No waste data found for mijnafvalhulp!")
         return []
 
-    try:
-        waste_data_raw = parse_ical_waste_data(waste_data_raw_temp, postal_code)
-        return waste_data_raw
-    except (ValueError, KeyError) as err:
-        _LOGGER.error("mijnafvalhulp: invalid or no data received")
-        raise ValueError("mijnafvalhulp: invalid or no data received") from err
+    update_validators(validators, ical_url, headers)
+    return waste_data_raw
@@ -7,14 +7,17 @@ from html import unescape
 import logging
 import re
 
+import aiohttp
 import requests
 
 from ..common.main_functions import format_postal_code, waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_MIJNAFVALWIJZER
 
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 60.0)
+_DEFAULT_ASYNC_TIMEOUT = aiohttp.ClientTimeout(total=60.0, connect=5.0)
 
 
 def _build_url(
@@ -51,6 +54,18 @@ def _fetch_data(
     return response.json()
 
 
+async def _async_fetch_data(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    timeout: aiohttp.ClientTimeout,
+) -> dict:
+    async with session.get(url, timeout=timeout) as response:
+        response.raise_for_status()
+        return await response.json(content_type=None)
+
+
+@phase("parse")
 def _parse_waste_data_raw(response: dict, postal_code: str = "") -> list[dict]:
     ophaaldagen_data = response.get("ophaaldagen", {}).get("data", [])
     ophaaldagen_next_data = response.get("ophaaldagenNext", {}).get("data", [])
@@ -82,6 +97,14 @@ def _parse_waste_data_raw(response: dict, postal_code: str = "") -> list[dict]:
     return waste_data_raw
 
 
+def _schedule_url(
+    provider: str, postal_code: str, house_number: str, suffix: str
+) -> str:
+    url = _build_url(provider, postal_code, house_number, suffix)
+    # Add afvaldata parameter to get afvaldata only from today onwards; this reduces the response size
+    return f"{url}&afvaldata={datetime.now().strftime('%Y-%m-%d')}"
+
+
 def get_waste_data_raw(
     provider: str,
     postal_code: str,
@@ -95,10 +118,7 @@ def get_waste_data_raw(
     """Return waste_data_raw."""
 
     session = session or requests.Session()
-    url = _build_url(provider, postal_code, house_number, suffix)
-
-    # Add afvaldata parameter to get afvaldata only from today onwards; this reduces the response size
-    url = f"{url}&afvaldata={datetime.now().strftime('%Y-%m-%d')}"
+    url = _schedule_url(provider, postal_code, house_number, suffix)
 
     try:
         response = _fetch_data(
@@ -119,6 +139,7 @@ def get_waste_data_raw(
         raise KeyError(f"Invalid and/or no data received from {url}") from err
 
 
+@phase("parse")
 def _parse_notification_data_raw(response: dict) -> list[dict]:
     """Parse notification data from the 'mededelingen' response."""
     mededelingen_data = response.get("data", {}).get("mededelingen", {}).get("data", [])
@@ -217,3 +238,142 @@ def get_notification_data_raw(
             "MijnAfvalWijzer: Invalid notification data from %s: %s", url, err
         )
         return []
+
+
+async def async_get_notification_data_raw(
+    provider: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    session: aiohttp.ClientSession,
+    timeout: aiohttp.ClientTimeout = _DEFAULT_ASYNC_TIMEOUT,
+) -> list[dict]:
+    """Async counterpart of get_notification_data_raw."""
+    url = _build_url(provider, postal_code, house_number, suffix)
+
+    try:
+        response = await _async_fetch_data(session, url, timeout=timeout)
+
+        notification_data_raw = _parse_notification_data_raw(response)
+        _LOGGER.debug(
+            "Retrieved %s notification(s) from %s", len(notification_data_raw), provider
+        )
+
+        return notification_data_raw
+
+    except (aiohttp.ClientError, TimeoutError) as err:
+        _LOGGER.warning("MijnAfvalWijzer notification request error: %s", err)
+        return []
+    except (KeyError, TypeError, ValueError) as err:
+        _LOGGER.warning(
+            "MijnAfvalWijzer: Invalid notification data from %s: %s", url, err
+        )
+        return []
+
+
+def _has_notification_section(response: dict) -> bool:
+    """Return True if the response carries 'mededelingen' (possibly empty)."""
+    data = response.get("data")
+    return isinstance(data, dict) and "mededelingen" in data
+
+
+def _parse_notifications_safely(response: dict, url: str) -> list[dict]:
+    try:
+        return _parse_notification_data_raw(response)
+    except (KeyError, TypeError, ValueError, AttributeError) as err:
+        _LOGGER.warning(
+            "MijnAfvalWijzer: Invalid notification data from %s: %s", url, err
+        )
+        return []
+
+
+def get_waste_and_notification_data_raw(
+    provider: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    session: requests.Session | None = None,
+    timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
+    verify: bool = True,
+) -> tuple[list[dict], list[dict]]:
+    """Return waste_data_raw and notification data from a single request.
+
+    The notifications are read from the schedule response. Only when that
+    response has no 'mededelingen' section at all is the full document
+    fetched for them, as get_notification_data_raw does. Notification
+    errors never fail the schedule.
+    """
+    session = session or requests.Session()
+    url = _schedule_url(provider, postal_code, house_number, suffix)
+
+    try:
+        response = _fetch_data(session, url, timeout=timeout, verify=verify)
+        waste_data_raw = _parse_waste_data_raw(response, postal_code)
+
+    except requests.exceptions.RequestException as err:
+        _LOGGER.error("MijnAfvalWijzer request error: %s", err)
+        raise ValueError(err) from err
+    except KeyError as err:
+        _LOGGER.error("MijnAfvalWijzer invalid response from %s", url)
+        raise KeyError(f"Invalid and/or no data received from {url}") from err
+
+    if not _has_notification_section(response):
+        _LOGGER.debug("No 'mededelingen' in schedule response, fetching them")
+        return waste_data_raw, get_notification_data_raw(
+            provider,
+            postal_code,
+            house_number,
+            suffix,
+            session=session,
+            timeout=timeout,
+            verify=verify,
+        )
+
+    notification_data_raw = _parse_notifications_safely(response, url)
+    _LOGGER.debug(
+        "Retrieved %s notification(s) from %s", len(notification_data_raw), provider
+    )
+    return waste_data_raw, notification_data_raw
+
+
+async def async_get_waste_and_notification_data_raw(
+    provider: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    session: aiohttp.ClientSession,
+    timeout: aiohttp.ClientTimeout = _DEFAULT_ASYNC_TIMEOUT,
+) -> tuple[list[dict], list[dict]]:
+    """Async counterpart of get_waste_and_notification_data_raw."""
+    url = _schedule_url(provider, postal_code, house_number, suffix)
+
+    try:
+        response = await _async_fetch_data(session, url, timeout=timeout)
+        waste_data_raw = _parse_waste_data_raw(response, postal_code)
+
+    except (aiohttp.ClientError, TimeoutError) as err:
+        _LOGGER.error("MijnAfvalWijzer request error: %s", err)
+        raise ValueError(err) from err
+    except KeyError as err:
+        _LOGGER.error("MijnAfvalWijzer invalid response from %s", url)
+        raise KeyError(f"Invalid and/or no data received from {url}") from err
+
+    if not _has_notification_section(response):
+        _LOGGER.debug("No 'mededelingen' in schedule response, fetching them")
+        return waste_data_raw, await async_get_notification_data_raw(
+            provider,
+            postal_code,
+            house_number,
+            suffix,
+            session=session,
+            timeout=timeout,
+        )
+
+    notification_data_raw = _parse_notifications_safely(response, url)
+    _LOGGER.debug(
+        "Retrieved %s notification(s) from %s", len(notification_data_raw), provider
+    )
+    return waste_data_raw, notification_data_raw
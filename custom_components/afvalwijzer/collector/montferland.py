@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 import logging
 from typing import Any
 
 import requests
 
+from ..common.address_cache import address_key, fetch_with_address
 from ..common.main_functions import format_postal_code, waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_MONTFERLAND
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,6 +68,38 @@ def _extract_ids(address_data: list[dict[str, Any]]) -> tuple[str | None, str |
     )
 
 
+def _resolve_address(
+    session: requests.Session,
+    base_url: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+) -> dict[str, str] | None:
+    """Resolve the address to its administratie and adres ids, or None."""
+    administratie_id, adres_id = _extract_ids(
+        _fetch_address_data(
+            session,
+            base_url,
+            postal_code,
+            house_number,
+            suffix,
+            timeout=timeout,
+            verify=verify,
+        )
+    )
+
+    if not adres_id:
+        _LOGGER.error("MONTFERLAND: AdresID not found!")
+        return None
+    if not administratie_id:
+        _LOGGER.error("MONTFERLAND: AdministratieID not found!")
+        return None
+    return {"administratie_id": administratie_id, "adres_id": adres_id}
+
+
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
     base_url: str,
@@ -89,6 +124,7 @@ def _fetch_waste_data_raw_temp(
     return response.json() or []
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: list[dict[str, Any]],
     postal_code: str = "",
@@ -125,49 +161,54 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With address_cache (see common.address_cache), remembered ids skip the
+    address lookup.
+    """
     session = session or requests.Session()
     suffix = (suffix or "").strip()
     postal_code = format_postal_code(postal_code)
 
     try:
         base_url = _build_url(provider)
-
-        address_data = _fetch_address_data(
-            session,
-            base_url,
-            postal_code,
-            str(house_number),
-            suffix,
-            timeout=timeout,
-            verify=verify,
-        )
-
-        administratie_id, adres_id = _extract_ids(address_data)
-
-        if not adres_id:
-            _LOGGER.error("MONTFERLAND: AdresID not found!")
-            return []
-        if not administratie_id:
-            _LOGGER.error("MONTFERLAND: AdministratieID not found!")
-            return []
-
         today = datetime.today()
 
-        waste_data_raw_temp = []
-        for year in (today.year, today.year + 1):
-            waste_data_raw_temp.extend(
-                _fetch_waste_data_raw_temp(
-                    session,
-                    base_url,
-                    administratie_id,
-                    adres_id,
-                    year,
-                    timeout=timeout,
-                    verify=verify,
+        def fetch(ids: dict[str, str]) -> list[dict[str, Any]]:
+            waste_data_raw_temp: list[dict[str, Any]] = []
+            for year in (today.year, today.year + 1):
+                waste_data_raw_temp.extend(
+                    _fetch_waste_data_raw_temp(
+                        session,
+                        base_url,
+                        ids["administratie_id"],
+                        ids["adres_id"],
+                        year,
+                        timeout=timeout,
+                        verify=verify,
+                    )
                 )
-            )
+            return waste_data_raw_temp
+
+        waste_data_raw_temp = fetch_with_address(
+            address_cache,
+            address_key("montferland", base_url, postal_code, house_number, suffix),
+            partial(
+                _resolve_address,
+                session,
+                base_url,
+                postal_code,
+                str(house_number),
+                suffix,
+                timeout=timeout,
+                verify=verify,
+            ),
+            fetch,
+        )
+        if waste_data_raw_temp is None:
+            return []
 
         if not waste_data_raw_temp:
             _LOGGER.error("No Waste data found!")
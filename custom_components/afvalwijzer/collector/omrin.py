@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import partial
 import logging
 from typing import Any
 import uuid
@@ -11,11 +12,21 @@ import uuid
 import requests
 
 from ..common.main_functions import format_postal_code, waste_type_rename
+from ..common.refresh_timings import phase
+from ..common.token_store import (
+    forget_token,
+    jwt_expiry,
+    remember_token,
+    stable_value,
+    valid_token,
+)
 from ..const.const import SENSOR_COLLECTORS_OMRIN
 
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 30.0)
+# How long a stored access token without an exp claim is reused
+_TOKEN_LIFETIME = timedelta(hours=12)
 
 
 def _build_url(provider: str, postal_code: str, house_number: str, suffix: str) -> str:
@@ -43,6 +54,7 @@ def _normalize_token(token: str | None) -> str | None:
     return token or None
 
 
+@phase("auth")
 def _login(
     session: requests.Session,
     url: str,
@@ -90,6 +102,45 @@ def _login(
     return token
 
 
+def _login_with_store(
+    session: requests.Session,
+    url: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+    device_id: str | None,
+    token_store: dict[str, Any] | None,
+) -> str:
+    """Log in as the stored device and remember the token until it expires."""
+    if device_id is None and token_store is not None:
+        # One device per entry, instead of a new device on every login
+        device_id = stable_value(token_store, "device_id", lambda: str(uuid.uuid4()))
+
+    token = _login(
+        session,
+        url,
+        postal_code,
+        house_number,
+        suffix,
+        timeout=timeout,
+        verify=verify,
+        device_id=device_id,
+    )
+    expires_at = jwt_expiry(token)
+    remember_token(
+        token_store,
+        "access_token",
+        token,
+        expires_at=expires_at,
+        # Without an exp claim, still log in again now and then
+        expires_in=None if expires_at else _TOKEN_LIFETIME.total_seconds(),
+    )
+    return token
+
+
 def _fetch_calendar(
     session: requests.Session,
     url: str,
@@ -134,6 +185,7 @@ def _fetch_calendar(
     return (result.get("data") or {}).get("fetchCalendar") or []
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: Sequence[dict[str, Any]],
     postal_code: str = "",
@@ -168,37 +220,64 @@ def get_waste_data_raw(
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
     device_id: str | None = None,
+    token_store: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With token_store (see common.token_store), the access token is reused
+    until it expires and logins use one stable device id.
+    """
 
     url = _build_url(provider, postal_code, house_number, suffix)
     session = session or requests.Session()
+    login = partial(
+        _login_with_store,
+        session,
+        url,
+        postal_code,
+        house_number,
+        suffix,
+        timeout=timeout,
+        verify=verify,
+        device_id=device_id,
+        token_store=token_store,
+    )
 
     try:
         token = _normalize_token(token)
+        stored = False
 
-        if not token:
+        if token:
+            _LOGGER.debug("Omrin: token supplied, skipping login")
+        elif token := valid_token(token_store, "access_token"):
+            _LOGGER.debug("Omrin: reusing stored token, skipping login")
+            stored = True
+        else:
             _LOGGER.debug("Omrin: no token supplied, logging in")
-            token = _login(
+            token = login()
+
+        try:
+            waste_data_raw_temp = _fetch_calendar(
                 session,
                 url,
-                postal_code,
-                house_number,
-                suffix,
+                token,
+                timeout=timeout,
+                verify=verify,
+            )
+        except (requests.exceptions.HTTPError, ValueError) as err:
+            if not stored:
+                raise
+            # The stored token may have been revoked before its expiry; the
+            # API reports that as a 401/403 or as GraphQL errors with a 200
+            _LOGGER.debug("Omrin: stored token rejected (%s), logging in", err)
+            forget_token(token_store, "access_token")
+            waste_data_raw_temp = _fetch_calendar(
+                session,
+                url,
+                login(),
                 timeout=timeout,
                 verify=verify,
-                device_id=device_id,
             )
-        else:
-            _LOGGER.debug("Omrin: token supplied, skipping login")
-
-        waste_data_raw_temp = _fetch_calendar(
-            session,
-            url,
-            token,
-            timeout=timeout,
-            verify=verify,
-        )
 
         waste_data_raw = _parse_waste_data_raw(waste_data_raw_temp, postal_code)
         return waste_data_raw
@@ -3,20 +3,35 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 from html import unescape
 import logging
 import re
 from typing import Any
 
+import aiohttp
 import requests
 
+from ..common.address_cache import (
+    address_key,
+    async_fetch_with_address,
+    async_resolve_address,
+    fetch_with_address,
+    resolve_address,
+)
+from ..common.conditional_request import (
+    check_not_modified,
+    conditional_headers,
+    update_validators,
+)
 from ..common.main_functions import waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_OPZET
 
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 60.0)
-_BAG_ID_CACHE: dict[str, str] = {}
+_DEFAULT_ASYNC_TIMEOUT = aiohttp.ClientTimeout(total=60.0, connect=5.0)
 
 
 def _build_base_url(provider: str) -> str:
@@ -70,38 +85,90 @@ def _get_bag_id(
     *,
     timeout: tuple[float, float],
     verify: bool,
-) -> str | None:
-    cache_key = f"{base_url}_{postal_code}_{house_number}_{suffix}"
-    if cache_key in _BAG_ID_CACHE:
-        return _BAG_ID_CACHE[cache_key]
-
+) -> dict[str, str] | None:
+    """Resolve the address to {"bag_id": ...}, or None if it is unknown."""
     response_address = _fetch_address_list(
         session, base_url, postal_code, house_number, timeout=timeout, verify=verify
     )
-    if not response_address:
-        return None
+    bag_id = _select_bag_id(response_address, suffix)
+    return {"bag_id": bag_id} if bag_id else None
+
+
+async def _async_fetch_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    timeout: aiohttp.ClientTimeout,
+) -> list[dict[str, Any]]:
+    async with session.get(url, timeout=timeout) as response:
+        response.raise_for_status()
+        data = await response.json(content_type=None)
+        return data or []
 
+
+async def _async_get_bag_id(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    timeout: aiohttp.ClientTimeout,
+) -> dict[str, str] | None:
+    """Async counterpart of _get_bag_id."""
+    response_address = await _async_fetch_json(
+        session,
+        f"{base_url}/rest/adressen/{postal_code}-{house_number}",
+        timeout=timeout,
+    )
     bag_id = _select_bag_id(response_address, suffix)
-    if bag_id:
-        _BAG_ID_CACHE[cache_key] = bag_id
-    return bag_id
+    return {"bag_id": bag_id} if bag_id else None
+
+
+def _address_key(
+    base_url: str, postal_code: str, house_number: str, suffix: str
+) -> str:
+    return address_key("opzet", base_url, postal_code, house_number, suffix)
+
+
+def _is_empty_schedule(fetched: tuple[str, list[Any], dict[str, str]]) -> bool:
+    return not fetched[1]
+
+
+def _waste_url(base_url: str, bag_id: str) -> str:
+    return f"{base_url}/rest/adressen/{bag_id}/afvalstromen"
 
 
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
-    base_url: str,
-    bag_id: str,
+    url_waste: str,
     *,
     timeout: tuple[float, float],
     verify: bool,
-) -> list[dict[str, Any]]:
-    url_waste = f"{base_url}/rest/adressen/{bag_id}/afvalstromen"
-    response = session.get(url_waste, timeout=timeout, verify=verify)
+    headers: dict[str, str],
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    response = session.get(url_waste, headers=headers, timeout=timeout, verify=verify)
+    check_not_modified(response.status_code, url_waste)
     response.raise_for_status()
     data = response.json()
-    return data or []
+    return data or [], dict(response.headers)
+
+
+async def _async_fetch_waste_data_raw_temp(
+    session: aiohttp.ClientSession,
+    url_waste: str,
+    *,
+    timeout: aiohttp.ClientTimeout,
+    headers: dict[str, str],
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    async with session.get(url_waste, headers=headers, timeout=timeout) as response:
+        check_not_modified(response.status, url_waste)
+        response.raise_for_status()
+        data = await response.json(content_type=None)
+        return data or [], dict(response.headers)
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: list[dict[str, Any]],
     postal_code: str = "",
@@ -134,37 +201,56 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    validators: dict[str, Any] | None = None,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With validators, the schedule request is conditional and NotModified is
+    raised when it did not change since the previous poll. With
+    address_cache (see common.address_cache), a remembered bag_id skips the
+    address lookup.
+    """
 
     session = session or requests.Session()
     suffix = (suffix or "").strip().upper()
 
     base_url = _build_base_url(provider)
 
-    try:
-        bag_id = _get_bag_id(
+    def fetch(ids: dict[str, Any]):
+        url_waste = _waste_url(base_url, ids["bag_id"])
+        return url_waste, *_fetch_waste_data_raw_temp(
             session,
-            base_url,
-            postal_code,
-            house_number,
-            suffix,
+            url_waste,
             timeout=timeout,
             verify=verify,
+            headers=conditional_headers(validators, url_waste),
         )
-        if not bag_id:
-            _LOGGER.warning("Address/bag_id not found!")
-            return []
 
-        waste_data_raw_temp = _fetch_waste_data_raw_temp(
-            session,
-            base_url,
-            bag_id,
-            timeout=timeout,
-            verify=verify,
+    try:
+        fetched = fetch_with_address(
+            address_cache,
+            _address_key(base_url, postal_code, house_number, suffix),
+            partial(
+                _get_bag_id,
+                session,
+                base_url,
+                postal_code,
+                house_number,
+                suffix,
+                timeout=timeout,
+                verify=verify,
+            ),
+            fetch,
+            is_empty=_is_empty_schedule,
         )
+        if fetched is None:
+            _LOGGER.warning("Address/bag_id not found!")
+            return []
 
+        url_waste, waste_data_raw_temp, headers = fetched
         waste_data_raw = _parse_waste_data_raw(waste_data_raw_temp, postal_code)
+        update_validators(validators, url_waste, headers)
         return waste_data_raw
 
     except requests.exceptions.RequestException as err:
@@ -191,6 +277,7 @@ def _fetch_notification_data_raw_temp(
     return data or []
 
 
+@phase("parse")
 def _parse_notification_data_raw(
     notification_data_raw_temp: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
@@ -230,6 +317,7 @@ def get_notification_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     """Collector-style function for fetching notification data.
 
@@ -241,23 +329,28 @@ def get_notification_data_raw(
     base_url = _build_base_url(provider)
 
     try:
-        bag_id = _get_bag_id(
-            session,
-            base_url,
-            postal_code,
-            house_number,
-            suffix,
-            timeout=timeout,
-            verify=verify,
+        ids = resolve_address(
+            address_cache,
+            _address_key(base_url, postal_code, house_number, suffix),
+            partial(
+                _get_bag_id,
+                session,
+                base_url,
+                postal_code,
+                house_number,
+                suffix,
+                timeout=timeout,
+                verify=verify,
+            ),
         )
-        if not bag_id:
+        if not ids:
             _LOGGER.debug("No bag_id found for notifications")
             return []
 
         notification_data_raw_temp = _fetch_notification_data_raw_temp(
             session,
             base_url,
-            bag_id,
+            ids["bag_id"],
             timeout=timeout,
             verify=verify,
         )
@@ -275,3 +368,114 @@ def get_notification_data_raw(
     except (KeyError, TypeError, ValueError) as err:
         _LOGGER.warning("OPZET: Invalid notification data from %s: %s", base_url, err)
         return []
+
+
+async def async_get_waste_data_raw(
+    provider: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    session: aiohttp.ClientSession,
+    timeout: aiohttp.ClientTimeout = _DEFAULT_ASYNC_TIMEOUT,
+    validators: dict[str, Any] | None = None,
+    address_cache: dict[str, Any] | None = None,
+) -> list[dict[str, str]]:
+    """Return waste_data_raw using the shared aiohttp session."""
+
+    suffix = (suffix or "").strip().upper()
+    base_url = _build_base_url(provider)
+
+    async def fetch(ids: dict[str, Any]):
+        url_waste = _waste_url(base_url, ids["bag_id"])
+        return url_waste, *await _async_fetch_waste_data_raw_temp(
+            session,
+            url_waste,
+            timeout=timeout,
+            headers=conditional_headers(validators, url_waste),
+        )
+
+    try:
+        fetched = await async_fetch_with_address(
+            address_cache,
+            _address_key(base_url, postal_code, house_number, suffix),
+            partial(
+                _async_get_bag_id,
+                session,
+                base_url,
+                postal_code,
+                house_number,
+                suffix,
+                timeout=timeout,
+            ),
+            fetch,
+            is_empty=_is_empty_schedule,
+        )
+        if fetched is None:
+            _LOGGER.warning("Address/bag_id not found!")
+            return []
+
+        url_waste, waste_data_raw_temp, headers = fetched
+        waste_data_raw = _parse_waste_data_raw(waste_data_raw_temp, postal_code)
+        update_validators(validators, url_waste, headers)
+        return waste_data_raw
+
+    except (aiohttp.ClientError, TimeoutError) as err:
+        _LOGGER.error("OPZET request error: %s", err)
+        raise ValueError(err) from err
+    except (KeyError, TypeError, ValueError) as err:
+        _LOGGER.error("OPZET: Invalid and/or no data received from %s", base_url)
+        raise ValueError(f"Invalid and/or no data received from {base_url}") from err
+
+
+async def async_get_notification_data_raw(
+    provider: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    session: aiohttp.ClientSession,
+    timeout: aiohttp.ClientTimeout = _DEFAULT_ASYNC_TIMEOUT,
+    address_cache: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """Async counterpart of get_notification_data_raw."""
+    suffix = (suffix or "").strip().upper()
+    base_url = _build_base_url(provider)
+
+    try:
+        ids = await async_resolve_address(
+            address_cache,
+            _address_key(base_url, postal_code, house_number, suffix),
+            partial(
+                _async_get_bag_id,
+                session,
+                base_url,
+                postal_code,
+                house_number,
+                suffix,
+                timeout=timeout,
+            ),
+        )
+        if not ids:
+            _LOGGER.debug("No bag_id found for notifications")
+            return []
+
+        notification_data_raw_temp = await _async_fetch_json(
+            session,
+            f"{base_url}/rest/app/meldingen/{ids['bag_id']}",
+            timeout=timeout,
+        )
+
+        notification_data_raw = _parse_notification_data_raw(notification_data_raw_temp)
+        _LOGGER.debug(
+            "Retrieved %s notification(s) from %s", len(notification_data_raw), provider
+        )
+
+        return notification_data_raw
+
+    except (aiohttp.ClientError, TimeoutError) as err:
+        _LOGGER.warning("OPZET notification request error: %s", err)
+        return []
+    except (KeyError, TypeError, ValueError) as err:
+        _LOGGER.warning("OPZET: Invalid notification data from %s: %s", base_url, err)
+        return []
@@ -6,14 +6,22 @@ from datetime import datetime
 import logging
 from typing import Any
 
+import aiohttp
 import requests
 
+from ..common.conditional_request import (
+    check_not_modified,
+    conditional_headers,
+    update_validators,
+)
 from ..common.main_functions import format_postal_code, waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_RD4
 
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 60.0)
+_DEFAULT_ASYNC_TIMEOUT = aiohttp.ClientTimeout(total=60.0, connect=5.0)
 
 
 def _build_url(provider: str, postal_code: str, house_number: str, suffix: str) -> str:
@@ -31,17 +39,7 @@ def _build_url(provider: str, postal_code: str, house_number: str, suffix: str)
     )
 
 
-def _fetch_waste_data_raw_temp(
-    session: requests.Session,
-    url: str,
-    *,
-    timeout: tuple[float, float],
-    verify: bool,
-) -> list[dict[str, Any]]:
-    response = session.get(url, timeout=timeout, verify=verify)
-    response.raise_for_status()
-    data = response.json() or {}
-
+def _extract_items(data: dict[str, Any]) -> list[dict[str, Any]]:
     if not data:
         return []
 
@@ -54,6 +52,35 @@ def _fetch_waste_data_raw_temp(
     return items or []
 
 
+def _fetch_waste_data_raw_temp(
+    session: requests.Session,
+    url: str,
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+    headers: dict[str, str],
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    response = session.get(url, headers=headers, timeout=timeout, verify=verify)
+    check_not_modified(response.status_code, url)
+    response.raise_for_status()
+    return _extract_items(response.json() or {}), dict(response.headers)
+
+
+async def _async_fetch_waste_data_raw_temp(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    timeout: aiohttp.ClientTimeout,
+    headers: dict[str, str],
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    async with session.get(url, headers=headers, timeout=timeout) as response:
+        check_not_modified(response.status, url)
+        response.raise_for_status()
+        data = await response.json(content_type=None)
+        return _extract_items(data or {}), dict(response.headers)
+
+
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: list[dict[str, Any]],
     postal_code: str = "",
@@ -86,18 +113,24 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    validators: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With validators, the request is conditional and NotModified is raised
+    when the schedule did not change since the previous poll.
+    """
 
     session = session or requests.Session()
     url = _build_url(provider, postal_code, house_number, suffix)
 
     try:
-        waste_data_raw_temp = _fetch_waste_data_raw_temp(
+        waste_data_raw_temp, headers = _fetch_waste_data_raw_temp(
             session,
             url,
             timeout=timeout,
             verify=verify,
+            headers=conditional_headers(validators, url),
         )
 
         if not waste_data_raw_temp:
@@ -107,6 +140,7 @@ def get_waste_data_raw(
             return []
 
         waste_data_raw = _parse_waste_data_raw(waste_data_raw_temp, postal_code)
+        update_validators(validators, url, headers)
         return waste_data_raw
 
     except requests.exceptions.RequestException as err:
@@ -115,3 +149,41 @@ def get_waste_data_raw(
     except (KeyError, TypeError, ValueError) as err:
         _LOGGER.error("RD4: Invalid and/or no data received from %s", url)
         raise ValueError(f"Invalid and/or no data received from {url}") from err
+
+
+async def async_get_waste_data_raw(
+    provider: str,
+    postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    session: aiohttp.ClientSession,
+    timeout: aiohttp.ClientTimeout = _DEFAULT_ASYNC_TIMEOUT,
+    validators: dict[str, Any] | None = None,
+) -> list[dict[str, str]]:
+    """Return waste_data_raw using the shared aiohttp session."""
+
+    url = _build_url(provider, postal_code, house_number, suffix)
+
+    try:
+        waste_data_raw_temp, headers = await _async_fetch_waste_data_raw_temp(
+            session,
+            url,
+            timeout=timeout,
+            headers=conditional_headers(validators, url),
+        )
+
+        if not waste_data_raw_temp:
+            _LOGGER.error("No waste data found or address not found!")
+            return []
+
+        waste_data_raw = _parse_waste_data_raw(waste_data_raw_temp, postal_code)
+        update_validators(validators, url, headers)
+        return waste_data_raw
+
+    except (aiohttp.ClientError, TimeoutError) as err:
+        _LOGGER.error("RD4 request error: %s", err)
+        raise ValueError(err) from err
+    except (KeyError, TypeError, ValueError) as err:
+        _LOGGER.error("RD4: Invalid and/or no data received from %s", url)
+        raise ValueError(f"Invalid and/or no data received from {url}") from err
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 from typing import Any
 
 import requests
 
+from ..common.address_cache import address_key, fetch_with_address
 from ..common.main_functions import format_postal_code, waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_RECYCLEAPP
 
 _LOGGER = logging.getLogger(__name__)
@@ -143,6 +146,22 @@ def _fetch_postcode_and_street_id(
     raise ValueError("RecycleApp: street_id not found")
 
 
+def _resolve_address(
+    session: requests.Session,
+    base_url: str,
+    postal_code: str,
+    street_name: str,
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+) -> dict[str, str]:
+    """Resolve the address to its postcode and street ids."""
+    postcode_id, street_id = _fetch_postcode_and_street_id(
+        session, base_url, postal_code, street_name, timeout=timeout, verify=verify
+    )
+    return {"postcode_id": postcode_id, "street_id": street_id}
+
+
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
     base_url: str,
@@ -177,6 +196,7 @@ def _fetch_waste_data_raw_temp(
     return response.json() or {}
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: dict[str, Any],
     postal_code: str = "",
@@ -236,8 +256,13 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With address_cache (see common.address_cache), remembered postcode and
+    street ids skip the zipcode and street lookups.
+    """
     del suffix
     del access_token
 
@@ -251,23 +276,28 @@ def get_waste_data_raw(
             _LOGGER.error("RECYCLEAPP: street_name is required")
             return []
 
-        postcode_id, street_id = _fetch_postcode_and_street_id(
-            session,
-            base_url,
-            postal_code,
-            street_name,
-            timeout=timeout,
-            verify=verify,
-        )
-
-        waste_data_raw_temp = _fetch_waste_data_raw_temp(
-            session,
-            base_url,
-            postcode_id,
-            street_id,
-            str(house_number),
-            timeout=timeout,
-            verify=verify,
+        waste_data_raw_temp = fetch_with_address(
+            address_cache,
+            address_key("recycleapp", base_url, postal_code, street_name),
+            partial(
+                _resolve_address,
+                session,
+                base_url,
+                postal_code,
+                street_name,
+                timeout=timeout,
+                verify=verify,
+            ),
+            lambda ids: _fetch_waste_data_raw_temp(
+                session,
+                base_url,
+                ids["postcode_id"],
+                ids["street_id"],
+                str(house_number),
+                timeout=timeout,
+                verify=verify,
+            ),
+            is_empty=lambda response: not response.get("items"),
         )
 
         if not waste_data_raw_temp:
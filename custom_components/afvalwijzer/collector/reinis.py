@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 import logging
 from typing import Any
 
 import requests
 
+from ..common.address_cache import address_key, fetch_with_address
+from ..common.fan_out import run_concurrently
 from ..common.main_functions import format_postal_code, waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_REINIS
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,6 +49,31 @@ def _extract_bagid(address_data: list[dict[str, Any]]) -> str | None:
     return (address_data[0] or {}).get("bagid")
 
 
+def _resolve_address(
+    session: requests.Session,
+    base_url: str,
+    corrected_postal_code: str,
+    house_number: str,
+    suffix: str,
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+) -> dict[str, str] | None:
+    """Resolve the address to {"bagid": ...}, or None if it is unknown."""
+    bagid = _extract_bagid(
+        _fetch_address_data(
+            session,
+            base_url,
+            corrected_postal_code,
+            house_number,
+            suffix,
+            timeout=timeout,
+            verify=verify,
+        )
+    )
+    return {"bagid": bagid} if bagid else None
+
+
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
     base_url: str,
@@ -61,15 +90,19 @@ def _fetch_waste_data_raw_temp(
     kalender_url = f"{base_url}/rest/adressen/{bagid}/kalender/{year}"
     afvalstromen_url = f"{base_url}/rest/adressen/{bagid}/afvalstromen"
 
-    waste_response = session.get(kalender_url, timeout=timeout, verify=verify)
-    waste_response.raise_for_status()
+    def _get_json(url: str) -> list[dict[str, Any]]:
+        response = session.get(url, timeout=timeout, verify=verify)
+        response.raise_for_status()
+        return response.json() or []
 
-    afvalstroom_response = session.get(afvalstromen_url, timeout=timeout, verify=verify)
-    afvalstroom_response.raise_for_status()
-
-    return (waste_response.json() or []), (afvalstroom_response.json() or [])
+    # The two endpoints are independent; request them side by side
+    waste_data_raw_temp, afvalstroom_data = run_concurrently(
+        partial(_get_json, kalender_url), partial(_get_json, afvalstromen_url)
+    )
+    return waste_data_raw_temp, afvalstroom_data
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: list[dict[str, Any]],
     afvalstroom_response: list[dict[str, Any]],
@@ -115,8 +148,13 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With address_cache (see common.address_cache), a remembered bagid skips
+    the address lookup.
+    """
 
     session = session or requests.Session()
     base_url = _build_base_url(provider)
@@ -124,31 +162,38 @@ def get_waste_data_raw(
     try:
         corrected_postal_code = format_postal_code(postal_code)
         suffix = suffix or ""
+        year = datetime.now().year
 
-        address_data = _fetch_address_data(
-            session,
-            base_url,
-            corrected_postal_code,
-            house_number,
-            suffix,
-            timeout=timeout,
-            verify=verify,
+        fetched = fetch_with_address(
+            address_cache,
+            address_key(
+                "reinis", base_url, corrected_postal_code, house_number, suffix
+            ),
+            partial(
+                _resolve_address,
+                session,
+                base_url,
+                corrected_postal_code,
+                house_number,
+                suffix,
+                timeout=timeout,
+                verify=verify,
+            ),
+            lambda ids: _fetch_waste_data_raw_temp(
+                session,
+                base_url,
+                ids["bagid"],
+                year,
+                timeout=timeout,
+                verify=verify,
+            ),
+            is_empty=lambda fetched: not fetched[0],
         )
-
-        bagid = _extract_bagid(address_data)
-        if not bagid:
+        if fetched is None:
             _LOGGER.error("No address found, missing bagid!")
             return []
 
-        year = datetime.now().year
-        waste_data_raw_temp, afvalstroom_response = _fetch_waste_data_raw_temp(
-            session,
-            base_url,
-            bagid,
-            year,
-            timeout=timeout,
-            verify=verify,
-        )
+        waste_data_raw_temp, afvalstroom_response = fetched
 
         waste_data_raw = _parse_waste_data_raw(
             waste_data_raw_temp, afvalstroom_response, postal_code
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 import logging
 from typing import Any
 
 import requests
 
+from ..common.address_cache import address_key, fetch_with_address
 from ..common.main_functions import waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_RWM
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +33,29 @@ def _fetch_address_data(
     return response.json() or []
 
 
+def _resolve_address(
+    session: requests.Session,
+    postal_code: str,
+    house_number: str,
+    *,
+    timeout: tuple[float, float],
+    verify: bool,
+) -> dict[str, str] | None:
+    """Resolve the address to {"bag_id": ...}, or None if it is unknown."""
+    address_data = _fetch_address_data(
+        session, postal_code, house_number, timeout=timeout, verify=verify
+    )
+    if not address_data:
+        _LOGGER.error("Address not found!")
+        return None
+
+    bag_id = address_data[0].get("bagid")
+    if not bag_id:
+        _LOGGER.error("Address found but bagid missing!")
+        return None
+    return {"bag_id": bag_id}
+
+
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
     bag_id: str,
@@ -43,6 +69,7 @@ def _fetch_waste_data_raw_temp(
     return response.json() or []
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: list[dict[str, Any]],
     postal_code: str = "",
@@ -80,8 +107,13 @@ def get_waste_data_raw(
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
     verify: bool = True,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With address_cache (see common.address_cache), a remembered bag_id skips
+    the address lookup.
+    """
 
     if provider != "rwm":
         raise ValueError(f"Invalid provider: {provider}, please verify")
@@ -89,30 +121,27 @@ def get_waste_data_raw(
     session = session or requests.Session()
 
     try:
-        address_data = _fetch_address_data(
-            session,
-            postal_code,
-            house_number,
-            timeout=timeout,
-            verify=verify,
+        waste_data_raw_temp = fetch_with_address(
+            address_cache,
+            address_key("rwm", postal_code, house_number),
+            partial(
+                _resolve_address,
+                session,
+                postal_code,
+                house_number,
+                timeout=timeout,
+                verify=verify,
+            ),
+            lambda ids: _fetch_waste_data_raw_temp(
+                session,
+                ids["bag_id"],
+                timeout=timeout,
+                verify=verify,
+            ),
         )
-
-        if not address_data:
-            _LOGGER.error("Address not found!")
+        if waste_data_raw_temp is None:
             return []
 
-        bag_id = address_data[0].get("bagid")
-        if not bag_id:
-            _LOGGER.error("Address found but bagid missing!")
-            return []
-
-        waste_data_raw_temp = _fetch_waste_data_raw_temp(
-            session,
-            bag_id,
-            timeout=timeout,
-            verify=verify,
-        )
-
         if not waste_data_raw_temp:
             _LOGGER.error("Could not retrieve trash schedule!")
             return []
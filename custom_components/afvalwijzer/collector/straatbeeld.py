@@ -9,6 +9,7 @@ from typing import Any
 import requests
 
 from ..common.main_functions import format_postal_code, waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import SENSOR_COLLECTORS_STRAATBEELD
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,6 +59,7 @@ def _fetch_waste_data_raw_temp(
     return response.json() or {}
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: dict[str, Any], postal_code: str = ""
 ) -> list[dict[str, str]]:
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import partial
 import logging
-import socket
 from typing import Any
 
 import requests
-from urllib3.util import connection as urllib3_connection
 
+from ..common.address_cache import address_key, fetch_with_address
 from ..common.main_functions import waste_type_rename
+from ..common.refresh_timings import phase
 from ..const.const import (
     SENSOR_COLLECTORS_XIMMIO,
     SENSOR_COLLECTORS_XIMMIO_IDS,
@@ -21,32 +22,6 @@ _LOGGER = logging.getLogger(__name__)
 _DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 60.0)
 
 
-def _post_ipv4_then_ipv6(
-    session: requests.Session,
-    url: str,
-    **kwargs: Any,
-) -> requests.Response:
-    """Try POST via IPv4 first; if that fails (DNS/connect), try IPv6."""
-    original_allowed = urllib3_connection.allowed_gai_family
-    last_err: BaseException | None = None
-
-    try:
-        urllib3_connection.allowed_gai_family = lambda: socket.AF_INET
-        return session.post(url=url, **kwargs)
-    except requests.exceptions.RequestException as err_v4:
-        last_err = err_v4
-    finally:
-        urllib3_connection.allowed_gai_family = original_allowed
-
-    try:
-        urllib3_connection.allowed_gai_family = lambda: socket.AF_INET6
-        return session.post(url=url, **kwargs)
-    except requests.exceptions.RequestException as err_v6:
-        raise ValueError(f"POST failed (IPv4 then IPv6): {last_err}") from err_v6
-    finally:
-        urllib3_connection.allowed_gai_family = original_allowed
-
-
 def _build_url(provider: str) -> str:
     if provider not in SENSOR_COLLECTORS_XIMMIO_IDS:
         raise ValueError(
@@ -92,9 +67,8 @@ def _fetch_address_data(
     if suffix:
         data["HouseLetter"] = suffix
 
-    response = _post_ipv4_then_ipv6(
-        session,
-        url=f"{url}/api/FetchAdress",
+    response = session.post(
+        f"{url}/api/FetchAdress",
         timeout=timeout,
         data=data,
     )
@@ -102,6 +76,40 @@ def _fetch_address_data(
     return response.json() or {}
 
 
+def _resolve_address(
+    session: requests.Session,
+    url: str,
+    provider: str,
+    postal_code: str,
+    house_number: str,
+    *,
+    suffix: str,
+    timeout: tuple[float, float],
+) -> dict[str, Any] | None:
+    """Resolve the address to its UniqueId and Community, or None."""
+    data_list = _get_data_list(
+        _fetch_address_data(
+            session,
+            url,
+            provider,
+            postal_code,
+            house_number,
+            suffix=suffix,
+            timeout=timeout,
+        )
+    )
+    if not data_list:
+        _LOGGER.error("Address not found!")
+        return None
+
+    first = data_list[0] if isinstance(data_list[0], dict) else {}
+    unique_id = first.get("UniqueId")
+    if not unique_id:
+        _LOGGER.error("Address response missing UniqueId and or Community!")
+        return None
+    return {"unique_id": unique_id, "community": first.get("Community")}
+
+
 def _fetch_waste_data_raw_temp(
     session: requests.Session,
     url: str,
@@ -123,9 +131,8 @@ def _fetch_waste_data_raw_temp(
         "uniqueAddressID": unique_id,
     }
 
-    response = _post_ipv4_then_ipv6(
-        session,
-        url=f"{url}/api/GetCalendar",
+    response = session.post(
+        f"{url}/api/GetCalendar",
         timeout=timeout,
         data=data,
     )
@@ -151,6 +158,7 @@ def _parse_ximmio_date(value: str) -> str | None:
         return None
 
 
+@phase("parse")
 def _parse_waste_data_raw(
     waste_data_raw_temp: dict[str, Any],
     postal_code: str | None = None,
@@ -187,8 +195,14 @@ def get_waste_data_raw(
     *,
     session: requests.Session | None = None,
     timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
+    address_cache: dict[str, Any] | None = None,
 ) -> list[dict[str, str]]:
-    """Return waste_data_raw."""
+    """Return waste_data_raw.
+
+    With address_cache (see common.address_cache), a remembered UniqueId and
+    Community skip the address lookup. Sessions from common.session_pool
+    race IPv4 and IPv6 to the API, see common.dual_stack.
+    """
     session = session or requests.Session()
     suffix = (suffix or "").strip().upper()
 
@@ -198,40 +212,41 @@ def get_waste_data_raw(
         now = datetime.now()
         end_date = (now.date() + timedelta(days=365)).strftime("%Y-%m-%d")
 
-        response_address = _fetch_address_data(
-            session,
-            url,
-            provider,
-            postal_code,
-            house_number,
-            suffix=suffix,
-            timeout=timeout,
+        waste_data_raw_temp = fetch_with_address(
+            address_cache,
+            address_key(
+                "ximmio",
+                url,
+                SENSOR_COLLECTORS_XIMMIO_IDS[provider],
+                postal_code,
+                house_number,
+                suffix,
+            ),
+            partial(
+                _resolve_address,
+                session,
+                url,
+                provider,
+                postal_code,
+                house_number,
+                suffix=suffix,
+                timeout=timeout,
+            ),
+            lambda ids: _fetch_waste_data_raw_temp(
+                session,
+                url,
+                provider,
+                ids["unique_id"],
+                community=ids["community"],
+                start_date=now,
+                end_date=end_date,
+                timeout=timeout,
+            ),
+            is_empty=lambda response: not _get_data_list(response),
         )
-
-        data_list = _get_data_list(response_address)
-        if not data_list:
-            _LOGGER.error("Address not found!")
-            return []
-
-        first = data_list[0] if isinstance(data_list[0], dict) else {}
-        unique_id = first.get("UniqueId")
-        community = first.get("Community")
-
-        if not unique_id:
-            _LOGGER.error("Address response missing UniqueId and or Community!")
+        if waste_data_raw_temp is None:
             return []
 
-        waste_data_raw_temp = _fetch_waste_data_raw_temp(
-            session,
-            url,
-            provider,
-            unique_id,
-            community=community,
-            start_date=now,
-            end_date=end_date,
-            timeout=timeout,
-        )
-
         if not waste_data_raw_temp:
             _LOGGER.error("Could not retrieve trash schedule!")
             return []
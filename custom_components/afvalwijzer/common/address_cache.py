@@ -0,0 +1,195 @@
+"""Persisted address resolution for two-step collectors.
+
+Many collectors first resolve the configured address to provider ids (a BAG
+id, a UniqueId/Community pair, zipcode and street ids, ...) and only then
+request the schedule. Those ids practically never change, so collectors that
+support it remember them in a small dict owned by the coordinator (and
+persisted with its cache). A steady-state refresh is then a single schedule
+request.
+
+Remembered ids expire after ADDRESS_TTL, and are dropped and resolved again
+as soon as the schedule request made with them answers 404 or comes back
+empty. Collectors remembering a link rather than ids also treat the answers
+of an expired link (401, 403, 410) as stale.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+from .refresh_timings import phase
+
+_LOGGER = logging.getLogger(__name__)
+
+ADDRESS_TTL = timedelta(days=30)
+
+HTTP_NOT_FOUND = 404
+# Answers to a remembered link (rather than an id) that expired or was rotated
+HTTP_EXPIRED_LINK = frozenset({401, 403, HTTP_NOT_FOUND, 410})
+
+
+def address_key(*parts: Hashable) -> str:
+    """Return the cache key of an address lookup made with parts."""
+    return "|".join(str(part) for part in parts)
+
+
+def cached_address(
+    cache: dict[str, Any] | None, key: str, *, now: float | None = None
+) -> dict[str, Any] | None:
+    """Return the remembered ids for key, or None if unknown or expired."""
+    if not cache:
+        return None
+
+    entry = cache.get(key) or {}
+    resolved_at = entry.get("resolved_at")
+    if not isinstance(resolved_at, (int, float)):
+        return None
+    if (now or time.time()) - resolved_at > ADDRESS_TTL.total_seconds():
+        return None
+    return dict(entry.get("ids") or {}) or None
+
+
+def has_fresh_address(cache: dict[str, Any] | None) -> bool:
+    """Return True if cache remembers ids for some key that did not expire."""
+    return any(cached_address(cache, key) is not None for key in cache or {})
+
+
+def remember_address(
+    cache: dict[str, Any] | None,
+    key: str,
+    ids: dict[str, Any],
+    *,
+    now: float | None = None,
+) -> None:
+    """Remember the ids resolved for key.
+
+    Entries for other keys are dropped; each config entry has one address.
+    """
+    if cache is None:
+        return
+    cache.clear()
+    cache[key] = {"ids": dict(ids), "resolved_at": now or time.time()}
+
+
+def forget_address(cache: dict[str, Any] | None, key: str) -> None:
+    """Drop the ids remembered for key."""
+    if cache is not None:
+        cache.pop(key, None)
+
+
+def _http_status(err: BaseException) -> int | None:
+    """Return the HTTP status of err (requests or aiohttp), if any."""
+    response = getattr(err, "response", None)
+    return getattr(response, "status_code", None) or getattr(err, "status", None)
+
+
+def is_not_found(err: BaseException) -> bool:
+    """Return True if err is an HTTP 404 (requests or aiohttp)."""
+    return _http_status(err) == HTTP_NOT_FOUND
+
+
+def is_expired_link(err: BaseException) -> bool:
+    """Return True if err shows a remembered link no longer gives access."""
+    return _http_status(err) in HTTP_EXPIRED_LINK
+
+
+def resolve_address(
+    cache: dict[str, Any] | None,
+    key: str,
+    resolve: Callable[[], dict[str, Any] | None],
+) -> dict[str, Any] | None:
+    """Return the remembered ids for key, resolving (and remembering) them if needed."""
+    ids = cached_address(cache, key)
+    if ids is None:
+        with phase("address"):
+            ids = resolve()
+        if ids:
+            remember_address(cache, key, ids)
+    return ids
+
+
+async def async_resolve_address(
+    cache: dict[str, Any] | None,
+    key: str,
+    resolve: Callable[[], Awaitable[dict[str, Any] | None]],
+) -> dict[str, Any] | None:
+    """Async counterpart of resolve_address."""
+    ids = cached_address(cache, key)
+    if ids is None:
+        with phase("address"):
+            ids = await resolve()
+        if ids:
+            remember_address(cache, key, ids)
+    return ids
+
+
+def _is_empty(result: Any) -> bool:
+    return not result
+
+
+def fetch_with_address(
+    cache: dict[str, Any] | None,
+    key: str,
+    resolve: Callable[[], dict[str, Any] | None],
+    fetch: Callable[[dict[str, Any]], Any],
+    *,
+    is_empty: Callable[[Any], bool] = _is_empty,
+    is_stale: Callable[[BaseException], bool] = is_not_found,
+) -> Any:
+    """Return fetch(ids) for the address ids resolved by resolve().
+
+    Remembered ids skip the lookup. If the schedule request made with them
+    is empty or fails with an error is_stale accepts (by default a 404),
+    they are forgotten and resolved again once.
+    Returns None when the address cannot be resolved.
+    """
+    ids = cached_address(cache, key)
+    if ids is not None:
+        try:
+            result = fetch(ids)
+        except Exception as err:
+            if not is_stale(err):
+                raise
+        else:
+            if not is_empty(result):
+                return result
+        _LOGGER.debug("Remembered address ids for %s are stale, resolving again", key)
+        forget_address(cache, key)
+
+    ids = resolve_address(cache, key, resolve)
+    if not ids:
+        return None
+    return fetch(ids)
+
+
+async def async_fetch_with_address(
+    cache: dict[str, Any] | None,
+    key: str,
+    resolve: Callable[[], Awaitable[dict[str, Any] | None]],
+    fetch: Callable[[dict[str, Any]], Awaitable[Any]],
+    *,
+    is_empty: Callable[[Any], bool] = _is_empty,
+    is_stale: Callable[[BaseException], bool] = is_not_found,
+) -> Any:
+    """Async counterpart of fetch_with_address."""
+    ids = cached_address(cache, key)
+    if ids is not None:
+        try:
+            result = await fetch(ids)
+        except Exception as err:
+            if not is_stale(err):
+                raise
+        else:
+            if not is_empty(result):
+                return result
+        _LOGGER.debug("Remembered address ids for %s are stale, resolving again", key)
+        forget_address(cache, key)
+
+    ids = await async_resolve_address(cache, key, resolve)
+    if not ids:
+        return None
+    return await fetch(ids)
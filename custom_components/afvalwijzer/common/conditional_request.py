@@ -0,0 +1,69 @@
+"""Conditional GET support (ETag / Last-Modified) for schedule endpoints.
+
+Most schedules change only a few times a year, yet they are polled every few
+hours. Collectors that support it remember the validators of the last full
+response in a small dict owned by the coordinator (and persisted with its
+cache). The next poll sends them back; a 304 answer raises NotModified so the
+coordinator can reuse the schedule it already has.
+
+Validators are stored per URL, so a URL change (e.g. the yearly iCal feed
+rolling over to the next year) never sends validators of another resource.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+HTTP_NOT_MODIFIED = 304
+
+
+class NotModified(Exception):
+    """The server reported that the schedule did not change since last poll."""
+
+
+def conditional_headers(
+    validators: Mapping[str, Any] | None, url: str
+) -> dict[str, str]:
+    """Return the If-None-Match / If-Modified-Since headers for url."""
+    if not validators:
+        return {}
+
+    stored = validators.get(url) or {}
+    headers: dict[str, str] = {}
+    if stored.get("etag"):
+        headers["If-None-Match"] = stored["etag"]
+    if stored.get("last_modified"):
+        headers["If-Modified-Since"] = stored["last_modified"]
+    return headers
+
+
+def check_not_modified(status: int, url: str) -> None:
+    """Raise NotModified when the response status is 304."""
+    if status == HTTP_NOT_MODIFIED:
+        raise NotModified(url)
+
+
+def update_validators(
+    validators: dict[str, Any] | None, url: str, headers: Mapping[str, str]
+) -> None:
+    """Remember the validators of a full response for url.
+
+    Entries for other URLs are dropped; each collector fetches one schedule.
+    """
+    if validators is None:
+        return
+
+    # Header names are case-insensitive, but collectors may pass a plain dict
+    by_name = {name.lower(): value for name, value in headers.items()}
+    stored = {
+        key: value
+        for key, value in (
+            ("etag", by_name.get("etag")),
+            ("last_modified", by_name.get("last-modified")),
+        )
+        if value
+    }
+    validators.clear()
+    if stored:
+        validators[url] = stored
@@ -0,0 +1,46 @@
+"""Per-sensor digests of the derived coordinator data.
+
+Each refresh used to rewrite every sensor's state, even when nothing but the
+last_update attribute changed. The coordinator hashes the data each sensor is
+derived from, keyed like the sensors themselves (waste type, custom sensor
+name or "notifications"), so sensors can skip writes when their key did not
+change.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+import hashlib
+from typing import Any
+
+NOTIFICATIONS_KEY = "notifications"
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(repr(value).encode()).hexdigest()
+
+
+def derived_data_digests(data: dict[str, Any], today: date) -> dict[str, str]:
+    """Return a digest per sensor key of the derived data.
+
+    today is part of every digest: the days-until and today/tomorrow flags
+    change at midnight even when the pickup dates do not.
+    """
+    with_today = data.get("waste_data_with_today") or {}
+    without_today = data.get("waste_data_without_today") or {}
+    custom = data.get("waste_data_custom") or {}
+    day = today.isoformat()
+
+    digests = {
+        key: _digest((day, with_today.get(key), without_today.get(key)))
+        for key in with_today.keys() | without_today.keys()
+    }
+    for key, value in custom.items():
+        digests[key] = _digest((day, digests.get(key), value))
+    digests[NOTIFICATIONS_KEY] = _digest(data.get("notification_data") or [])
+    return digests
+
+
+def combined_digest(digests: dict[str, str]) -> str:
+    """Return one digest over all per-key digests."""
+    return _digest(sorted(digests.items()))
@@ -0,0 +1,294 @@
+"""Happy-eyeballs style connections for hosts with a flaky address family.
+
+Some provider APIs (Ximmio) publish IPv6 addresses that do not always
+accept connections. Forcing one family used to mean swapping urllib3's
+process-wide allowed_gai_family around each request, which races between
+executor threads, and waiting for a full connect timeout before trying the
+other family.
+
+DualStackAdapter is a requests HTTPAdapter whose connections race the
+addresses of both families instead (RFC 8305 style): attempts start one
+CONNECTION_ATTEMPT_DELAY apart, alternating families, and the first socket
+to connect wins. The family that won is remembered per host, so later
+connections start with it. Nothing global is touched; the adapter is only
+used by sessions it is mounted on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+import errno
+import itertools
+import logging
+import selectors
+import socket
+import threading
+import time
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.poolmanager import PoolManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay before the next address is tried while earlier attempts are pending
+CONNECTION_ATTEMPT_DELAY = 0.25
+
+_IN_PROGRESS = (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY)
+
+_AddrInfo = tuple[Any, ...]
+
+
+def _interleave(infos: Sequence[_AddrInfo], first_family: int) -> list[_AddrInfo]:
+    """Return infos alternating between families, starting with first_family."""
+    first = [info for info in infos if info[0] == first_family]
+    other = [info for info in infos if info[0] != first_family]
+    return [
+        info
+        for pair in itertools.zip_longest(first, other)
+        for info in pair
+        if info is not None
+    ]
+
+
+def _start_attempt(
+    info: _AddrInfo,
+    source_address: tuple[str, int] | None,
+    socket_options: Iterable[tuple[int, int, Any]] | None,
+) -> tuple[socket.socket, bool]:
+    """Start a non-blocking connect; return the socket and whether it is done."""
+    family, socktype, proto, _canonname, sockaddr = info
+    sock = socket.socket(family, socktype, proto)
+    try:
+        for option in socket_options or ():
+            sock.setsockopt(*option)
+        if source_address:
+            sock.bind(source_address)
+        sock.setblocking(False)
+        err = sock.connect_ex(sockaddr)
+    except OSError:
+        sock.close()
+        raise
+    if err == 0:
+        return sock, True
+    if err in _IN_PROGRESS:
+        return sock, False
+    sock.close()
+    raise OSError(err, errno.errorcode.get(err, "connect failed"))
+
+
+def happy_eyeballs_connect(
+    address: tuple[str, int],
+    timeout: float | None,
+    *,
+    first_family: int = socket.AF_INET,
+    source_address: tuple[str, int] | None = None,
+    socket_options: Iterable[tuple[int, int, Any]] | None = None,
+    attempt_delay: float = CONNECTION_ATTEMPT_DELAY,
+) -> socket.socket:
+    """Connect to address over whichever address family answers first.
+
+    Raises TimeoutError when nothing connected within timeout, and the last
+    connect error when every address failed.
+    """
+    host, port = address
+    infos = _interleave(
+        socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM), first_family
+    )
+    if not infos:
+        raise OSError(f"getaddrinfo returned no addresses for {host}")
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending: list[socket.socket] = []
+    last_error: OSError | None = None
+    next_info = 0
+    next_start = 0.0
+    winner: socket.socket | None = None
+
+    with selectors.DefaultSelector() as selector:
+        try:
+            while winner is None:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    raise TimeoutError(f"Connection to {host}:{port} timed out")
+
+                if next_info < len(infos) and (not pending or now >= next_start):
+                    info = infos[next_info]
+                    next_info += 1
+                    next_start = now + attempt_delay
+                    try:
+                        sock, done = _start_attempt(
+                            info, source_address, socket_options
+                        )
+                    except OSError as err:
+                        last_error = err
+                        next_start = now
+                        continue
+                    if done:
+                        winner = sock
+                        break
+                    pending.append(sock)
+                    selector.register(sock, selectors.EVENT_WRITE)
+                    continue
+
+                if not pending:
+                    raise last_error or OSError(f"Could not connect to {host}")
+
+                waits = [] if deadline is None else [deadline - now]
+                if next_info < len(infos):
+                    waits.append(next_start - now)
+                for key, _events in selector.select(min(waits) if waits else None):
+                    sock = key.fileobj
+                    selector.unregister(sock)
+                    pending.remove(sock)
+                    err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if err == 0:
+                        winner = sock
+                        break
+                    sock.close()
+                    last_error = OSError(err, errno.errorcode.get(err, "failed"))
+                    # A failed attempt starts the next one right away
+                    next_start = time.monotonic()
+        finally:
+            for sock in pending:
+                if sock is not winner:
+                    sock.close()
+
+    winner.setblocking(True)
+    winner.settimeout(timeout)
+    return winner
+
+
+class AddressFamilies:
+    """Thread-safe memory of the address family that last worked per host."""
+
+    def __init__(self, default_family: int = socket.AF_INET) -> None:
+        """Start with default_family first for hosts not seen before."""
+        self._default_family = default_family
+        self._lock = threading.Lock()
+        self._families: dict[str, int] = {}
+
+    def get(self, host: str) -> int:
+        """Return the family to try first for host."""
+        with self._lock:
+            return self._families.get(host, self._default_family)
+
+    def connect(
+        self,
+        address: tuple[str, int],
+        timeout: float | None,
+        **kwargs: Any,
+    ) -> socket.socket:
+        """Connect to address, starting with (and then remembering) a family."""
+        host = address[0]
+        sock = happy_eyeballs_connect(
+            address, timeout, first_family=self.get(host), **kwargs
+        )
+        with self._lock:
+            if self._families.get(host) != sock.family:
+                _LOGGER.debug("Connected to %s over %s", host, sock.family.name)
+            self._families[host] = sock.family
+        return sock
+
+
+class _DualStackConnectionMixin:
+    """Open the socket through AddressFamilies instead of urllib3's helper."""
+
+    families: AddressFamilies | None = None
+
+    def _new_conn(self) -> socket.socket:
+        if self.families is None:
+            return super()._new_conn()
+
+        timeout = self.timeout if isinstance(self.timeout, (int, float)) else None
+        try:
+            return self.families.connect(
+                (self._dns_host, self.port),
+                timeout,
+                source_address=self.source_address,
+                socket_options=self.socket_options,
+            )
+        except TimeoutError as err:
+            raise ConnectTimeoutError(
+                self,
+                f"Connection to {self.host} timed out. (connect timeout={timeout})",
+            ) from err
+        except OSError as err:
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {err}"
+            ) from err
+
+
+class _DualStackHTTPConnection(_DualStackConnectionMixin, HTTPConnection):
+    pass
+
+
+class _DualStackHTTPSConnection(_DualStackConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _DualStackHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _DualStackHTTPConnection
+    families: AddressFamilies | None = None
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.families = self.families
+        return conn
+
+
+class _DualStackHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _DualStackHTTPSConnection
+    families: AddressFamilies | None = None
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.families = self.families
+        return conn
+
+
+class _DualStackPoolManager(PoolManager):
+    def __init__(self, *args: Any, families: AddressFamilies, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.families = families
+        self.pool_classes_by_scheme = {
+            "http": _DualStackHTTPConnectionPool,
+            "https": _DualStackHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.families = self.families
+        return pool
+
+
+class DualStackAdapter(HTTPAdapter):
+    """HTTPAdapter that races IPv4 and IPv6 and remembers the winner per host."""
+
+    def __init__(self, *, default_family: int = socket.AF_INET, **kwargs: Any) -> None:
+        """Initialize the adapter; default_family is tried first for new hosts."""
+        self.families = AddressFamilies(default_family)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        """Create the pool manager whose connections use happy eyeballs."""
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _DualStackPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            families=self.families,
+            **pool_kwargs,
+        )
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled adapter with a fresh family memory."""
+        self.families = AddressFamilies()
+        super().__setstate__(state)
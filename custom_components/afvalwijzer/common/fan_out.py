@@ -0,0 +1,113 @@
+"""Overlap the independent sub-requests of one refresh.
+
+Some refreshes make several requests that do not depend on each other (two
+Reinis endpoints, an OPZET schedule and its notifications). Sent one after
+another their latencies add up; sent together a refresh takes as long as
+the slowest of them.
+
+The requests-based collectors run in an executor thread, so the helpers
+below fan out over a small, short-lived thread pool. The first call always
+runs in the calling thread, and results and errors come back in call order,
+exactly as if the calls had been made serially. Calls that are alternatives
+(the suffix variants Amsterdam tries) go through first_accepted, which tries
+them in order with one call started ahead rather than all at once. Each
+pooled call runs in a copy of the caller's context, so the refresh being
+recorded (see common.refresh_timings) follows it. The asyncio collectors use
+asyncio.gather for the same purpose.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from typing import Any
+
+# Upper bound on concurrent sub-requests of a single refresh
+MAX_CONCURRENT_REQUESTS = 4
+
+
+def _submit_rest(
+    calls: Sequence[Callable[[], Any]], max_workers: int
+) -> tuple[ThreadPoolExecutor | None, list[Future]]:
+    """Start every call but the first in a thread pool."""
+    if len(calls) < 2:
+        return None, []
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(calls) - 1),
+        thread_name_prefix="afvalwijzer_fan_out",
+    )
+    return executor, [
+        executor.submit(contextvars.copy_context().run, call) for call in calls[1:]
+    ]
+
+
+def _run_first(call: Callable[[], Any]) -> Future:
+    """Run call in this thread, capturing its outcome in a Future."""
+    future: Future = Future()
+    try:
+        future.set_result(call())
+    except Exception as err:
+        future.set_exception(err)
+    return future
+
+
+def run_concurrently(
+    *calls: Callable[[], Any], max_workers: int = MAX_CONCURRENT_REQUESTS
+) -> list[Any]:
+    """Run calls concurrently; return their results in call order.
+
+    When calls raise, the error of the earliest one is raised, after every
+    call has finished.
+    """
+    executor, futures = _submit_rest(calls, max_workers)
+    try:
+        futures = [_run_first(calls[0]), *futures] if calls else []
+        return [future.result() for future in futures]
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def first_accepted(
+    calls: Sequence[Callable[[], Any]],
+    accept: Callable[[Any], bool],
+    *,
+    ahead: int = 1,
+) -> Any | None:
+    """Try calls in order; return the first result accepted.
+
+    Behaves like trying the calls one by one: a call that raises before an
+    accepted result re-raises, and later results are ignored. To hide some
+    of the latency, up to ahead of the following calls are already started
+    while a call is in flight; they are waited for, never left running.
+    Returns None when no result is accepted.
+    """
+    if not calls:
+        return None
+    executor = (
+        ThreadPoolExecutor(max_workers=ahead, thread_name_prefix="afvalwijzer_fan_out")
+        if ahead > 0 and len(calls) > 1
+        else None
+    )
+    started: dict[int, Future] = {}
+
+    def _start(index: int) -> None:
+        if executor is not None and index < len(calls):
+            started[index] = executor.submit(
+                contextvars.copy_context().run, calls[index]
+            )
+
+    try:
+        for index in range(1, ahead + 1):
+            _start(index)
+        for index, call in enumerate(calls):
+            future = started.pop(index, None) or _run_first(call)
+            result = future.result()
+            if accept(result):
+                return result
+            _start(index + ahead + 1)
+        return None
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
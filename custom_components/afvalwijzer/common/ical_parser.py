@@ -0,0 +1,242 @@
+"""Incremental RFC 5545 parser for iCal waste calendars.
+
+The iCal collectors used to download the whole feed as one string, split it
+into lines and only then look for events. Multi-year municipal feeds can be
+large, and lines folded by the server (a CRLF followed by a space or tab)
+were not joined back together.
+
+IcalWasteParser is fed the response body chunk by chunk, as bytes or text.
+It unfolds continuation lines, turns every complete VEVENT into a pickup as
+soon as its END line arrives, and drops pickups beyond the horizon while
+reading. It keeps at most one (logical) line and one event in memory,
+however large the feed is. Feeds are not ordered by date, so the whole body
+is still read.
+
+Recurring events (RRULE / RDATE / EXDATE) are expanded by
+common.ical_recurrence, only between since and the horizon.
+"""
+
+from __future__ import annotations
+
+import codecs
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from datetime import date, timedelta
+import logging
+from typing import Any
+
+from .ical_recurrence import iter_occurrences, parse_ical_date
+from .main_functions import waste_type_rename
+from .refresh_timings import phase
+
+_LOGGER = logging.getLogger(__name__)
+
+# Chunk size for streaming response bodies into the parser
+ICAL_CHUNK_SIZE = 64 * 1024
+
+# Pickups further ahead than this are not kept
+ICAL_HORIZON = timedelta(days=365)
+
+# Recurring events are expanded from this long ago
+ICAL_LOOKBACK = timedelta(days=365)
+
+
+def default_horizon() -> date:
+    """Return the last date the iCal collectors keep pickups for."""
+    return date.today() + ICAL_HORIZON
+
+
+def default_since() -> date:
+    """Return the first date recurring events are expanded from."""
+    return date.today() - ICAL_LOOKBACK
+
+
+class IcalWasteParser:
+    """Push parser turning iCal data into waste pickups as it arrives."""
+
+    def __init__(
+        self,
+        postal_code: str = "",
+        *,
+        horizon: date | None = None,
+        since: date | None = None,
+    ) -> None:
+        """Initialize the parser; pickups after horizon are dropped.
+
+        Recurring events are expanded from since (or their start) up to
+        horizon (or ICAL_HORIZON from today).
+        """
+        self._postal_code = postal_code
+        self._horizon = horizon.isoformat() if horizon else None
+        self._recurrence_window = (since, horizon or default_horizon())
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial_line = ""
+        self._logical_line: str | None = None
+        self._event: dict[str, Any] | None = None
+        self._nested = 0
+        self.calendar_seen = False
+
+    @phase("parse")
+    def feed(self, chunk: bytes | str) -> list[dict[str, str]]:
+        """Consume the next chunk; return the pickups it completed."""
+        text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if not text:
+            return []
+
+        lines = (self._partial_line + text).split("\n")
+        self._partial_line = lines.pop()
+        pickups: list[dict[str, str]] = []
+        for line in lines:
+            self._physical_line(line, pickups)
+        return pickups
+
+    @phase("parse")
+    def close(self) -> list[dict[str, str]]:
+        """Flush the final line; return the pickups it completed."""
+        pickups = self.feed(self._decoder.decode(b"", final=True))
+        if self._partial_line:
+            self._physical_line(self._partial_line, pickups)
+            self._partial_line = ""
+        if self._logical_line is not None:
+            self._content_line(self._logical_line, pickups)
+            self._logical_line = None
+        return pickups
+
+    def _physical_line(self, line: str, pickups: list[dict[str, str]]) -> None:
+        line = line.removesuffix("\r")
+        if line[:1] in (" ", "\t"):
+            # Folded continuation of the previous line
+            if self._logical_line is not None:
+                self._logical_line += line[1:]
+            return
+
+        if self._logical_line is not None:
+            self._content_line(self._logical_line, pickups)
+        self._logical_line = line
+
+    def _content_line(self, line: str, pickups: list[dict[str, str]]) -> None:
+        name_and_params, sep, value = line.partition(":")
+        if not sep:
+            return
+
+        field = name_and_params.split(";", 1)[0].strip().upper()
+        value = value.strip()
+
+        if field == "BEGIN":
+            self._begin(value.upper())
+        elif field == "END":
+            self._end(value.upper(), pickups)
+        elif self._event is not None and not self._nested:
+            self._property(field, value)
+
+    def _begin(self, component: str) -> None:
+        if component == "VCALENDAR":
+            self.calendar_seen = True
+        elif self._event is not None:
+            # Properties of e.g. a VALARM do not belong to the event
+            self._nested += 1
+        elif component == "VEVENT":
+            self._event = {}
+
+    def _end(self, component: str, pickups: list[dict[str, str]]) -> None:
+        if self._event is None:
+            return
+        if self._nested:
+            self._nested -= 1
+            return
+        if component != "VEVENT":
+            return
+
+        event, self._event = self._event, None
+        if "date" not in event or "type" not in event:
+            _LOGGER.warning("Incomplete iCal event data encountered: %s", event)
+            return
+        if "rrule" in event or "rdate" in event:
+            self._expand(event, pickups)
+            return
+        if self._horizon and event["date"] > self._horizon:
+            return
+        pickups.append({"type": event["type"], "date": event["date"]})
+
+    def _expand(self, event: dict[str, Any], pickups: list[dict[str, str]]) -> None:
+        since, until = self._recurrence_window
+        pickups.extend(
+            {"type": event["type"], "date": day.isoformat()}
+            for day in iter_occurrences(
+                date.fromisoformat(event["date"]),
+                event.get("rrule"),
+                rdates=event.get("rdate", ()),
+                exdates=event.get("exdate", ()),
+                since=since,
+                until=until,
+            )
+        )
+
+    def _property(self, field: str, value: str) -> None:
+        if field == "SUMMARY":
+            self._event["type"] = waste_type_rename(value.lower(), self._postal_code)
+        elif field == "DTSTART":
+            parsed = parse_ical_date(value)
+            if parsed is None:
+                _LOGGER.warning("Unsupported waste_date format: %s", value)
+            else:
+                self._event["date"] = parsed.isoformat()
+        elif field == "RRULE":
+            self._event["rrule"] = value
+        elif field in ("RDATE", "EXDATE"):
+            # Comma-separated, and the property may occur more than once
+            dates = self._event.setdefault(field.lower(), [])
+            dates.extend(
+                day for day in map(parse_ical_date, value.split(",")) if day is not None
+            )
+
+
+def iter_ical_waste_data(
+    chunks: Iterable[bytes | str],
+    postal_code: str = "",
+    *,
+    horizon: date | None = None,
+    since: date | None = None,
+) -> Iterator[dict[str, str]]:
+    """Yield the pickups of an iCal feed given as an iterable of chunks."""
+    parser = IcalWasteParser(postal_code, horizon=horizon, since=since)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def async_iter_ical_waste_data(
+    chunks: AsyncIterable[bytes],
+    postal_code: str = "",
+    *,
+    horizon: date | None = None,
+    since: date | None = None,
+) -> AsyncIterator[dict[str, str]]:
+    """Async counterpart of iter_ical_waste_data, for aiohttp bodies."""
+    parser = IcalWasteParser(postal_code, horizon=horizon, since=since)
+    async for chunk in chunks:
+        for pickup in parser.feed(chunk):
+            yield pickup
+    for pickup in parser.close():
+        yield pickup
+
+
+def parse_ical_waste_data(
+    ical_text: str, postal_code: str = ""
+) -> list[dict[str, str]]:
+    """Parse VEVENT blocks from raw iCal text into a list of waste data dicts.
+
+    Each returned dict contains ``"date"`` (``"YYYY-MM-DD"``) and ``"type"``
+    (a normalised waste type key via :func:`waste_type_rename`).
+
+    Args:
+        ical_text: Raw iCal content as a string.
+        postal_code: Optional postal code forwarded to :func:`waste_type_rename`
+            for postal-code-specific overrides.
+
+    Returns:
+        A list of ``{"date": ..., "type": ...}`` dicts for complete events.
+
+    """
+    if not ical_text:
+        return []
+    return list(iter_ical_waste_data([ical_text], postal_code))
@@ -0,0 +1,247 @@
+"""Lazy RRULE / RDATE / EXDATE expansion for iCal waste calendars.
+
+Some feeds publish one recurring VEVENT per waste type ("every other
+Tuesday") instead of a VEVENT per pickup. iter_occurrences turns such an
+event into its pickup dates, one at a time and in date order, and stops at
+the end of the window asked for, so an open-ended rule never expands beyond
+what the sensors and the calendar use.
+
+Only whole dates matter for pickups. Supported rule parts are FREQ (DAILY,
+WEEKLY, MONTHLY, YEARLY), INTERVAL, COUNT, UNTIL, BYDAY (with an ordinal in
+MONTHLY and YEARLY rules), BYMONTHDAY, BYMONTH and WKST. A rule using other
+parts is not guessed at: the event then only occurs on its DTSTART (plus
+any RDATEs).
+"""
+
+from __future__ import annotations
+
+import calendar
+from collections.abc import Iterable, Iterator
+from datetime import date, timedelta
+import heapq
+import logging
+import re
+
+_LOGGER = logging.getLogger(__name__)
+
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+_SUPPORTED_FREQS = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+_SUPPORTED_PARTS = frozenset(
+    {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "BYMONTHDAY", "BYMONTH", "WKST"}
+)
+_BYDAY_PATTERN = re.compile(r"^([+-]?\d{1,2})?(MO|TU|WE|TH|FR|SA|SU)$")
+
+# Integer rule parts, with a check on their values where they are bounded
+_INT_PARTS = {
+    "INTERVAL": None,
+    "COUNT": None,
+    "BYMONTHDAY": lambda number: 1 <= abs(number) <= 31,
+    "BYMONTH": lambda number: 1 <= number <= 12,
+}
+
+_ByDay = list[tuple[int | None, int]]
+
+
+def parse_ical_date(value: str) -> date | None:
+    """Return the date of an iCal DATE or DATE-TIME value."""
+    value = value.strip()
+    if len(value) < 8 or not value[:8].isdigit():
+        return None
+    try:
+        return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    except ValueError:
+        return None
+
+
+def parse_rrule(value: str) -> dict[str, str] | None:
+    """Return the parts of an RRULE value, or None if it cannot be expanded."""
+    parts = {
+        name.strip().upper(): part.strip().upper()
+        for name, sep, part in (item.partition("=") for item in value.split(";"))
+        if sep
+    }
+    unsupported = set(parts) - _SUPPORTED_PARTS
+    for name, valid in _INT_PARTS.items():
+        try:
+            numbers = _ints(parts.get(name))
+        except ValueError:
+            unsupported.add(name)
+            continue
+        if valid is not None and not all(map(valid, numbers)):
+            unsupported.add(name)
+    try:
+        _parse_byday(parts.get("BYDAY", ""))
+    except ValueError:
+        unsupported.add("BYDAY")
+    if parts.get("FREQ") not in _SUPPORTED_FREQS or unsupported:
+        _LOGGER.warning("Unsupported iCal recurrence rule: %s", value)
+        return None
+    return parts
+
+
+def _parse_byday(value: str) -> _ByDay:
+    """Return the (ordinal, weekday) pairs of a BYDAY value.
+
+    Raises ValueError on a token that is not a (numbered) weekday.
+    """
+    byday: _ByDay = []
+    for item in filter(None, (item.strip() for item in value.split(","))):
+        match = _BYDAY_PATTERN.match(item)
+        ordinal = int(match.group(1)) if match and match.group(1) else None
+        if match is None or (ordinal is not None and not 1 <= abs(ordinal) <= 53):
+            raise ValueError(f"Invalid BYDAY value: {item}")
+        byday.append((ordinal, WEEKDAYS[match.group(2)]))
+    return byday
+
+
+def _ints(value: str | None) -> list[int]:
+    return [int(item) for item in (value or "").split(",") if item.strip()]
+
+
+def _add_months(year: int, month: int, months: int) -> tuple[int, int]:
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+def _month_days(year: int, month: int, monthdays: list[int]) -> list[date]:
+    """Return the (possibly negative) BYMONTHDAY days that exist in the month."""
+    length = calendar.monthrange(year, month)[1]
+    days = {day if day > 0 else length + day + 1 for day in monthdays}
+    return [date(year, month, day) for day in sorted(days) if 1 <= day <= length]
+
+
+def _weekdays(first: date, last: date, byday: _ByDay) -> list[date]:
+    """Return the BYDAY dates from first to last (inclusive).
+
+    An ordinal picks the n-th (or n-th last) such weekday in the range.
+    """
+    found: set[date] = set()
+    for ordinal, weekday in byday:
+        day = first + timedelta(days=(weekday - first.weekday()) % 7)
+        matches: list[date] = []
+        while day <= last:
+            matches.append(day)
+            day += timedelta(weeks=1)
+        if ordinal is None:
+            found.update(matches)
+        elif 0 < abs(ordinal) <= len(matches):
+            found.add(matches[ordinal - 1 if ordinal > 0 else ordinal])
+    return sorted(found)
+
+
+def _month_candidates(
+    year: int, month: int, dtstart: date, byday: _ByDay, monthdays: list[int]
+) -> list[date]:
+    if monthdays:
+        days = _month_days(year, month, monthdays)
+        if byday:
+            weekdays = {weekday for _ordinal, weekday in byday}
+            days = [day for day in days if day.weekday() in weekdays]
+        return days
+    if byday:
+        last_day = calendar.monthrange(year, month)[1]
+        return _weekdays(date(year, month, 1), date(year, month, last_day), byday)
+    return _month_days(year, month, [dtstart.day])
+
+
+def _period_candidates(
+    freq: str, index: int, interval: int, dtstart: date, rule: dict[str, str]
+) -> tuple[date, list[date]]:
+    """Return the first day of the index-th period and the dates in it."""
+    byday = _parse_byday(rule.get("BYDAY", ""))
+    monthdays = _ints(rule.get("BYMONTHDAY"))
+    months = sorted(_ints(rule.get("BYMONTH")))
+
+    if freq == "DAILY":
+        day = dtstart + timedelta(days=index * interval)
+        weekdays = {weekday for _ordinal, weekday in byday}
+        keep = (not weekdays or day.weekday() in weekdays) and (
+            not monthdays or day in _month_days(day.year, day.month, monthdays)
+        )
+        candidates, first = ([day] if keep else []), day
+    elif freq == "WEEKLY":
+        week_start = WEEKDAYS.get(rule.get("WKST", "MO"), 0)
+        first = dtstart - timedelta(days=(dtstart.weekday() - week_start) % 7)
+        first += timedelta(weeks=index * interval)
+        weekdays = sorted({weekday for _ordinal, weekday in byday}) or [
+            dtstart.weekday()
+        ]
+        candidates = sorted(
+            first + timedelta(days=(weekday - first.weekday()) % 7)
+            for weekday in weekdays
+        )
+    elif freq == "MONTHLY":
+        year, month = _add_months(dtstart.year, dtstart.month, index * interval)
+        first = date(year, month, 1)
+        candidates = _month_candidates(year, month, dtstart, byday, monthdays)
+    else:  # YEARLY
+        year = dtstart.year + index * interval
+        first = date(year, 1, 1)
+        if byday and not months and not monthdays:
+            candidates = _weekdays(first, date(year, 12, 31), byday)
+        else:
+            # BYMONTHDAY without BYMONTH applies to every month
+            default_months = range(1, 13) if monthdays else [dtstart.month]
+            candidates = [
+                day
+                for month in months or default_months
+                for day in _month_candidates(year, month, dtstart, byday, monthdays)
+            ]
+
+    if months:
+        candidates = [day for day in candidates if day.month in months]
+    return first, candidates
+
+
+def _iter_rule(dtstart: date, rule: dict[str, str], until: date) -> Iterator[date]:
+    """Yield the dates of rule from dtstart on, up to until."""
+    freq = rule["FREQ"]
+    interval = max(int(rule.get("INTERVAL") or 1), 1)
+    count = int(rule["COUNT"]) if rule.get("COUNT") else None
+    rule_until = parse_ical_date(rule.get("UNTIL", ""))
+    last = min(until, rule_until) if rule_until else until
+
+    emitted = 0
+    index = 0
+    while True:
+        first, candidates = _period_candidates(freq, index, interval, dtstart, rule)
+        if first > last:
+            return
+        for day in candidates:
+            if day < dtstart:
+                continue
+            if day > last or (count is not None and emitted >= count):
+                return
+            emitted += 1
+            yield day
+        index += 1
+
+
+def iter_occurrences(
+    dtstart: date,
+    rrule: str | None = None,
+    *,
+    rdates: Iterable[date] = (),
+    exdates: Iterable[date] = (),
+    since: date | None = None,
+    until: date,
+) -> Iterator[date]:
+    """Yield the dates an event occurs on from since to until, in order.
+
+    COUNT is still counted from dtstart, so occurrences before since are
+    generated (cheaply) but not yielded.
+    """
+    rule = parse_rrule(rrule) if rrule else None
+    rule_dates = _iter_rule(dtstart, rule, until) if rule else iter([dtstart])
+    excluded = set(exdates)
+
+    previous = None
+    for day in heapq.merge(rule_dates, sorted(rdates)):
+        if day > until:
+            return
+        if day == previous or day in excluded:
+            continue
+        previous = day
+        if since is None or day >= since:
+            yield day
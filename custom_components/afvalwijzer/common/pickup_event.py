@@ -0,0 +1,112 @@
+"""Compact, immutable pickup events used from the collectors onwards.
+
+Collectors return their schedule as {"type": ..., "date": ...} dicts, with
+the date as a "%Y-%m-%d" string (or, for a schedule read back from an older
+cache, a datetime or ISO timestamp). Every later stage used to re-strip and
+re-lowercase the type and re-parse the date of each item.
+
+pickup_events() turns such a schedule into PickupEvents once, where it
+enters MainCollector. A PickupEvent holds its waste type as a normalized,
+interned string, so the few distinct names are shared by all pickups, and
+its date as a proleptic Gregorian ordinal, which sorts, compares and hashes
+as a plain int. With __slots__ an event takes a fraction of the memory of
+the dict it replaces.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime
+import logging
+import sys
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Collectors use this type for entries that are not pickups
+IGNORED_TYPE = "ignore"
+
+
+class PickupEvent:
+    """A waste type picked up on a day."""
+
+    __slots__ = ("ordinal", "type")
+
+    def __init__(self, waste_type: str, ordinal: int) -> None:
+        """Initialize from a normalized waste type and a date ordinal."""
+        object.__setattr__(self, "type", sys.intern(waste_type))
+        object.__setattr__(self, "ordinal", ordinal)
+
+    @classmethod
+    def on(cls, waste_type: str, day: date) -> PickupEvent:
+        """Return the pickup of waste_type on day."""
+        return cls(waste_type, day.toordinal())
+
+    @property
+    def date(self) -> date:
+        """Return the pickup date."""
+        return date.fromordinal(self.ordinal)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Refuse changes; events are shared between coordinator and cache."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Refuse deletes, see __setattr__."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        """Return True for a pickup of the same type on the same day."""
+        if not isinstance(other, PickupEvent):
+            return NotImplemented
+        return self.ordinal == other.ordinal and self.type == other.type
+
+    def __hash__(self) -> int:
+        """Return a hash consistent with __eq__."""
+        return hash((self.type, self.ordinal))
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"PickupEvent({self.type!r}, {self.date.isoformat()})"
+
+
+def _date_ordinal(value: Any) -> int | None:
+    """Return the date ordinal of a raw schedule date, or None if unusable."""
+    if isinstance(value, datetime):
+        return value.toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    try:
+        return date.fromisoformat(str(value)[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+def pickup_events(waste_data_raw: Iterable[Any] | None) -> list[PickupEvent]:
+    """Return the PickupEvents of a raw schedule.
+
+    Items that already are PickupEvents are kept as they are. Ignored types
+    and items without a type or a usable date are dropped.
+    """
+    events: list[PickupEvent] = []
+    ordinals: dict[Any, int | None] = {}
+    for item in waste_data_raw or ():
+        if isinstance(item, PickupEvent):
+            events.append(item)
+            continue
+
+        waste_type = str(item.get("type") or "").strip().lower()
+        if not waste_type or waste_type == IGNORED_TYPE:
+            continue
+
+        raw_date = item.get("date")
+        # A schedule repeats each date for every type picked up on it
+        if raw_date in ordinals:
+            ordinal = ordinals[raw_date]
+        else:
+            ordinal = ordinals[raw_date] = _date_ordinal(raw_date)
+        if ordinal is None:
+            _LOGGER.warning("Unsupported waste date: %s", raw_date)
+            continue
+        events.append(PickupEvent(waste_type, ordinal))
+    return events
@@ -0,0 +1,122 @@
+"""Choose the next poll time per entry from the schedule it already has.
+
+Pickup schedules are published months ahead and rarely change, so polling
+every few hours is mostly wasted. The interval is picked from:
+
+- change history: right after the provider changed the schedule (detected by
+  hashing it) more edits are likely, so poll often; the longer it has stayed
+  the same, the less often we poll.
+- imminent pickup: one poll happens as each pickup day comes within
+  IMMINENT_PICKUP, so last-minute changes (holidays, rescheduled routes) are
+  still caught; after it the interval follows the change history again.
+- horizon: when the schedule is about to run out (e.g. next year not yet
+  published) poll more often to pick up the new one.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+import hashlib
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .pickup_event import PickupEvent
+
+# Shortest interval; also used while the schedule is changing
+MIN_INTERVAL = timedelta(hours=4)
+# Interval once the schedule has been stable for a while
+STABLE_INTERVAL = timedelta(hours=24)
+# Interval once the schedule has been unchanged for a long time
+MAX_INTERVAL = timedelta(hours=48)
+
+# A change this recent means the provider may still be editing the schedule
+RECENT_CHANGE = timedelta(days=2)
+# Unchanged for this long, the schedule is considered settled
+SETTLED_AFTER = timedelta(days=30)
+# Poll once as the next pickup day comes this close
+IMMINENT_PICKUP = timedelta(hours=36)
+# A window opening this soon counts as open, so a poll that fires a little
+# early does not schedule another one right behind it
+WINDOW_SLACK = timedelta(minutes=5)
+# A schedule reaching less far ahead than this is about to run out
+SHORT_HORIZON = timedelta(days=14)
+SHORT_HORIZON_INTERVAL = timedelta(hours=12)
+
+
+def schedule_digest(waste_data_raw: list[PickupEvent]) -> str:
+    """Return a stable hash of a schedule, independent of item order."""
+    # ISO dates keep the digests saved by earlier versions comparable
+    parts = sorted(f"{event.type}|{event.date.isoformat()}" for event in waste_data_raw)
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class RefreshScheduler:
+    """Track schedule changes for one entry and pick the next poll interval."""
+
+    def __init__(self) -> None:
+        """Initialize without change history."""
+        self.digest: str | None = None
+        self.changed_at: datetime | None = None
+
+    def restore(self, state: dict[str, Any] | None) -> None:
+        """Restore the change history saved by as_dict()."""
+        if not state:
+            return
+        self.digest = state.get("digest")
+        self.changed_at = dt_util.parse_datetime(str(state.get("changed_at", "")))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the change history in a JSON serializable form."""
+        return {
+            "digest": self.digest,
+            "changed_at": self.changed_at.isoformat() if self.changed_at else None,
+        }
+
+    def record(self, waste_data_raw: list[PickupEvent], now: datetime) -> bool:
+        """Record a fetched schedule; return True when it differs from the last."""
+        digest = schedule_digest(waste_data_raw)
+        if digest == self.digest:
+            return False
+        self.digest = digest
+        self.changed_at = now
+        return True
+
+    def next_interval(
+        self, waste_data_raw: list[PickupEvent], now: datetime
+    ) -> timedelta:
+        """Return the time until the next poll for the given schedule."""
+        if not waste_data_raw:
+            return MIN_INTERVAL
+
+        unchanged_for = now - (self.changed_at or now)
+        if unchanged_for < RECENT_CHANGE:
+            interval = MIN_INTERVAL
+        elif unchanged_for < SETTLED_AFTER:
+            interval = STABLE_INTERVAL
+        else:
+            interval = MAX_INTERVAL
+
+        today = dt_util.as_local(now).date().toordinal()
+        upcoming = [event.ordinal for event in waste_data_raw if event.ordinal >= today]
+
+        if not upcoming or self._until(max(upcoming), now) < SHORT_HORIZON:
+            interval = min(interval, SHORT_HORIZON_INTERVAL)
+
+        # One poll as each pickup day becomes imminent; a pickup day whose
+        # window already opened had that poll, so it is not polled for again
+        opening = (
+            self._until(ordinal, now) - IMMINENT_PICKUP for ordinal in set(upcoming)
+        )
+        next_window = min(
+            (wait for wait in opening if wait > WINDOW_SLACK), default=None
+        )
+        if next_window is not None:
+            interval = min(interval, next_window)
+
+        return max(interval, MIN_INTERVAL)
+
+    @staticmethod
+    def _until(ordinal: int, now: datetime) -> timedelta:
+        """Return the time from now until the start of the pickup day."""
+        return dt_util.start_of_local_day(date.fromordinal(ordinal)) - now
@@ -0,0 +1,322 @@
+"""Per-phase timings of coordinator refreshes, for diagnostics.
+
+Each refresh is recorded as a RefreshTimings:
+- how long it spent in each phase: resolving the address, logging in,
+  fetching the schedule and the notifications, parsing, transforming and
+  writing the cache;
+- how many requests it made;
+- how many response bytes it received.
+
+The coordinator activates a recording for every refresh (see recording).
+Collectors mark their phases with phase(), and their sessions are counted
+by track_session and TrackedClientSession. Nothing has to be passed
+around, because the recording lives in a ContextVar. Asyncio tasks inherit
+it, and common.fan_out hands it to its threads.
+
+Phases nest: a schedule fetch may resolve the address, log in and parse.
+Each phase is charged its self time only, so the phases of a serial
+refresh add up to its duration. Phases that run concurrently, such as a
+schedule and its notifications, overlap, so their times add up to more.
+
+A TimingsWindow keeps the last WINDOW_SIZE recordings and summarizes them
+as p50 and p95 for the diagnostics download and the diagnostic sensors.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import math
+import threading
+import time
+from typing import Any
+
+import aiohttp
+import requests
+
+# The phases of a refresh, in the order they normally happen
+PHASES = (
+    "address",
+    "auth",
+    "schedule",
+    "notifications",
+    "parse",
+    "transform",
+    "cache_save",
+)
+
+# Refreshes summarized by a TimingsWindow; a few days at the usual interval
+WINDOW_SIZE = 50
+
+
+class RefreshTimings:
+    """Phase times, requests and response bytes of one refresh.
+
+    Thread-safe: the concurrent sub-requests of a refresh add to it from
+    their own threads.
+    """
+
+    def __init__(self) -> None:
+        """Start timing a refresh."""
+        self.started_at = datetime.now(UTC)
+        self._start = time.perf_counter()
+        # None while the refresh is running
+        self.duration: float | None = None
+        self.success: bool | None = None
+        self.phases: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.requests = 0
+        self.response_bytes = 0
+        self._lock = threading.Lock()
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """Charge seconds to phase name."""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_response(self, size: int | None) -> None:
+        """Count a response of size bytes (None when unknown)."""
+        with self._lock:
+            self.requests += 1
+            self.response_bytes += size or 0
+
+    def finish(self, *, success: bool) -> None:
+        """Stop timing the refresh."""
+        self.duration = time.perf_counter() - self._start
+        self.success = success
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the recording with times in milliseconds."""
+        with self._lock:
+            phases = dict(self.phases)
+        return {
+            "started_at": self.started_at.isoformat(),
+            "success": self.success,
+            "duration_ms": _ms(self.duration),
+            "phases_ms": {name: _ms(seconds) for name, seconds in phases.items()},
+            "requests": self.requests,
+            "response_bytes": self.response_bytes,
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+@dataclass(slots=True)
+class _Frame:
+    """A running phase and the time spent in the phases nested in it."""
+
+    timings: RefreshTimings
+    child_time: float = 0.0
+
+
+_RECORDING: ContextVar[RefreshTimings | None] = ContextVar(
+    "afvalwijzer_refresh_timings", default=None
+)
+_FRAME: ContextVar[_Frame | None] = ContextVar(
+    "afvalwijzer_refresh_phase", default=None
+)
+# Guards child_time, which phases in fan_out threads add to
+_FRAME_LOCK = threading.Lock()
+
+
+def current_timings() -> RefreshTimings | None:
+    """Return the refresh being recorded in this context, if any."""
+    return _RECORDING.get()
+
+
+@contextmanager
+def recording(timings: RefreshTimings | None) -> Iterator[RefreshTimings | None]:
+    """Record the phases and requests of the block into timings.
+
+    With None, nothing in the block is recorded.
+    """
+    token = _RECORDING.set(timings)
+    frame_token = _FRAME.set(None)
+    try:
+        yield timings
+    finally:
+        _FRAME.reset(frame_token)
+        _RECORDING.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Charge the time spent in the block to phase name of the current refresh.
+
+    Also works as a decorator of plain functions. Outside a recording it
+    does nothing.
+    """
+    timings = _RECORDING.get()
+    if timings is None:
+        yield
+        return
+
+    parent = _FRAME.get()
+    frame = _Frame(timings)
+    token = _FRAME.set(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _FRAME.reset(token)
+        # Nested phases running in other threads can overlap each other
+        timings.add_phase(name, max(elapsed - frame.child_time, 0.0))
+        if parent is not None and parent.timings is timings:
+            with _FRAME_LOCK:
+                parent.child_time += elapsed
+
+
+def _content_length(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _count_response(
+    response: requests.Response, *, stream: bool = False, **kwargs: Any
+) -> None:
+    """Response hook adding response to the current recording."""
+    timings = _RECORDING.get()
+    if timings is None:
+        return
+    size = _content_length(response.headers.get("Content-Length"))
+    if size is None and not stream:
+        # Without stream=True requests reads the body right after the hooks
+        size = len(response.content)
+    timings.add_response(size)
+
+
+def track_session(session: requests.Session) -> requests.Session:
+    """Count the responses session receives while a refresh is recorded.
+
+    Adds a response hook, once; sessions shared between refreshes keep it.
+    """
+    hooks = session.hooks.setdefault("response", [])
+    if _count_response not in hooks:
+        hooks.append(_count_response)
+    return session
+
+
+class _TrackedRequest:
+    """An aiohttp request counting its response when it arrives."""
+
+    def __init__(self, request: Any) -> None:
+        self._request = request
+
+    def __await__(self):
+        return self._send().__await__()
+
+    async def _send(self) -> aiohttp.ClientResponse:
+        response = await self._request
+        self._count(response)
+        return response
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        response = await self._request.__aenter__()
+        self._count(response)
+        return response
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self._request.__aexit__(*exc_info)
+
+    @staticmethod
+    def _count(response: aiohttp.ClientResponse) -> None:
+        timings = _RECORDING.get()
+        if timings is not None:
+            # Unknown for chunked bodies, such as most iCal feeds
+            timings.add_response(response.content_length)
+
+
+class TrackedClientSession:
+    """An aiohttp ClientSession counting the responses of a recorded refresh.
+
+    Wraps Home Assistant's shared session, which cannot be given trace
+    configs of its own; everything but get, post and request is passed on.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        """Wrap session."""
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass everything else on to the wrapped session."""
+        return getattr(self._session, name)
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> _TrackedRequest:
+        """Send a request through the wrapped session."""
+        return _TrackedRequest(self._session.request(method, url, **kwargs))
+
+    def get(self, url: Any, **kwargs: Any) -> _TrackedRequest:
+        """Send a GET request through the wrapped session."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> _TrackedRequest:
+        """Send a POST request through the wrapped session."""
+        return self.request("POST", url, **kwargs)
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """Return the q-th percentile (nearest rank) of values, None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def _spread(values: list[float]) -> dict[str, float | None]:
+    return {"p50": percentile(values, 50), "p95": percentile(values, 95)}
+
+
+class TimingsWindow:
+    """The recordings of the last refreshes of one config entry."""
+
+    def __init__(self, size: int = WINDOW_SIZE) -> None:
+        """Initialize an empty window of size refreshes."""
+        self._timings: deque[RefreshTimings] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of refreshes in the window."""
+        return len(self._timings)
+
+    def add(self, timings: RefreshTimings) -> None:
+        """Add a finished refresh, dropping the oldest when full."""
+        self._timings.append(timings)
+
+    @property
+    def last(self) -> RefreshTimings | None:
+        """Return the last refresh, if any."""
+        return self._timings[-1] if self._timings else None
+
+    def summary(self) -> dict[str, Any]:
+        """Return p50 and p95 of the window, plus the last refresh.
+
+        Times are in milliseconds. Failed refreshes count towards the
+        percentiles too: a timeout is exactly what they should show.
+        """
+        recorded = [timings.as_dict() for timings in self._timings]
+        return {
+            "refreshes": len(recorded),
+            "failures": sum(1 for item in recorded if item["success"] is False),
+            "duration_ms": _spread(
+                [
+                    item["duration_ms"]
+                    for item in recorded
+                    if item["duration_ms"] is not None
+                ]
+            ),
+            "phases_ms": {
+                name: _spread([item["phases_ms"].get(name, 0.0) for item in recorded])
+                for name in PHASES
+            },
+            "requests": _spread([item["requests"] for item in recorded]),
+            "response_bytes": _spread([item["response_bytes"] for item in recorded]),
+            "last": recorded[-1] if recorded else None,
+        }
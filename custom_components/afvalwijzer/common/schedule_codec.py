@@ -0,0 +1,49 @@
+"""Compact, columnar encoding of a pickup schedule for the coordinator cache.
+
+A schedule is a long list of PickupEvents in which a handful of waste types
+repeat. Stored as JSON dicts with ISO timestamps every item would repeat both
+keys, the type name and a 19 character date string. The encoding below keeps
+each type name once and stores every pickup as two small integers: an index
+into the type table and the proleptic Gregorian ordinal of its date.
+
+    {"types": ["gft", "papier"], "type_index": [0, 1, 0], "dates": [...]}
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .pickup_event import PickupEvent
+
+
+def encode_schedule(waste_data_raw: Iterable[PickupEvent]) -> dict[str, list]:
+    """Return the columnar form of a schedule."""
+    types: list[str] = []
+    index_of: dict[str, int] = {}
+    type_index: list[int] = []
+    dates: list[int] = []
+
+    for event in waste_data_raw:
+        index = index_of.get(event.type)
+        if index is None:
+            index = index_of[event.type] = len(types)
+            types.append(event.type)
+        type_index.append(index)
+        dates.append(event.ordinal)
+
+    return {"types": types, "type_index": type_index, "dates": dates}
+
+
+def decode_schedule(encoded: dict[str, list]) -> list[PickupEvent]:
+    """Return the PickupEvents of an encoded schedule.
+
+    The columns already hold what a PickupEvent is made of, so nothing has to
+    be parsed again.
+    """
+    types = encoded.get("types") or []
+    return [
+        PickupEvent(types[index], ordinal)
+        for index, ordinal in zip(
+            encoded.get("type_index") or [], encoded.get("dates") or [], strict=True
+        )
+    ]
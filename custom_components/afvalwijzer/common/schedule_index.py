@@ -0,0 +1,156 @@
+"""Immutable, date-sorted index of the pickup schedule for calendar queries.
+
+The coordinator builds one index per data update. Calendar entities then
+answer range queries and "next pickup" lookups by bisecting sorted ordinal
+date arrays (combined and per waste type) instead of walking, filtering and
+re-parsing the whole schedule on every access.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime
+import logging
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .pickup_event import PickupEvent, pickup_events
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _to_date(value: Any) -> date | None:
+    """Coerce a waste data value (str, datetime or date) into a date.
+
+    Cached next-per-type data may hold datetimes as ISO strings (e.g.
+    "2026-07-22T00:00:00"), so plain dates and full timestamps must
+    both be accepted.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        parsed_dt = dt_util.parse_datetime(value)
+        if parsed_dt is not None:
+            return parsed_dt.date()
+        return dt_util.parse_date(value)
+    return None
+
+
+class _Column:
+    """Sorted ordinal dates with the waste type picked up on each."""
+
+    __slots__ = ("ordinals", "types")
+
+    def __init__(self, pairs: list[tuple[int, str]]) -> None:
+        self.ordinals = tuple(ordinal for ordinal, _ in pairs)
+        self.types = tuple(waste_type for _, waste_type in pairs)
+
+    def span(self, first: int, last: int) -> range:
+        """Return the positions of the pickups from first to last (inclusive)."""
+        return range(
+            bisect_left(self.ordinals, first), bisect_right(self.ordinals, last)
+        )
+
+
+class ScheduleIndex:
+    """Pickups sorted by date, combined and per waste type."""
+
+    __slots__ = ("_by_type", "_combined")
+
+    def __init__(self, schedule: Iterable[tuple[str, date]]) -> None:
+        """Index (waste_type, date) pairs."""
+        self._build((pickup.toordinal(), waste_type) for waste_type, pickup in schedule)
+
+    @classmethod
+    def from_events(cls, events: Iterable[PickupEvent]) -> ScheduleIndex:
+        """Index PickupEvents; their dates already are ordinals."""
+        index = cls.__new__(cls)
+        index._build((event.ordinal, event.type) for event in events)
+        return index
+
+    def _build(self, ordinal_pairs: Iterable[tuple[int, str]]) -> None:
+        # Stable sort: types on the same date keep their schedule order
+        pairs = sorted(ordinal_pairs, key=lambda pair: pair[0])
+        grouped: dict[str, list[tuple[int, str]]] = {}
+        for pair in pairs:
+            grouped.setdefault(pair[1].strip().lower(), []).append(pair)
+
+        self._combined = _Column(pairs)
+        self._by_type = {key: _Column(items) for key, items in grouped.items()}
+
+    def __len__(self) -> int:
+        """Return the number of indexed pickups."""
+        return len(self._combined.ordinals)
+
+    def _column(self, waste_type: str | None) -> _Column | None:
+        if waste_type is None:
+            return self._combined
+        return self._by_type.get(waste_type.strip().lower())
+
+    def between(
+        self, start: date, end: date, *, waste_type: str | None = None
+    ) -> list[tuple[str, date]]:
+        """Return the (waste_type, date) pickups from start to end, inclusive."""
+        column = self._column(waste_type)
+        if column is None:
+            return []
+        return [
+            (column.types[pos], date.fromordinal(column.ordinals[pos]))
+            for pos in column.span(start.toordinal(), end.toordinal())
+        ]
+
+    def next_pickup(
+        self, on_or_after: date, *, waste_type: str | None = None
+    ) -> tuple[date, list[str]] | None:
+        """Return the first pickup date from on_or_after and its waste types."""
+        column = self._column(waste_type)
+        if column is None:
+            return None
+        first = bisect_left(column.ordinals, on_or_after.toordinal())
+        if first == len(column.ordinals):
+            return None
+
+        ordinal = column.ordinals[first]
+        types: list[str] = []
+        for pos in column.span(ordinal, ordinal):
+            if column.types[pos] not in types:
+                types.append(column.types[pos])
+        return date.fromordinal(ordinal), types
+
+
+def build_schedule_index(
+    waste_data_raw: list[PickupEvent] | None,
+    waste_data_with_today: dict[str, Any] | None,
+    exclude_list: str,
+) -> ScheduleIndex:
+    """Return the index of a coordinator's schedule, minus excluded types.
+
+    Prefers the raw schedule (every future date for every type). Falls back
+    to the next-date-per-type data for caches written before the raw
+    schedule was stored.
+    """
+    exclude = {
+        x.strip() for x in str(exclude_list or "").lower().split(",") if x.strip()
+    }
+
+    if waste_data_raw:
+        return ScheduleIndex.from_events(
+            event
+            for event in pickup_events(waste_data_raw)
+            if event.type not in exclude
+        )
+
+    _LOGGER.debug("No raw schedule on coordinator; falling back to next-per-type data")
+    schedule: list[tuple[str, date]] = []
+    for item_type, value in (waste_data_with_today or {}).items():
+        if not item_type or item_type.strip().lower() in exclude:
+            continue
+        event_date = _to_date(value)
+        if event_date is None:
+            continue
+        schedule.append((item_type, event_date))
+    return ScheduleIndex(schedule)
@@ -166,6 +166,9 @@ _RESERVED_SENSOR_KIND_KEYS = frozenset(
         "next_type",
         "next_item",
         "notifications",
+        "refresh_duration",
+        "refresh_requests",
+        "refresh_response_size",
     }
 )
 
@@ -221,3 +224,15 @@ def parse_and_apply_value(
             return parsed_date, None
 
     return value, None
+
+
+def coordinator_key_changed(coordinator: Any, key: str) -> bool:
+    """Return False only when the coordinator reports key as unchanged.
+
+    Coordinators without change tracking count as changed, so the sensor
+    always writes its state.
+    """
+    changed_keys = getattr(coordinator, "changed_keys", None)
+    if not isinstance(changed_keys, (set, frozenset)):
+        return True
+    return key in changed_keys
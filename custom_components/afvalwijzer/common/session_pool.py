@@ -0,0 +1,168 @@
+"""Shared HTTP connection pool for the requests-based collectors.
+
+Every refresh of every config entry used to build its own requests.Session,
+paying a fresh TCP and TLS handshake per request. The pool below is owned by
+the integration (in hass.data[DOMAIN]) and shared by all entries: it keeps one
+HTTPAdapter per scheme whose urllib3 PoolManager holds a bounded keep-alive
+pool per host. Each refresh still gets its own Session object, so cookies
+(Circulus, mijnafvalhulp) never leak between addresses; only the underlying
+connections are shared. Requests to the Ximmio API go over a DualStackAdapter
+(see common.dual_stack) the pool owns alongside the plain ones.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from ..const.const import DATA_SESSION_POOL, DOMAIN, SENSOR_COLLECTORS_XIMMIO
+from .dual_stack import DualStackAdapter
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of distinct hosts an adapter keeps a connection pool for (LRU).
+DEFAULT_POOL_CONNECTIONS = 16
+# Keep-alive connections kept per host; extra concurrent requests still
+# succeed, their connections are just not returned to the pool.
+DEFAULT_POOL_MAXSIZE = 4
+# Pooled connections unused for this long are closed.
+DEFAULT_IDLE_TIMEOUT = timedelta(minutes=10)
+
+_SCHEMES = ("https://", "http://")
+# Hosts whose IPv6 addresses do not always accept connections
+_DUAL_STACK_PREFIXES = tuple(
+    sorted({f"{url.rstrip('/')}/" for url in SENSOR_COLLECTORS_XIMMIO.values()})
+)
+
+
+class _PooledSession(requests.Session):
+    """A per-refresh Session whose close() leaves the shared adapters alone."""
+
+    def close(self) -> None:
+        """Drop per-refresh state without closing the pooled connections."""
+        self.cookies.clear()
+
+
+class SessionPool:
+    """Process-wide pool of keep-alive connections, shared by config entries."""
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        idle_timeout: timedelta = DEFAULT_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize an empty pool."""
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._idle_timeout = idle_timeout.total_seconds()
+        self._lock = threading.Lock()
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._last_used = 0.0
+        self._users: set[str] = set()
+        self.cancel_eviction: Any = None
+
+    def acquire(self, entry_id: str) -> None:
+        """Register a config entry as a user of the pool."""
+        self._users.add(entry_id)
+
+    def release(self, entry_id: str) -> bool:
+        """Unregister a config entry; return True when it was the last user."""
+        self._users.discard(entry_id)
+        return not self._users
+
+    def session(self) -> requests.Session:
+        """Return a new Session that sends its requests over the shared pools."""
+        session = _PooledSession()
+        with self._lock:
+            self._last_used = time.monotonic()
+            for prefix in (*_SCHEMES, *_DUAL_STACK_PREFIXES):
+                session.mount(prefix, self._adapter(prefix))
+        return session
+
+    def _adapter(self, prefix: str) -> HTTPAdapter:
+        """Return the adapter for prefix, creating it on first use.
+
+        The Ximmio hosts share one DualStackAdapter, so the address family
+        that worked is remembered for as long as the pool lives.
+        """
+        dual_stack = prefix in _DUAL_STACK_PREFIXES
+        key = "dual_stack" if dual_stack else prefix
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            adapter_cls = DualStackAdapter if dual_stack else HTTPAdapter
+            adapter = adapter_cls(
+                pool_connections=self._pool_connections,
+                pool_maxsize=self._pool_maxsize,
+            )
+            self._adapters[key] = adapter
+        return adapter
+
+    def evict_idle(self, now: float | None = None) -> bool:
+        """Close pooled connections when the pool has been idle too long.
+
+        The adapters stay mounted and reopen connections on demand, so this is
+        safe to call at any time. Return True when connections were closed.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._adapters or now - self._last_used < self._idle_timeout:
+                return False
+            for adapter in self._adapters.values():
+                adapter.close()
+        _LOGGER.debug("Closed idle pooled HTTP connections")
+        return True
+
+    def close(self) -> None:
+        """Close every pooled connection and forget the adapters."""
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._adapters.clear()
+
+
+@callback
+def async_get_session_pool(hass: HomeAssistant, entry_id: str) -> SessionPool:
+    """Return the integration's shared pool, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    pool: SessionPool | None = domain_data.get(DATA_SESSION_POOL)
+
+    if pool is None:
+        pool = SessionPool()
+
+        @callback
+        def _evict_idle(_now: Any) -> None:
+            pool.evict_idle()
+
+        pool.cancel_eviction = async_track_time_interval(
+            hass, _evict_idle, DEFAULT_IDLE_TIMEOUT
+        )
+        domain_data[DATA_SESSION_POOL] = pool
+
+    pool.acquire(entry_id)
+    return pool
+
+
+@callback
+def async_release_session_pool(hass: HomeAssistant, entry_id: str) -> None:
+    """Release the pool for an unloading entry; close it after the last one."""
+    domain_data = hass.data.get(DOMAIN, {})
+    pool: SessionPool | None = domain_data.get(DATA_SESSION_POOL)
+    if pool is None or not pool.release(entry_id):
+        return
+
+    domain_data.pop(DATA_SESSION_POOL, None)
+    if pool.cancel_eviction is not None:
+        pool.cancel_eviction()
+    pool.close()
+    _LOGGER.debug("Closed the shared HTTP connection pool")
@@ -0,0 +1,79 @@
+"""Collapse concurrent identical fetches into a single in-flight request.
+
+Several provider aliases share one endpoint (e.g. "cyclus", "montfoort" and
+"uithoorn" all resolve to cyclusnv.nl), and users sometimes add the same
+address twice. When such entries refresh at the same moment (startup, or
+after a reload) only the first caller does the fetch; the others wait for it
+and receive the same parsed result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import concurrent.futures
+import threading
+from typing import Any
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, concurrent.futures.Future] = {}
+        self._async_calls: dict[Hashable, asyncio.Task] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Call fn, or wait for the in-flight call with the same key.
+
+        Thread-safe; used from the executor threads of the sync collectors.
+        Exceptions raised by the shared call are raised in every waiter.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def async_do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn(), or the in-flight call with the same key.
+
+        Must be called from the event loop. A cancelled waiter does not cancel
+        the shared call for the others.
+        """
+        task = self._async_calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._async_calls[key] = task
+            task.add_done_callback(lambda done: self._async_done(key, done))
+        return await asyncio.shield(task)
+
+    def _async_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._async_calls.get(key) is task:
+            del self._async_calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter went away.
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls) + len(self._async_calls)
@@ -0,0 +1,108 @@
+"""Expiry-aware store for collector auth tokens, cookies and device ids.
+
+Some providers want a login before the schedule can be requested. Logging in
+on every poll costs extra round-trips and, for anonymous sign-ups, creates a
+throwaway upstream account each time. Collectors that support it keep their
+tokens in a small dict owned by the coordinator (and persisted with its
+cache), and only log in or refresh when a token is missing or about to expire.
+
+Entries are {"value": ..., "expires_at": <epoch seconds or None>, "durable":
+bool}. Short-lived tokens that are cheap to renew are stored as not durable:
+they are persisted along with everything else, but renewing them is no
+reason on its own to rewrite the cache.
+"""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Callable
+from datetime import timedelta
+import json
+import time
+from typing import Any
+
+# A token expiring within this margin is renewed before it is used
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=5)
+
+HTTP_UNAUTHORIZED = (401, 403)
+
+
+def valid_token(
+    store: dict[str, Any] | None, name: str, *, now: float | None = None
+) -> Any | None:
+    """Return the stored value of name, or None if unknown or near expiry."""
+    if not store:
+        return None
+
+    entry = store.get(name) or {}
+    value = entry.get("value")
+    if not value:
+        return None
+
+    expires_at = entry.get("expires_at")
+    if expires_at is not None and (
+        (now or time.time()) >= expires_at - TOKEN_EXPIRY_MARGIN.total_seconds()
+    ):
+        return None
+    return value
+
+
+def remember_token(
+    store: dict[str, Any] | None,
+    name: str,
+    value: Any,
+    *,
+    expires_in: float | None = None,
+    expires_at: float | None = None,
+    durable: bool = True,
+    now: float | None = None,
+) -> None:
+    """Store value under name, optionally expiring after expires_in seconds."""
+    if store is None:
+        return
+    if expires_at is None and expires_in is not None:
+        expires_at = (now or time.time()) + float(expires_in)
+    store[name] = {"value": value, "expires_at": expires_at, "durable": durable}
+
+
+def forget_token(store: dict[str, Any] | None, name: str) -> None:
+    """Drop the stored value of name."""
+    if store is not None:
+        store.pop(name, None)
+
+
+def stable_value(
+    store: dict[str, Any] | None, name: str, factory: Callable[[], str]
+) -> str:
+    """Return the stored value of name, creating (and storing) it once."""
+    value = valid_token(store, name)
+    if value is None:
+        value = factory()
+        remember_token(store, name, value)
+    return value
+
+
+def durable_tokens(store: dict[str, Any]) -> dict[str, Any]:
+    """Return the entries whose change is worth a cache write."""
+    return {name: entry for name, entry in store.items() if entry.get("durable", True)}
+
+
+def jwt_expiry(token: str) -> float | None:
+    """Return the exp claim (epoch seconds) of a JWT, or None if absent.
+
+    The signature is not checked; the claim only decides when to log in again.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def is_unauthorized(err: BaseException) -> bool:
+    """Return True if err is an HTTP 401/403 (requests or aiohttp)."""
+    response = getattr(err, "response", None)
+    status = getattr(response, "status_code", None) or getattr(err, "status", None)
+    return status in HTTP_UNAUTHORIZED
@@ -1,12 +1,10 @@
 """Transform raw waste data into structures used by Afvalwijzer sensors."""
 
 from datetime import datetime, timedelta
+from operator import attrgetter
 
 from homeassistant.util import dt as dt_util
 
-from ..common.day_sensor_data import DaySensorData
-from ..common.next_sensor_data import NextSensorData
-
 
 class WasteDataTransformer:
     """Transform raw waste data into structures used by sensors."""
@@ -20,18 +18,11 @@ class WasteDataTransformer:
     ):
         """Initialize the waste data transformer.
 
-        Prepare raw waste data and generate derived datasets for sensor use.
+        waste_data_raw is the schedule as PickupEvents (see
+        common.pickup_event); the derived datasets are generated from it.
         """
-        parsed_data = [
-            {
-                "type": item["type"],
-                "date": datetime.strptime(item["date"], "%Y-%m-%d"),
-            }
-            for item in waste_data_raw
-            if item["type"].strip().lower() != "ignore"
-        ]
-        parsed_data.sort(key=lambda item: item["date"])
-        self.waste_data_raw = parsed_data
+        # Collectors mostly deliver date order already; sorting that is linear
+        self.waste_data_raw = sorted(waste_data_raw, key=attrgetter("ordinal"))
         self.exclude_pickup_today = exclude_pickup_today
         self.exclude_set = {
             x.strip() for x in exclude_list.strip().lower().split(",") if x.strip()
@@ -43,99 +34,76 @@ class WasteDataTransformer:
         self.DATE_TODAY = datetime(today_date.year, today_date.month, today_date.day)
         self.DATE_TOMORROW = self.DATE_TODAY + timedelta(days=1)
 
-        (
-            self._waste_data_with_today,
-            self._waste_data_without_today,
-        ) = self._structure_waste_data()  # type: ignore
+        self._transform()
+
+    def _transform(self):
+        """Derive every sensor structure in a single pass over the schedule.
 
-        (
-            self._waste_data_provider,
-            self._waste_types_provider,
-            self._waste_data_custom,
-            self._waste_types_custom,
-        ) = self._gen_sensor_waste_data()
+        The schedule is sorted by date, so the first qualifying pickup of a
+        type is its next one, and the pickups on the next date are adjacent.
+        """
+        include_today = self.exclude_pickup_today.casefold() in ("false", "no")
+        today = self.DATE_TODAY.toordinal()
+        cutoff = today if include_today else today + 1
+        days = {today + offset: [] for offset in range(3)}
 
-    def _structure_waste_data(self):
         waste_data_with_today = {}
         waste_data_without_today = {}
-
-        if self.exclude_pickup_today.casefold() in ("false", "no"):
-            cutoff_date = self.DATE_TODAY
-        else:
-            cutoff_date = self.DATE_TOMORROW
-
-        for item in self.waste_data_raw:
-            item_date = item["date"]
-            item_name = item["type"].strip().lower()
-
-            if (
-                item_name not in self.exclude_set
-                and item_name not in waste_data_with_today
-                and item_date >= self.DATE_TODAY
-            ):
-                waste_data_with_today[item_name] = item_date
-
-            if (
-                item_name not in self.exclude_set
-                and item_name not in waste_data_without_today
-                and item_date >= cutoff_date
-            ):
-                waste_data_without_today[item_name] = item_date
-
-        for item in self.waste_data_raw:
-            item_name = item["type"].strip().lower()
-            if item_name not in self.exclude_set:
-                waste_data_with_today.setdefault(item_name, self.default_label)
-                waste_data_without_today.setdefault(item_name, self.default_label)
-
-        return waste_data_with_today, waste_data_without_today
-
-    def _gen_sensor_waste_data(self):
-        if self.exclude_pickup_today.casefold() in ("false", "no"):
-            date_selected = self.DATE_TODAY
-            waste_data_provider = self._waste_data_with_today
-        else:
-            date_selected = self.DATE_TOMORROW
-            waste_data_provider = self._waste_data_without_today
-
-        waste_types_provider = sorted(
-            {
-                waste["type"]
-                for waste in self.waste_data_raw
-                if waste["type"] not in self.exclude_set
-            }
+        names = {}
+        next_ordinal = None
+        next_types = []
+
+        for event in self.waste_data_raw:
+            ordinal = event.ordinal
+            waste_type = event.type
+            if waste_type in self.exclude_set:
+                continue
+
+            names[waste_type] = None
+            if ordinal >= today and waste_type not in waste_data_with_today:
+                waste_data_with_today[waste_type] = datetime.fromordinal(ordinal)
+            if ordinal >= cutoff and waste_type not in waste_data_without_today:
+                waste_data_without_today[waste_type] = datetime.fromordinal(ordinal)
+
+            if ordinal in days:
+                days[ordinal].append(waste_type)
+            if ordinal > today:
+                if next_ordinal is None:
+                    next_ordinal = ordinal
+                if ordinal == next_ordinal:
+                    next_types.append(waste_type)
+
+        for waste_type in names:
+            waste_data_with_today.setdefault(waste_type, self.default_label)
+            waste_data_without_today.setdefault(waste_type, self.default_label)
+
+        self._waste_data_with_today = waste_data_with_today
+        self._waste_data_without_today = waste_data_without_today
+        self._waste_data_provider = (
+            waste_data_with_today if include_today else waste_data_without_today
         )
-
-        waste_data_formatted = [
-            {
-                "type": waste["type"],
-                "date": waste["date"],
-            }
-            for waste in self.waste_data_raw
-            if waste["type"] in waste_types_provider
-        ]
-
-        days = DaySensorData(waste_data_formatted, self.default_label)
-
-        waste_data_after_date_selected = [
-            waste for waste in waste_data_formatted if waste["date"] >= date_selected
-        ]
-
-        next_data = NextSensorData(waste_data_after_date_selected, self.default_label)
-
-        waste_data_custom = {
-            **next_data.next_sensor_data,
-            **days.day_sensor_data,
+        self._waste_types_provider = sorted(names)
+
+        today_types, tomorrow_types, dot_types = days.values()
+        self._waste_data_custom = {
+            "next_date": (
+                datetime.fromordinal(next_ordinal)
+                if next_ordinal is not None
+                else self.default_label
+            ),
+            "next_in_days": (
+                next_ordinal - today if next_ordinal is not None else self.default_label
+            ),
+            "next_type": self._join(next_types),
+            "today": self._join(today_types),
+            "tomorrow": self._join(tomorrow_types),
+            "day_after_tomorrow": self._join(dot_types),
         }
+        self._waste_types_custom = sorted(self._waste_data_custom)
 
-        waste_types_custom = sorted(waste_data_custom.keys())
-
-        return (
-            waste_data_provider,
-            waste_types_provider,
-            waste_data_custom,
-            waste_types_custom,
-        )
+    def _join(self, waste_types):
+        """Return the distinct waste types, or the default label if none."""
+        return ", ".join(dict.fromkeys(waste_types)) or self.default_label
 
     @property
     def waste_data_with_today(self):
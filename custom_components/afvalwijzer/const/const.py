@@ -191,6 +191,9 @@ ATTR_DAYS_UNTIL_COLLECTION_DATE = "days_until_collection_date"
 DOMAIN = "afvalwijzer"
 DOMAIN_DATA = "afvalwijzer_data"
 
+# Key in hass.data[DOMAIN] for the HTTP connection pool shared by all entries.
+DATA_SESSION_POOL = "session_pool"
+
 STARTUP_MESSAGE = f"""
 -------------------------------------------------------------------,
 Afvalwijzer - {VERSION},
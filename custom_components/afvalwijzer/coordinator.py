@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .collector.main_collector import MainCollector
+from .common.data_digest import combined_digest, derived_data_digests
+from .common.pickup_event import PickupEvent, pickup_events
+from .common.refresh_scheduler import MIN_INTERVAL, RefreshScheduler
+from .common.refresh_timings import (
+    RefreshTimings,
+    TimingsWindow,
+    phase,
+    recording,
+)
+from .common.schedule_codec import decode_schedule, encode_schedule
+from .common.schedule_index import ScheduleIndex, build_schedule_index
+from .common.session_pool import SessionPool
+from .common.token_store import durable_tokens
 from .const.const import (
     CONF_COLLECTOR,
     CONF_DEFAULT_LABEL,
@@ -26,15 +40,48 @@ from .const.const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-STORAGE_VERSION = 1
+# 1: derived views plus the schedule as a list of dicts with ISO timestamps
+# 2: the schedule only, in the columnar form of common.schedule_codec; the
+#    derived views are recomputed on load
+STORAGE_VERSION = 2
 
 # Cached data older than this is ignored at startup
 MAX_CACHE_AGE = timedelta(days=7)
 
+# Cache writes of refreshes in quick succession are coalesced into one
+CACHE_SAVE_DELAY = 60
+# An unchanged cache is still rewritten this often, so that its fetched_at
+# stays well within MAX_CACHE_AGE and the cache is trusted at startup
+CACHE_REWRITE_AGE = timedelta(days=1)
+
+
+def _migrate_v1_payload(old_data: dict[str, Any]) -> dict[str, Any]:
+    """Convert a version 1 cache payload to version 2."""
+    data = old_data.get("data") or {}
+    payload = {key: value for key, value in old_data.items() if key != "data"}
+    payload["schedule"] = encode_schedule(pickup_events(data.get("waste_data_raw")))
+    payload["notification_data"] = data.get("notification_data") or []
+    return payload
+
+
+class _CacheStore(Store[dict[str, Any]]):
+    """Per-entry cache store that upgrades older cache layouts."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate the cache to the current layout."""
+        if old_major_version == 1:
+            return _migrate_v1_payload(old_data)
+        return old_data
+
 
 def _build_cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
     """Return the per-entry cache store in .storage."""
-    return Store[dict[str, Any]](hass, STORAGE_VERSION, f"{DOMAIN}_{entry_id}.cache")
+    return _CacheStore(hass, STORAGE_VERSION, f"{DOMAIN}_{entry_id}.cache")
 
 
 async def async_remove_cache(hass: HomeAssistant, entry_id: str) -> None:
@@ -46,22 +93,56 @@ class AfvalwijzerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Afvalwijzer data."""
 
     def __init__(
-        self, hass: HomeAssistant, config: dict[str, Any], entry_id: str
+        self,
+        hass: HomeAssistant,
+        config: dict[str, Any],
+        entry_id: str,
+        *,
+        session_pool: SessionPool | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(hours=4),
+            update_interval=MIN_INTERVAL,
         )
         self.config = config
+        self._session_pool = session_pool
         self._store = _build_cache_store(hass, entry_id)
         self.waste_data_with_today: dict[str, Any] = {}
         self.waste_data_without_today: dict[str, Any] = {}
         self.waste_data_custom: dict[str, Any] = {}
-        self.waste_data_raw: list[dict[str, Any]] = []
+        self.waste_data_raw: list[PickupEvent] = []
         self.notification_data: list[Any] = []
+        # Date-sorted index of the schedule for the calendar, rebuilt whenever
+        # data is applied
+        self.schedule_index = ScheduleIndex(())
+        # ETag / Last-Modified of the last full schedule response, per URL
+        self._http_validators: dict[str, Any] = {}
+        # Provider ids the configured address resolved to, with their age
+        self._address_cache: dict[str, Any] = {}
+        # Login tokens and device ids of providers that need a login
+        self._token_store: dict[str, Any] = {}
+        # Picks the next poll time from the schedule and its change history
+        self._refresh_scheduler = RefreshScheduler()
+        # Per-sensor digests of the derived data, and the keys whose digest
+        # changed with the last applied data (see common.data_digest)
+        self._digests: dict[str, str] = {}
+        self.changed_keys: set[str] = set()
+        self.data_digest: str | None = None
+        # Write-behind cache state: content digest and time of the last
+        # queued write, and whether a queued write has not happened yet
+        self._fetched_at: datetime | None = None
+        self._cache_digest: str | None = None
+        self._cache_saved_at: datetime | None = None
+        self._cache_dirty = False
+        # Phase timings of the last refreshes (see common.refresh_timings),
+        # of the refresh in progress and of the one that queued the pending
+        # cache write, which is charged for encoding it
+        self.refresh_timings = TimingsWindow()
+        self._timings: RefreshTimings | None = None
+        self._cache_timings: RefreshTimings | None = None
         self.supports_notifications = MainCollector.provider_supports_notifications(
             config.get(CONF_COLLECTOR)
         )
@@ -75,8 +156,19 @@ class AfvalwijzerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 and self._is_cache_for_current_config(cached_data)
                 and not self._is_cache_stale(cached_data)
             ):
-                self._apply_data(cached_data["data"])
-                self.data = cached_data["data"]
+                data = self._derive_data(
+                    decode_schedule(cached_data["schedule"]),
+                    cached_data.get("notification_data") or [],
+                )
+                self._apply_data(data)
+                self.data = data
+                self._http_validators = dict(cached_data.get("validators") or {})
+                self._address_cache = dict(cached_data.get("addresses") or {})
+                self._token_store = dict(cached_data.get("tokens") or {})
+                self._refresh_scheduler.restore(cached_data.get("refresh"))
+                self._fetched_at = dt_util.parse_datetime(cached_data["fetched_at"])
+                self._cache_saved_at = self._fetched_at
+                self._cache_digest = self._cache_content_digest()
                 _LOGGER.debug("Loaded Afvalwijzer data from cache")
                 return True
         except Exception as err:
@@ -103,25 +195,100 @@ class AfvalwijzerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API."""
+        timings = self._timings = RefreshTimings()
+        success = False
         try:
-            data = await self.hass.async_add_executor_job(self._fetch_data)
-            self._apply_data(data)
-
-            # Save to cache
-            cache_payload = {
-                "config": {
-                    CONF_POSTAL_CODE: self.config.get(CONF_POSTAL_CODE),
-                    CONF_HOUSE_NUMBER: self.config.get(CONF_HOUSE_NUMBER),
-                    CONF_COLLECTOR: self.config.get(CONF_COLLECTOR),
-                },
-                "fetched_at": dt_util.utcnow().isoformat(),
-                "data": data,
-            }
-            await self._store.async_save(cache_payload)
+            with recording(timings):
+                data = await self._async_fetch_data()
+                with phase("transform"):
+                    self._apply_data(data)
+                    self._schedule_next_refresh()
+                self._fetched_at = dt_util.utcnow()
+                with phase("cache_save"):
+                    self._async_schedule_cache_save()
 
+            success = True
             return data
         except Exception as err:
+            # Retry soon; the interval of the last good refresh may be days
+            self.update_interval = MIN_INTERVAL
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        finally:
+            timings.finish(success=success)
+            self.refresh_timings.add(timings)
+            self._timings = None
+
+    def _cache_content_digest(self) -> str:
+        """Return a digest of everything the cache stores, except timestamps."""
+        return combined_digest(
+            {
+                "schedule": self._refresh_scheduler.digest or "",
+                "notifications": repr(self.notification_data),
+                "validators": repr(sorted(self._http_validators.items())),
+                "addresses": repr(sorted(self._address_cache.items())),
+                "tokens": repr(sorted(durable_tokens(self._token_store).items())),
+            }
+        )
+
+    @callback
+    def _async_schedule_cache_save(self) -> None:
+        """Queue a cache write if its content changed or it is getting old.
+
+        The write is delayed so refreshes in quick succession write once; a
+        pending write is flushed by async_flush_cache on unload and by the
+        Store itself when Home Assistant stops.
+        """
+        digest = self._cache_content_digest()
+        if (
+            digest == self._cache_digest
+            and self._cache_saved_at is not None
+            and self._fetched_at - self._cache_saved_at < CACHE_REWRITE_AGE
+        ):
+            return
+
+        self._cache_digest = digest
+        self._cache_saved_at = self._fetched_at
+        self._cache_dirty = True
+        self._cache_timings = self._timings
+        self._store.async_delay_save(self._cache_payload, CACHE_SAVE_DELAY)
+
+    def _cache_payload(self) -> dict[str, Any]:
+        """Return the cache content; called by the Store when it writes."""
+        self._cache_dirty = False
+        with recording(self._cache_timings), phase("cache_save"):
+            return self._encode_cache_payload()
+
+    def _encode_cache_payload(self) -> dict[str, Any]:
+        """Return the cache content."""
+        return {
+            "config": {
+                CONF_POSTAL_CODE: self.config.get(CONF_POSTAL_CODE),
+                CONF_HOUSE_NUMBER: self.config.get(CONF_HOUSE_NUMBER),
+                CONF_COLLECTOR: self.config.get(CONF_COLLECTOR),
+            },
+            "fetched_at": self._fetched_at.isoformat(),
+            "validators": self._http_validators,
+            "addresses": self._address_cache,
+            "tokens": self._token_store,
+            "refresh": self._refresh_scheduler.as_dict(),
+            "schedule": encode_schedule(self.waste_data_raw),
+            "notification_data": self.notification_data,
+        }
+
+    async def async_flush_cache(self) -> None:
+        """Write a pending delayed cache save now (e.g. when unloading)."""
+        if self._cache_dirty:
+            await self._store.async_save(self._cache_payload())
+
+    def _schedule_next_refresh(self) -> None:
+        """Adapt the poll interval to the schedule that was just fetched."""
+        now = dt_util.utcnow()
+        if self._refresh_scheduler.record(self.waste_data_raw, now):
+            _LOGGER.debug("Afvalwijzer schedule changed")
+        self.update_interval = self._refresh_scheduler.next_interval(
+            self.waste_data_raw, now
+        )
+        _LOGGER.debug("Next Afvalwijzer refresh in %s", self.update_interval)
 
     def _apply_data(self, data: dict[str, Any]) -> None:
         """Apply fetched or cached data."""
@@ -130,23 +297,140 @@ class AfvalwijzerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.waste_data_custom = data.get("waste_data_custom", {})
         self.waste_data_raw = data.get("waste_data_raw", [])
         self.notification_data = data.get("notification_data", [])
+        self.schedule_index = build_schedule_index(
+            self.waste_data_raw,
+            self.waste_data_with_today,
+            self.config.get(CONF_EXCLUDE_LIST, ""),
+        )
+        self._update_digests(data)
+
+    def _update_digests(self, data: dict[str, Any]) -> None:
+        """Work out which sensor keys changed with the applied data."""
+        digests = derived_data_digests(data, dt_util.now().date())
+        self.changed_keys = {
+            key
+            for key in digests.keys() | self._digests.keys()
+            if digests.get(key) != self._digests.get(key)
+        }
+        self._digests = digests
+        self.data_digest = combined_digest(digests)
+
+    def has_changed(self, key: str) -> bool:
+        """Return True if the data behind sensor key changed in the last update."""
+        return key in self.changed_keys
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch data on the event loop, or in an executor for sync collectors."""
+        if not MainCollector.provider_supports_async(self.config.get(CONF_COLLECTOR)):
+            return await self.hass.async_add_executor_job(self._fetch_data)
+
+        try:
+            collector = await MainCollector.async_create(
+                *self._collector_args(),
+                **self._collector_kwargs(),
+                **self._conditional_kwargs(),
+                address_cache=self._address_cache,
+                token_store=self._token_store,
+                websession=async_get_clientsession(self.hass),
+            )
+        except Exception as err:
+            raise UpdateFailed(f"Collector initialization failed: {err}") from err
+
+        return self._collector_data(collector)
+
+    def _collector_args(self) -> tuple[Any, ...]:
+        """Return the positional MainCollector arguments for this entry."""
+        return (
+            self.config.get(CONF_COLLECTOR),
+            self.config.get(CONF_POSTAL_CODE),
+            self.config.get(CONF_HOUSE_NUMBER),
+            self.config.get(CONF_SUFFIX),
+            self.config.get(CONF_STREET_NAME),
+        )
+
+    def _collector_kwargs(self) -> dict[str, Any]:
+        """Return the keyword MainCollector arguments for this entry."""
+        return {
+            "exclude_pickup_today": self.config.get(CONF_EXCLUDE_PICKUP_TODAY),
+            "exclude_list": self.config.get(CONF_EXCLUDE_LIST),
+            "default_label": self.config.get(CONF_DEFAULT_LABEL),
+        }
+
+    def _conditional_kwargs(self) -> dict[str, Any]:
+        """Return the MainCollector arguments for a conditional fetch."""
+        if not self.waste_data_raw:
+            # A 304 is only useful when there is a schedule to fall back on
+            self._http_validators.clear()
+        return {
+            "validators": self._http_validators,
+            "cached_waste_data_raw": self.waste_data_raw,
+        }
 
     def _fetch_data(self) -> dict[str, Any]:
         """Fetch data synchronously."""
+        session = self._session_pool.session() if self._session_pool else None
         try:
-            collector = MainCollector(
-                self.config.get(CONF_COLLECTOR),
-                self.config.get(CONF_POSTAL_CODE),
-                self.config.get(CONF_HOUSE_NUMBER),
-                self.config.get(CONF_SUFFIX),
-                self.config.get(CONF_STREET_NAME),
-                exclude_pickup_today=self.config.get(CONF_EXCLUDE_PICKUP_TODAY),
-                exclude_list=self.config.get(CONF_EXCLUDE_LIST),
-                default_label=self.config.get(CONF_DEFAULT_LABEL),
-            )
+            # Executor jobs do not inherit the context of the refresh
+            with recording(self._timings):
+                collector = MainCollector(
+                    *self._collector_args(),
+                    **self._collector_kwargs(),
+                    **self._conditional_kwargs(),
+                    address_cache=self._address_cache,
+                    token_store=self._token_store,
+                    session=session,
+                )
         except Exception as err:
             raise UpdateFailed(f"Collector initialization failed: {err}") from err
 
+        return self._collector_data(collector)
+
+    async def async_recompute(self) -> None:
+        """Re-derive the date-relative sensor data from the cached schedule.
+
+        Used when the day rolls over: the schedule itself did not change, only
+        what counts as today, tomorrow and next pickup did. No requests are
+        made; without a cached schedule this falls back to a normal refresh.
+        """
+        if not self.waste_data_raw:
+            await self.async_request_refresh()
+            return
+
+        try:
+            data = self._derive_data(self.waste_data_raw, self.notification_data)
+        except Exception as err:
+            _LOGGER.warning("Failed to recompute Afvalwijzer data: %s", err)
+            return
+
+        self._async_set_recomputed_data(data)
+
+    def _derive_data(
+        self, waste_data_raw: list[PickupEvent], notification_data: list[Any]
+    ) -> dict[str, Any]:
+        """Return the coordinator payload derived from a known schedule."""
+        collector = MainCollector.from_cache(
+            *self._collector_args(),
+            **self._collector_kwargs(),
+            waste_data_raw=waste_data_raw,
+            notification_data=notification_data,
+        )
+        return self._collector_data(collector)
+
+    @callback
+    def _async_set_recomputed_data(self, data: dict[str, Any]) -> None:
+        """Publish recomputed data without touching the refresh schedule.
+
+        Unlike async_set_updated_data this does not reschedule the next
+        refresh, so polls of different entries stay spread out instead of
+        all restarting their interval at midnight.
+        """
+        self._apply_data(data)
+        self.data = data
+        self.async_update_listeners()
+
+    @staticmethod
+    def _collector_data(collector: MainCollector) -> dict[str, Any]:
+        """Return the coordinator payload for a finished collector run."""
         return {
             "waste_data_with_today": collector.waste_data_with_today,
             "waste_data_without_today": collector.waste_data_without_today,
@@ -0,0 +1,59 @@
+"""Diagnostics support for Afvalwijzer."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const.const import (
+    CONF_COLLECTOR,
+    CONF_FRIENDLY_NAME,
+    CONF_HOUSE_NUMBER,
+    CONF_POSTAL_CODE,
+    CONF_STREET_NAME,
+    CONF_SUFFIX,
+    DOMAIN,
+)
+
+# Everything that identifies the address
+TO_REDACT = {
+    CONF_POSTAL_CODE,
+    CONF_HOUSE_NUMBER,
+    CONF_SUFFIX,
+    CONF_STREET_NAME,
+    CONF_FRIENDLY_NAME,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Besides the (redacted) configuration this holds the p50 / p95 timing
+    breakdown of the last refreshes, see common.refresh_timings.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    update_interval = coordinator.update_interval
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "collector": entry_data["config"].get(CONF_COLLECTOR),
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                update_interval.total_seconds() if update_interval else None
+            ),
+            "pickups": len(coordinator.waste_data_raw),
+            "notifications": len(coordinator.notification_data),
+            "waste_types": sorted(coordinator.waste_data_with_today or {}),
+        },
+        "refresh_timings": coordinator.refresh_timings.summary(),
+    }
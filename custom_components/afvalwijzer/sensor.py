@@ -25,6 +25,7 @@ from .const.const import (
     DOMAIN,
 )
 from .sensor_custom import CustomSensor
+from .sensor_diagnostic import METRICS, RefreshTimingSensor
 from .sensor_provider import ProviderSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -123,6 +124,12 @@ async def async_setup_entry(
 
     _async_add_new_entities()
 
+    if getattr(coordinator, "refresh_timings", None) is not None:
+        # Disabled by default; enable them to watch refresh performance
+        async_add_entities(
+            RefreshTimingSensor(hass, key, coordinator, config) for key in METRICS
+        )
+
     if not known_provider_types and not known_custom_types:
         _LOGGER.warning(
             "No entities created yet; check configuration or collector output. "
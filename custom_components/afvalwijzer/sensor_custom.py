@@ -16,6 +16,7 @@ from .common.sensor_utils import (
     address_key,
     as_utc_aware,
     build_device_info,
+    coordinator_key_changed,
     date_to_local_midnight,
     icon_for_waste_type,
     make_unique_id,
@@ -76,6 +77,8 @@ class CustomSensor(CoordinatorEntity, SensorEntity):
         )
 
         self._last_update: str | None = None
+        # Availability at the last state write; None until the first write
+        self._written_available: bool | None = None
         self._days_until_collection_date: int | None = None
 
         self._attr_has_entity_name = True
@@ -150,6 +153,12 @@ class CustomSensor(CoordinatorEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if self._written_available == self.available and not coordinator_key_changed(
+            self.coordinator, self.waste_type
+        ):
+            # Same value, attributes and flags: skip the recorder write
+            return
+
         _LOGGER.debug("Updating custom sensor from coordinator: %s", self.entity_id)
 
         try:
@@ -173,6 +182,7 @@ class CustomSensor(CoordinatorEntity, SensorEntity):
             _LOGGER.error("Error updating custom sensor %s: %s", self.entity_id, err)
             self._set_error_state()
 
+        self._written_available = self.available
         self.async_write_ha_state()
 
     @staticmethod
@@ -0,0 +1,131 @@
+"""Afvalwijzer refresh timing sensors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
+
+from .common.sensor_utils import address_key, build_device_info, make_unique_id
+from .const.const import SENSOR_PREFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _Metric:
+    # Key of the metric in TimingsWindow.summary() and in its "last" refresh
+    field: str
+    icon: str
+    unit: str | None = None
+    device_class: SensorDeviceClass | None = None
+
+
+# Sensor key -> the metric it reports
+METRICS = {
+    "refresh_duration": _Metric(
+        "duration_ms",
+        "mdi:timer-outline",
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+    ),
+    "refresh_requests": _Metric("requests", "mdi:swap-vertical"),
+    "refresh_response_size": _Metric(
+        "response_bytes",
+        "mdi:download-network-outline",
+        UnitOfInformation.BYTES,
+        SensorDeviceClass.DATA_SIZE,
+    ),
+}
+
+
+class RefreshTimingSensor(CoordinatorEntity, SensorEntity):
+    """Median of a refresh metric over the last refreshes, for diagnostics.
+
+    The state is the p50 of the coordinator's timings window; p95, the last
+    refresh and, for the duration, the per-phase breakdown are attributes.
+    Disabled by default.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        hass: Any,
+        key: str,
+        coordinator: Any,
+        config: dict[str, Any],
+    ) -> None:
+        """Initialize a refresh timing sensor for metric key."""
+        super().__init__(coordinator)
+        self.hass = hass
+        self.key = key
+        self._config = config
+        self._metric = METRICS[key]
+
+        self._attr_has_entity_name = True
+        self._attr_translation_key = key
+
+        addr = address_key(config)
+        self.entity_id = f"sensor.{slugify(SENSOR_PREFIX + addr + '_' + key)}"
+
+        self._attr_unique_id = make_unique_id(config, key)
+        self._attr_icon = self._metric.icon
+        self._attr_native_unit_of_measurement = self._metric.unit
+        self._attr_device_class = self._metric.device_class
+        self._summary: dict[str, Any] = {}
+
+    @property
+    def device_info(self):
+        """Group all sensors for the same address under one device."""
+        return build_device_info(self._config)
+
+    @property
+    def available(self) -> bool:
+        """Stay available when a refresh fails; its timings count too."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Populate initial state from the refreshes recorded so far."""
+        await super().async_added_to_hass()
+        self._summary = self.coordinator.refresh_timings.summary()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the median over the window."""
+        return (self._summary.get(self._metric.field) or {}).get("p50")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the p95, the last refresh and the window size."""
+        last = self._summary.get("last") or {}
+        attrs: dict[str, Any] = {
+            "p95": (self._summary.get(self._metric.field) or {}).get("p95"),
+            "last": last.get(self._metric.field),
+            "refreshes": self._summary.get("refreshes", 0),
+        }
+        if self.key == "refresh_duration":
+            attrs["failures"] = self._summary.get("failures", 0)
+            for name, spread in (self._summary.get("phases_ms") or {}).items():
+                attrs[f"{name}_p50"] = spread["p50"]
+                attrs[f"{name}_p95"] = spread["p95"]
+        return attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Summarize the window again after every refresh."""
+        self._summary = self.coordinator.refresh_timings.summary()
+        _LOGGER.debug("Updating refresh timing sensor: %s", self.entity_id)
+        self.async_write_ha_state()
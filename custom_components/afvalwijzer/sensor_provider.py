@@ -16,6 +16,7 @@ from .common.sensor_utils import (
     address_key,
     as_utc_aware,
     build_device_info,
+    coordinator_key_changed,
     date_to_local_midnight,
     icon_for_waste_type,
     make_unique_id,
@@ -84,6 +85,8 @@ class ProviderSensor(CoordinatorEntity, SensorEntity):
 
         self._is_notification_sensor = waste_type == "notifications"
         self._last_update: str | None = None
+        # Availability at the last state write; None until the first write
+        self._written_available: bool | None = None
         self._days_until_collection_date: int | None = None
         self._is_collection_date_today = False
         self._is_collection_date_tomorrow = False
@@ -179,6 +182,12 @@ class ProviderSensor(CoordinatorEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if self._written_available == self.available and not coordinator_key_changed(
+            self.coordinator, self.waste_type
+        ):
+            # Same value, attributes and flags: skip the recorder write
+            return
+
         _LOGGER.debug("Updating sensor from coordinator: %s", self.entity_id)
 
         try:
@@ -201,6 +210,7 @@ class ProviderSensor(CoordinatorEntity, SensorEntity):
             _LOGGER.error("Error updating sensor %s: %s", self.entity_id, err)
             self._set_error_state()
 
+        self._written_available = self.available
         self.async_write_ha_state()
 
     def _select_provider_data(self) -> dict[str, Any]:
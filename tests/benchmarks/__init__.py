@@ -0,0 +1 @@
+"""Benchmarks for the Afvalwijzer parsing and transformation hot paths."""
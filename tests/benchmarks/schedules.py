@@ -0,0 +1,244 @@
+"""Synthetic schedules and provider payloads for the benchmarks.
+
+A schedule of size pickups over type_count waste types has one pickup per
+type on each pickup day, with a week between pickup days. It starts four
+weeks ago, so the today/tomorrow and next pickup paths all have work to do.
+The payload builders turn such a schedule into the response shape of each
+collector, as far as its _parse_waste_data_raw reads it.
+"""
+
+from collections.abc import Callable
+from datetime import date, timedelta
+from itertools import groupby
+from typing import Any
+
+from custom_components.afvalwijzer.collector import (
+    amsterdam,
+    burgerportaal,
+    circulus,
+    deafvalapp,
+    irado,
+    klikogroep,
+    mijnafvalwijzer,
+    montferland,
+    omrin,
+    opzet,
+    rd4,
+    recycleapp,
+    reinis,
+    rova,
+    rwm,
+    straatbeeld,
+    ximmio,
+)
+
+SIZES = (50, 500, 5_000, 50_000)
+TYPE_COUNTS = (1, 8, 40)
+# Number of waste types for benchmarks that only vary the size
+DEFAULT_TYPE_COUNT = 8
+
+_KNOWN_TYPES = ("gft", "papier", "pmd", "restafval", "textiel", "kerstbomen")
+
+Pickups = list[tuple[str, date]]
+
+
+def waste_types(type_count: int) -> list[str]:
+    """Return type_count waste type names, known ones first."""
+    extra = [f"fractie {n}" for n in range(len(_KNOWN_TYPES), type_count)]
+    return [*_KNOWN_TYPES, *extra][:type_count]
+
+
+def pickups(size: int, type_count: int = DEFAULT_TYPE_COUNT) -> Pickups:
+    """Return size (waste_type, date) pickups over type_count types."""
+    types = waste_types(type_count)
+    start = date.today() - timedelta(weeks=4)
+    return [
+        (types[n % type_count], start + timedelta(weeks=n // type_count))
+        for n in range(size)
+    ]
+
+
+def raw_schedule(schedule: Pickups) -> list[dict[str, str]]:
+    """Return the schedule as collectors return it."""
+    return [
+        {"type": waste_type, "date": day.isoformat()} for waste_type, day in schedule
+    ]
+
+
+def ical_feed(schedule: Pickups) -> str:
+    """Return the schedule as an iCal feed with one VEVENT per pickup."""
+    events = "".join(
+        "BEGIN:VEVENT\r\n"
+        f"UID:{n}@example\r\n"
+        f"DTSTART;VALUE=DATE:{day.strftime('%Y%m%d')}\r\n"
+        f"SUMMARY:{waste_type}\r\n"
+        "END:VEVENT\r\n"
+        for n, (waste_type, day) in enumerate(schedule)
+    )
+    return f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n{events}END:VCALENDAR\r\n"
+
+
+def _by_date(schedule: Pickups) -> list[tuple[date, list[str]]]:
+    ordered = sorted(schedule, key=lambda pickup: pickup[1])
+    return [
+        (day, [waste_type for waste_type, _ in group])
+        for day, group in groupby(ordered, key=lambda pickup: pickup[1])
+    ]
+
+
+def _amsterdam(schedule: Pickups) -> tuple[Any, ...]:
+    # Every item is a weekly collection, expanded to a year of dates
+    items = [
+        {
+            "afvalwijzerFractieCode": waste_type,
+            "afvalwijzerWaar": "stoep",
+            "afvalwijzerOphaaldagen": "maandag",
+            "afvalwijzerAfvalkalenderFrequentie": "",
+        }
+        for waste_type, _ in schedule[: max(len(schedule) // 52, 1)]
+    ]
+    return (items,)
+
+
+def _circulus(schedule: Pickups) -> tuple[Any, ...]:
+    dates: dict[str, list[str]] = {}
+    for waste_type, day in schedule:
+        dates.setdefault(waste_type, []).append(day.isoformat())
+    return ([{"code": code, "dates": days} for code, days in dates.items()],)
+
+
+def _deafvalapp(schedule: Pickups) -> tuple[Any, ...]:
+    dates: dict[str, list[str]] = {}
+    for waste_type, day in schedule:
+        dates.setdefault(waste_type, []).append(day.strftime("%d-%m-%Y"))
+    return ("\n".join(f"{code};{';'.join(days)};" for code, days in dates.items()),)
+
+
+def _irado(schedule: Pickups) -> tuple[Any, ...]:
+    pickups_tree: dict[str, dict[str, dict[str, list[dict[str, str]]]]] = {}
+    for waste_type, day in schedule:
+        items = (
+            pickups_tree.setdefault(str(day.year), {})
+            .setdefault(str(day.month), {})
+            .setdefault(str(day.day), [])
+        )
+        items.append({"date": day.strftime("%d/%m/%Y"), "type": waste_type})
+    return ({"valid": True, "calendar_data": {"pickups": pickups_tree}},)
+
+
+def _reinis(schedule: Pickups) -> tuple[Any, ...]:
+    ids = {
+        waste_type: n
+        for n, waste_type in enumerate(dict.fromkeys(t for t, _ in schedule))
+    }
+    items = [
+        {"ophaaldatum": day.isoformat(), "afvalstroom_id": ids[waste_type]}
+        for waste_type, day in schedule
+    ]
+    return items, [{"id": n, "title": title} for title, n in ids.items()]
+
+
+def _straatbeeld(schedule: Pickups) -> tuple[Any, ...]:
+    collections: dict[str, dict[str, list[dict[str, Any]]]] = {}
+    for day, types in _by_date(schedule):
+        collections.setdefault(str(day.year), {}).setdefault(str(day.month), []).append(
+            {
+                "date": {"formatted": day.isoformat()},
+                "data": [{"name": waste_type} for waste_type in types],
+            }
+        )
+    return ({"collections": collections},)
+
+
+def _items(
+    **fields: Callable[[str, date], Any],
+) -> Callable[[Pickups], tuple[Any, ...]]:
+    """Return a builder for a flat list of one item per pickup."""
+
+    def _build(schedule: Pickups) -> tuple[Any, ...]:
+        return (
+            [
+                {key: field(waste_type, day) for key, field in fields.items()}
+                for waste_type, day in schedule
+            ],
+        )
+
+    return _build
+
+
+def _iso(waste_type: str, day: date) -> str:
+    return day.isoformat()
+
+
+def _name(waste_type: str, day: date) -> str:
+    return waste_type
+
+
+# Collector module and payload builder, keyed by collector name
+COLLECTOR_PAYLOADS: dict[str, tuple[Any, Callable[[Pickups], tuple[Any, ...]]]] = {
+    "amsterdam": (amsterdam, _amsterdam),
+    "burgerportaal": (
+        burgerportaal,
+        _items(
+            collectionDate=lambda _, day: f"{day.isoformat()}T00:00:00Z",
+            fraction=_name,
+        ),
+    ),
+    "circulus": (circulus, _circulus),
+    "deafvalapp": (deafvalapp, _deafvalapp),
+    "irado": (irado, _irado),
+    "klikogroep": (
+        klikogroep,
+        lambda schedule: (
+            {"calendar": {day.isoformat(): types for day, types in _by_date(schedule)}},
+        ),
+    ),
+    "mijnafvalwijzer": (
+        mijnafvalwijzer,
+        lambda schedule: (
+            {
+                "ophaaldagen": {"data": _items(date=_iso, type=_name)(schedule)[0]},
+                "ophaaldagenNext": {"data": []},
+            },
+        ),
+    ),
+    "montferland": (
+        montferland,
+        _items(Datum=lambda _, day: f"{day.isoformat()}T00:00:00", Soort=_name),
+    ),
+    "omrin": (omrin, _items(date=_iso, type=_name)),
+    "opzet": (opzet, _items(ophaaldatum=_iso, menu_title=_name)),
+    "rd4": (rd4, _items(date=_iso, type=_name)),
+    "recycleapp": (
+        recycleapp,
+        lambda schedule: (
+            {
+                "items": _items(
+                    timestamp=lambda _, day: f"{day.isoformat()}T00:00:00.000Z",
+                    fraction=lambda waste_type, _: {"name": {"nl": waste_type}},
+                )(schedule)[0]
+            },
+        ),
+    ),
+    "reinis": (reinis, _reinis),
+    "rova": (
+        rova,
+        _items(
+            wasteType=lambda waste_type, _: {"title": waste_type},
+            date=lambda _, day: f"{day.isoformat()}T00:00:00Z",
+        ),
+    ),
+    "rwm": (rwm, _items(ophaaldatum=_iso, title=_name)),
+    "straatbeeld": (straatbeeld, _straatbeeld),
+    "ximmio": (
+        ximmio,
+        lambda schedule: (
+            {
+                "dataList": _items(
+                    pickupDates=lambda _, day: [f"{day.isoformat()}T00:00:00"],
+                    _pickupTypeText=_name,
+                )(schedule)[0]
+            },
+        ),
+    ),
+}
@@ -0,0 +1,32 @@
+"""Benchmarks for turning provider responses into raw schedules."""
+
+import pytest
+
+from custom_components.afvalwijzer.common.ical_parser import parse_ical_waste_data
+
+from .schedules import COLLECTOR_PAYLOADS, SIZES, TYPE_COUNTS, ical_feed, pickups
+
+
+@pytest.mark.benchmark(group="ical")
+@pytest.mark.parametrize("type_count", TYPE_COUNTS)
+@pytest.mark.parametrize("size", SIZES)
+def test_parse_ical_waste_data(benchmark, size, type_count):
+    """Parse an iCal feed with one VEVENT per pickup."""
+    feed = ical_feed(pickups(size, type_count))
+
+    result = benchmark(parse_ical_waste_data, feed)
+
+    assert len(result) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("collector", sorted(COLLECTOR_PAYLOADS))
+def test_collector_parse_waste_data_raw(benchmark, collector, size):
+    """Parse a collector's response into the raw schedule."""
+    module, build_payload = COLLECTOR_PAYLOADS[collector]
+    payload = build_payload(pickups(size))
+    benchmark.group = f"collector {collector}"
+
+    result = benchmark(module._parse_waste_data_raw, *payload)
+
+    assert result
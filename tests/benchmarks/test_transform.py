@@ -0,0 +1,119 @@
+"""Benchmarks for deriving sensor and calendar data from a raw schedule."""
+
+from datetime import date, timedelta
+import timeit
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.afvalwijzer.collector.main_collector import MainCollector
+from custom_components.afvalwijzer.common.pickup_event import pickup_events
+from custom_components.afvalwijzer.common.schedule_codec import (
+    decode_schedule,
+    encode_schedule,
+)
+from custom_components.afvalwijzer.common.schedule_index import build_schedule_index
+from custom_components.afvalwijzer.common.waste_data_transformer import (
+    WasteDataTransformer,
+)
+
+from .schedules import SIZES, TYPE_COUNTS, pickups, raw_schedule
+
+size_and_types = pytest.mark.parametrize(
+    ("size", "type_count"), [(size, types) for size in SIZES for types in TYPE_COUNTS]
+)
+
+
+@pytest.mark.benchmark(group="pickup events")
+@size_and_types
+def test_pickup_events(benchmark, size, type_count):
+    """Normalize a collector's raw schedule into PickupEvents."""
+    raw = raw_schedule(pickups(size, type_count))
+
+    assert len(benchmark(pickup_events, raw)) == size
+
+
+@pytest.mark.benchmark(group="transformer")
+@size_and_types
+def test_waste_data_transformer(benchmark, size, type_count):
+    """Derive the provider and custom sensor data."""
+    events = pickup_events(raw_schedule(pickups(size, type_count)))
+
+    transformer = benchmark(WasteDataTransformer, events, "True", "", "geen")
+
+    assert len(transformer.waste_types_provider) == type_count
+
+
+@pytest.mark.benchmark(group="transformer scaling")
+def test_transform_scales_linearly(benchmark):
+    """Sixteen times the pickups take nowhere near 256 times as long."""
+    small = pickup_events(raw_schedule(pickups(1_000)))
+    large = pickup_events(raw_schedule(pickups(16_000)))
+    small_time = min(
+        timeit.repeat(
+            lambda: WasteDataTransformer(small, "True", "", "geen"), number=1, repeat=3
+        )
+    )
+
+    benchmark(WasteDataTransformer, large, "True", "", "geen")
+
+    # No stats when the benchmarks are disabled
+    if benchmark.stats:
+        assert benchmark.stats.stats.min < 40 * small_time
+
+
+@pytest.mark.benchmark(group="transformer")
+@size_and_types
+def test_collector_transform(benchmark, size, type_count):
+    """Turn a raw schedule into the sensor data, as every refresh does."""
+    raw = raw_schedule(pickups(size, type_count))
+    collector = SimpleNamespace(
+        exclude_pickup_today="true", exclude_list="", default_label="geen"
+    )
+
+    transformer = benchmark(MainCollector._transform, collector, raw)
+
+    assert set(transformer.waste_data_custom) >= {
+        "today",
+        "tomorrow",
+        "day_after_tomorrow",
+    }
+
+
+@pytest.mark.benchmark(group="calendar")
+@size_and_types
+def test_build_schedule_index(benchmark, size, type_count):
+    """Index the schedule for the calendar entities."""
+    events = pickup_events(raw_schedule(pickups(size, type_count)))
+
+    index = benchmark(build_schedule_index, events, None, "")
+
+    assert len(index) == size
+
+
+@pytest.mark.benchmark(group="calendar")
+@size_and_types
+def test_calendar_queries(benchmark, size, type_count):
+    """Answer a month view and the next pickup, as the calendar entities do."""
+    schedule = pickups(size, type_count)
+    index = build_schedule_index(pickup_events(raw_schedule(schedule)), None, "")
+    first_day = schedule[0][1]
+
+    def _queries():
+        return (
+            index.between(first_day, first_day + timedelta(days=31)),
+            index.next_pickup(date.today(), waste_type="papier"),
+        )
+
+    month, _next_pickup = benchmark(_queries)
+
+    assert month
+
+
+@pytest.mark.benchmark(group="cache")
+@pytest.mark.parametrize("size", SIZES)
+def test_schedule_codec_round_trip(benchmark, size):
+    """Encode the schedule for the cache and decode it again."""
+    events = pickup_events(raw_schedule(pickups(size)))
+
+    assert benchmark(lambda: decode_schedule(encode_schedule(events))) == events
@@ -0,0 +1,10 @@
+"""Offline replay of the provider endpoints for end-to-end refresh measurements.
+
+ReplayServer (see .server) serves the responses recorded in fixtures/, one
+file per collector, on 127.0.0.1, with optional latency and failure
+injection. ReplaySession (see .client) sends every request of a collector
+there instead, and the harness (see .harness) drives MainCollector through
+it, reporting requests, bytes and wall time per refresh.
+
+Run it with `python3 -m tests.replay --help` from the repository root.
+"""
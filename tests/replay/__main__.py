@@ -0,0 +1,137 @@
+"""Replay the recorded fixtures through MainCollector and report per provider.
+
+Usage (from the repository root):
+- `python3 -m tests.replay` replays every fixture, two refreshes each
+- `python3 -m tests.replay circulus opzet --latency 0.1 --failure-rate 0.2`
+- `python3 -m tests.replay --record opzet` re-records a fixture against the
+  live provider, for the address in it
+"""
+
+import argparse
+import logging
+import sys
+
+from .harness import record_fixture, replay_fixture
+from .server import ReplayServer, fixture_names, load_fixture, save_fixture
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+LOGGER = logging.getLogger(__name__)
+
+_ROW = "%-16s %-18s %7s %8s %9s %10s %9s %8s %7s  %s"
+
+
+def _replay(args: argparse.Namespace, names: list[str]) -> int:
+    failures = 0
+    LOGGER.info(
+        _ROW,
+        "fixture",
+        "provider",
+        "refresh",
+        "requests",
+        "sent (B)",
+        "recv (B)",
+        "wall (ms)",
+        "injected",
+        "pickups",
+        "result",
+    )
+    with ReplayServer(
+        latency=args.latency, failure_rate=args.failure_rate, seed=args.seed
+    ) as server:
+        for name in names:
+            for report in replay_fixture(
+                server, name, load_fixture(name), refreshes=args.refreshes
+            ):
+                if report.error:
+                    failures += 1
+                    result = f"error: {report.error}"
+                else:
+                    result = "not modified" if report.not_modified else "ok"
+                LOGGER.info(
+                    _ROW,
+                    report.fixture,
+                    report.provider,
+                    report.refresh,
+                    report.requests,
+                    report.bytes_sent,
+                    report.bytes_received,
+                    f"{report.wall_time * 1000:.1f}",
+                    report.failures,
+                    report.pickups,
+                    result,
+                )
+                for miss in report.misses:
+                    LOGGER.warning("  no recorded response for %s", miss)
+    return failures
+
+
+def _record(names: list[str]) -> int:
+    failures = 0
+    for name in names:
+        try:
+            fixture = record_fixture(load_fixture(name))
+        except Exception:  # pragma: no cover - manual tool
+            LOGGER.exception("Recording %s failed", name)
+            failures += 1
+            continue
+        LOGGER.info(
+            "Recorded %d exchanges to %s",
+            len(fixture["exchanges"]),
+            save_fixture(name, fixture),
+        )
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replay recorded provider responses through MainCollector"
+    )
+    parser.add_argument(
+        "fixtures",
+        nargs="*",
+        metavar="fixture",
+        help=f"fixtures to replay (default: all of {', '.join(fixture_names())})",
+    )
+    parser.add_argument(
+        "--refreshes",
+        type=int,
+        default=2,
+        help="refreshes per provider, sharing caches like the coordinator (default: 2)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds to delay every response (default: 0)",
+    )
+    parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="chance of answering a request with a 503 (default: 0)",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="seed for the failure injection, to repeat a run"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="show the collectors' own log messages",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="re-record the fixtures against the live providers instead",
+    )
+    args = parser.parse_args()
+    if not args.verbose:
+        # Failures are reported per refresh already
+        logging.getLogger("custom_components").setLevel(logging.CRITICAL)
+
+    names = args.fixtures or fixture_names()
+    unknown = sorted(set(names) - set(fixture_names()))
+    if unknown:
+        parser.error(f"unknown fixtures: {', '.join(unknown)}")
+
+    failures = _record(names) if args.record else _replay(args, names)
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,141 @@
+"""Sessions that replay from, or record for, a ReplayServer."""
+
+from __future__ import annotations
+
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar, extract_cookies_to_jar
+from yarl import URL
+
+from .server import REPLAY_HOST_HEADER
+
+# Response headers worth keeping in a recorded fixture
+_RECORDED_HEADERS = {"content-type", "etag", "last-modified", "set-cookie"}
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Send every request to the replay server instead of the host in its URL."""
+
+    def __init__(self, server_url: str) -> None:
+        """Initialize the adapter for the server listening on server_url."""
+        super().__init__()
+        self._netloc = urlsplit(server_url).netloc
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any):
+        """Send request to the replay server, marked with its original host."""
+        split = urlsplit(request.url)
+        replayed = request.copy()
+        replayed.url = urlunsplit(
+            ("http", self._netloc, split.path or "/", split.query, "")
+        )
+        replayed.headers[REPLAY_HOST_HEADER] = split.netloc
+
+        response = super().send(replayed, **kwargs)
+        # Answer for the original request, so collectors see the URL they
+        # asked for and cookies keep the domain they were set for
+        response.url = request.url
+        response.request = request
+        response.cookies = RequestsCookieJar()
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+
+class ReplaySession(requests.Session):
+    """A session whose requests all go to the replay server.
+
+    Other adapters mounted on it (e.g. a dual-stack adapter for Ximmio) are
+    bypassed, plain HTTP providers included.
+    """
+
+    def __init__(self, server_url: str) -> None:
+        """Initialize the session for the server listening on server_url."""
+        super().__init__()
+        self._replay_adapter = ReplayAdapter(server_url)
+        self.mount("http://", self._replay_adapter)
+        self.mount("https://", self._replay_adapter)
+
+    def get_adapter(self, url: str) -> HTTPAdapter:
+        """Return the replay adapter, whatever else is mounted."""
+        return self._replay_adapter
+
+
+class ReplayClientSession:
+    """An aiohttp ClientSession whose requests all go to the replay server.
+
+    For the providers MainCollector.async_create fetches natively. Wraps a
+    real session, like TrackedClientSession wraps Home Assistant's; unlike
+    ReplaySession, responses keep the URL of the replay server.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, server_url: str) -> None:
+        """Wrap session for the server listening on server_url."""
+        self._session = session
+        server = urlsplit(server_url)
+        self._host, self._port = server.hostname, server.port
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass everything else on to the wrapped session."""
+        return getattr(self._session, name)
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> Any:
+        """Send request to the replay server, marked with its original host."""
+        original = URL(url)
+        headers = {
+            **(kwargs.pop("headers", None) or {}),
+            REPLAY_HOST_HEADER: urlsplit(str(original)).netloc,
+        }
+        replayed = (
+            original.with_scheme("http").with_host(self._host).with_port(self._port)
+        )
+        return self._session.request(method, replayed, headers=headers, **kwargs)
+
+    def get(self, url: Any, **kwargs: Any) -> Any:
+        """Send a GET request to the replay server."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> Any:
+        """Send a POST request to the replay server."""
+        return self.request("POST", url, **kwargs)
+
+
+def _recorded_body(response: requests.Response) -> dict[str, Any]:
+    if "json" in response.headers.get("Content-Type", ""):
+        try:
+            return {"json": response.json()}
+        except ValueError:
+            pass
+    return {"body": response.text}
+
+
+class RecordingSession(requests.Session):
+    """A session that keeps every exchange it has with the live providers."""
+
+    def __init__(self) -> None:
+        """Initialize the session with nothing recorded."""
+        super().__init__()
+        self.exchanges: list[dict[str, Any]] = []
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any):
+        """Send request and record it with its response."""
+        response = super().send(request, **kwargs)
+        split = urlsplit(request.url)
+        self.exchanges.append(
+            {
+                "method": request.method,
+                "host": split.netloc,
+                "path": split.path or "/",
+                "query": dict(parse_qsl(split.query, keep_blank_values=True)),
+                "status": response.status_code,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() in _RECORDED_HEADERS
+                },
+                **_recorded_body(response),
+            }
+        )
+        return response
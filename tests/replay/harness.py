@@ -0,0 +1,169 @@
+"""Drive MainCollector against a ReplayServer, or record a fixture live."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+import aiohttp
+
+from custom_components.afvalwijzer.collector.main_collector import MainCollector
+
+from .client import RecordingSession, ReplayClientSession, ReplaySession
+from .server import ReplayServer
+
+
+@dataclass(slots=True)
+class RefreshReport:
+    """Requests, bytes and wall time of one refresh of one provider."""
+
+    fixture: str
+    provider: str
+    refresh: int
+    requests: int
+    bytes_sent: int
+    bytes_received: int
+    wall_time: float
+    failures: int = 0
+    pickups: int = 0
+    not_modified: bool = False
+    error: str | None = None
+    misses: list[str] = field(default_factory=list)
+
+
+def _collector_args(fixture: dict[str, Any]) -> tuple[str, ...]:
+    address = fixture["address"]
+    return (
+        fixture["provider"],
+        address["postal_code"],
+        address["house_number"],
+        address.get("suffix", ""),
+        address.get("street_name", ""),
+    )
+
+
+_COLLECTOR_KWARGS = {
+    "exclude_pickup_today": "False",
+    "exclude_list": "",
+    "default_label": "geen",
+}
+
+
+class _Refreshes:
+    """What the refreshes of one fixture share, as the coordinator keeps it.
+
+    One session, the validators, resolved addresses and login tokens, and
+    the last schedule to fall back on when the server answers 304.
+    """
+
+    def __init__(self, server: ReplayServer, name: str, fixture: dict[str, Any]):
+        self.server = server
+        self.name = name
+        self.fixture = fixture
+        self.validators: dict[str, Any] = {}
+        self.address_cache: dict[str, Any] = {}
+        self.token_store: dict[str, Any] = {}
+        self.waste_data_raw = None
+        self.reports: list[RefreshReport] = []
+
+    def kwargs(self) -> dict[str, Any]:
+        return {
+            **_COLLECTOR_KWARGS,
+            "validators": self.validators,
+            "cached_waste_data_raw": self.waste_data_raw,
+            "address_cache": self.address_cache,
+            "token_store": self.token_store,
+        }
+
+    def report(
+        self, collector: MainCollector | None, error: str | None, wall_time: float
+    ) -> None:
+        stats = self.server.reset()
+        if collector is not None:
+            self.waste_data_raw = collector.waste_data_raw
+        self.reports.append(
+            RefreshReport(
+                fixture=self.name,
+                provider=self.fixture["provider"],
+                refresh=len(self.reports) + 1,
+                requests=stats.requests,
+                bytes_sent=stats.bytes_sent,
+                bytes_received=stats.bytes_received,
+                wall_time=wall_time,
+                failures=stats.failures,
+                pickups=len(collector.waste_data_raw) if collector else 0,
+                not_modified=bool(collector and collector.not_modified),
+                error=error,
+                misses=stats.misses,
+            )
+        )
+
+
+def replay_fixture(
+    server: ReplayServer,
+    name: str,
+    fixture: dict[str, Any],
+    *,
+    refreshes: int = 1,
+) -> list[RefreshReport]:
+    """Refresh the fixture's provider refreshes times against server.
+
+    Like the coordinator, the refreshes share one session, the validators,
+    resolved addresses and login tokens, and the last schedule to fall back
+    on when the server answers 304. So the first refresh shows a cold start
+    and the following ones the steady state. Providers with a native asyncio
+    collector go through MainCollector.async_create with an aiohttp session,
+    as the coordinator fetches them; the others through MainCollector.
+    """
+    server.load(fixture["exchanges"])
+    state = _Refreshes(server, name, fixture)
+    if MainCollector.provider_supports_async(fixture["provider"]):
+        asyncio.run(_async_replay(state, refreshes))
+        return state.reports
+
+    session = ReplaySession(server.url)
+    for _ in range(refreshes):
+        start = time.perf_counter()
+        collector = error = None
+        try:
+            collector = MainCollector(
+                *_collector_args(fixture), **state.kwargs(), session=session
+            )
+        except Exception as err:
+            error = str(err) or type(err).__name__
+        state.report(collector, error, time.perf_counter() - start)
+    session.close()
+    return state.reports
+
+
+async def _async_replay(state: _Refreshes, refreshes: int) -> None:
+    async with aiohttp.ClientSession() as client_session:
+        websession = ReplayClientSession(client_session, state.server.url)
+        for _ in range(refreshes):
+            start = time.perf_counter()
+            collector = error = None
+            try:
+                collector = await MainCollector.async_create(
+                    *_collector_args(state.fixture),
+                    **state.kwargs(),
+                    websession=websession,
+                )
+            except Exception as err:
+                error = str(err) or type(err).__name__
+            state.report(collector, error, time.perf_counter() - start)
+
+
+def record_fixture(fixture: dict[str, Any]) -> dict[str, Any]:
+    """Refresh the fixture's provider live and return it with the exchanges.
+
+    Volatile parts of the recorded requests (a year in the path, dates in
+    the query) make a fixture go stale; wildcard or drop them by hand.
+    """
+    session = RecordingSession()
+    try:
+        MainCollector(*_collector_args(fixture), **_COLLECTOR_KWARGS, session=session)
+    finally:
+        session.close()
+    return {**fixture, "exchanges": session.exchanges}
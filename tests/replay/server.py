@@ -0,0 +1,268 @@
+"""A local HTTP server that replays recorded provider responses.
+
+A fixture holds the exchanges of one collector: the request each response
+answers (method, original host, path and a subset of the query) and the
+response itself. The path is an fnmatch pattern, so parts that change over
+time (e.g. the year in an iCal feed URL) can be wildcarded, and only the
+query parameters listed in the fixture have to match.
+
+Requests reach the server through ReplaySession (see .client), which sends
+the host they were meant for in the X-Replay-Host header (requests sent
+to the server directly match on their Host header). Every request is
+counted, with its body size and the size of the answer; requests matching
+no exchange get a 404 and are kept as misses. A response with an ETag is
+answered with a 304 when the request sends it back, like the real servers
+of the conditional providers do.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import random
+import socket
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Header carrying the host a replayed request was meant for
+REPLAY_HOST_HEADER = "X-Replay-Host"
+
+# Response headers the server sets itself
+_HOP_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+
+
+def fixture_names() -> list[str]:
+    """Return the names of the recorded fixtures, one per collector."""
+    return sorted(path.stem for path in FIXTURES_DIR.glob("*.json"))
+
+
+def load_fixture(name: str) -> dict[str, Any]:
+    """Return the fixture recorded as name."""
+    with (FIXTURES_DIR / f"{name}.json").open(encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_fixture(name: str, fixture: dict[str, Any]) -> Path:
+    """Write fixture as name and return its path."""
+    path = FIXTURES_DIR / f"{name}.json"
+    path.write_text(
+        json.dumps(fixture, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    return path
+
+
+@dataclass(slots=True)
+class ReplayStats:
+    """What the server saw since the last reset."""
+
+    requests: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    failures: int = 0
+    not_modified: int = 0
+    misses: list[str] = field(default_factory=list)
+
+
+def _matches(
+    exchange: dict[str, Any],
+    method: str,
+    host: str,
+    path: str,
+    query: dict[str, str],
+) -> bool:
+    return (
+        exchange.get("method", "GET") == method
+        and exchange.get("host", host) == host
+        and fnmatchcase(path, exchange.get("path", "*"))
+        and all(
+            query.get(key) == str(value)
+            for key, value in (exchange.get("query") or {}).items()
+        )
+    )
+
+
+def _body(exchange: dict[str, Any]) -> bytes:
+    if "json" in exchange:
+        return json.dumps(exchange["json"]).encode()
+    return str(exchange.get("body", "")).encode()
+
+
+def _header(exchange: dict[str, Any], name: str) -> str | None:
+    for key, value in (exchange.get("headers") or {}).items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, so connection reuse shows up as it would against the providers
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; don't let them wait on ACKs
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.replay.connections.add(self.connection)
+
+    def finish(self) -> None:
+        self.server.replay.connections.discard(self.connection)
+        super().finish()
+
+    def do_GET(self) -> None:
+        self.server.replay.handle(self)
+
+    def do_POST(self) -> None:
+        self.server.replay.handle(self)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the report readable; misses are collected in the stats."""
+
+
+class ReplayServer:
+    """Serve the exchanges of a fixture on a free port of 127.0.0.1.
+
+    latency (seconds) delays every response; failure_rate is the chance a
+    request is answered with a 503 instead, drawn from a generator seeded
+    with seed so runs can be repeated.
+    """
+
+    def __init__(
+        self,
+        exchanges: list[dict[str, Any]] | None = None,
+        *,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the server; it starts listening on start() or with."""
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._exchanges = list(exchanges or [])
+        self._lock = threading.Lock()
+        self._stats = ReplayStats()
+        # Open keep-alive connections, closed on stop
+        self.connections: set[socket.socket] = set()
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL the server listens on."""
+        if self._httpd is None:
+            raise RuntimeError("Replay server is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        # server_close() joins the connection threads
+        self._httpd.daemon_threads = False
+        self._httpd.replay = self
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            # Short, so stop() returns quickly
+            kwargs={"poll_interval": 0.05},
+            name="replay-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving, close all connections and wait for their threads."""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        for connection in list(self.connections):
+            with contextlib.suppress(OSError):
+                connection.shutdown(socket.SHUT_RDWR)
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = self._thread = None
+
+    def __enter__(self) -> ReplayServer:
+        """Start the server."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def load(self, exchanges: list[dict[str, Any]]) -> None:
+        """Serve exchanges from now on and reset the stats."""
+        with self._lock:
+            self._exchanges = list(exchanges)
+        self.reset()
+
+    def reset(self) -> ReplayStats:
+        """Return the stats gathered so far and start counting afresh."""
+        with self._lock:
+            stats, self._stats = self._stats, ReplayStats()
+        return stats
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        """Answer request from the loaded exchanges."""
+        sent = request.rfile.read(int(request.headers.get("Content-Length") or 0))
+        if self.latency:
+            time.sleep(self.latency)
+
+        split = urlsplit(request.path)
+        host = request.headers.get(REPLAY_HOST_HEADER) or request.headers.get(
+            "Host", ""
+        )
+        query = dict(parse_qsl(split.query, keep_blank_values=True))
+
+        with self._lock:
+            self._stats.requests += 1
+            self._stats.bytes_sent += len(sent)
+            failed = self._random.random() < self.failure_rate
+            exchange = next(
+                (
+                    exchange
+                    for exchange in self._exchanges
+                    if _matches(exchange, request.command, host, split.path, query)
+                ),
+                None,
+            )
+
+        if failed:
+            status, headers, body = 503, {}, b""
+            self._count(failures=1)
+        elif exchange is None:
+            status, headers, body = 404, {}, b""
+            with self._lock:
+                self._stats.misses.append(f"{request.command} {host}{request.path}")
+        elif (etag := _header(exchange, "ETag")) and request.headers.get(
+            "If-None-Match"
+        ) == etag:
+            status, headers, body = 304, {"ETag": etag}, b""
+            self._count(not_modified=1)
+        else:
+            status = exchange.get("status", 200)
+            headers = exchange.get("headers") or {}
+            body = _body(exchange)
+
+        # Counted before answering, so the stats are complete once it arrives
+        self._count(bytes_received=len(body))
+        request.send_response(status)
+        for name, value in headers.items():
+            if name.lower() not in _HOP_HEADERS:
+                request.send_header(name, value)
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def _count(self, **counts: int) -> None:
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self._stats, name, getattr(self._stats, name) + count)
@@ -0,0 +1,168 @@
+"""Tests for the persisted address-resolution cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import requests
+
+from custom_components.afvalwijzer.collector import amsterdam, rwm
+from custom_components.afvalwijzer.common.address_cache import (
+    ADDRESS_TTL,
+    async_fetch_with_address,
+    cached_address,
+    fetch_with_address,
+    remember_address,
+)
+
+_SCHEDULE = [{"ophaaldatum": "2026-01-05", "title": "Papier"}]
+
+
+def _not_found():
+    response = MagicMock(status_code=404)
+    return requests.exceptions.HTTPError("404", response=response)
+
+
+def test_remembered_ids_expire_after_ttl():
+    """Ids older than the TTL are treated as unknown."""
+    cache = {}
+    remember_address(cache, "key", {"bag_id": "1"}, now=1000.0)
+
+    assert cached_address(cache, "key", now=1000.0) == {"bag_id": "1"}
+    assert cached_address(cache, "other", now=1000.0) is None
+    expired = 1000.0 + ADDRESS_TTL.total_seconds() + 1
+    assert cached_address(cache, "key", now=expired) is None
+
+
+def test_remember_keeps_only_the_latest_address():
+    """A config entry has one address; older keys are dropped."""
+    cache = {}
+    remember_address(cache, "old", {"bag_id": "1"})
+    remember_address(cache, "new", {"bag_id": "2"})
+    assert list(cache) == ["new"]
+
+
+def test_remembered_ids_skip_the_lookup():
+    """Only the first fetch resolves the address."""
+    cache = {}
+    resolve = MagicMock(return_value={"bag_id": "1"})
+    fetch = MagicMock(return_value=["schedule"])
+
+    assert fetch_with_address(cache, "key", resolve, fetch) == ["schedule"]
+    assert fetch_with_address(cache, "key", resolve, fetch) == ["schedule"]
+
+    resolve.assert_called_once()
+    assert fetch.call_count == 2
+
+
+@pytest.mark.parametrize("stale_result", [[], _not_found()], ids=["empty", "not_found"])
+def test_stale_ids_are_resolved_again_once(stale_result):
+    """A 404 or empty schedule for remembered ids triggers one new lookup."""
+    cache = {}
+    remember_address(cache, "key", {"bag_id": "old"})
+    resolve = MagicMock(return_value={"bag_id": "new"})
+    fetch = MagicMock(side_effect=[stale_result, ["schedule"]])
+
+    assert fetch_with_address(cache, "key", resolve, fetch) == ["schedule"]
+    assert fetch.call_args.args[0] == {"bag_id": "new"}
+    assert cached_address(cache, "key") == {"bag_id": "new"}
+
+
+def test_other_errors_keep_the_remembered_ids():
+    """Connection errors are not a reason to forget the address."""
+    cache = {}
+    remember_address(cache, "key", {"bag_id": "1"})
+    resolve = MagicMock()
+    fetch = MagicMock(side_effect=requests.exceptions.ConnectionError())
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        fetch_with_address(cache, "key", resolve, fetch)
+
+    resolve.assert_not_called()
+    assert cached_address(cache, "key") == {"bag_id": "1"}
+
+
+def test_unknown_address_returns_none():
+    """Nothing is remembered when the address does not resolve."""
+    cache = {}
+    fetch = MagicMock()
+
+    assert fetch_with_address(cache, "key", MagicMock(return_value=None), fetch) is None
+    fetch.assert_not_called()
+    assert cache == {}
+
+
+async def test_async_fetch_with_address_reuses_ids():
+    """The async variant follows the same rules."""
+    cache = {}
+    resolve = AsyncMock(return_value={"bag_id": "1"})
+    fetch = AsyncMock(return_value=["schedule"])
+
+    assert await async_fetch_with_address(cache, "key", resolve, fetch) == ["schedule"]
+    assert await async_fetch_with_address(cache, "key", resolve, fetch) == ["schedule"]
+    resolve.assert_awaited_once()
+
+
+def test_rwm_steady_state_is_a_single_request():
+    """With the address remembered, RWM only requests the schedule."""
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kwargs: MagicMock(
+        json=MagicMock(
+            return_value=[{"bagid": "0123"}] if "/adressen/1234AB" in url else _SCHEDULE
+        )
+    )
+    cache = {}
+
+    for _ in range(2):
+        assert rwm.get_waste_data_raw(
+            "rwm", "1234AB", "1", "", session=session, address_cache=cache
+        ) == [{"type": "papier", "date": "2026-01-05"}]
+
+    urls = [call.args[0] for call in session.get.call_args_list]
+    assert urls == [
+        "https://rwm.nl/adressen/1234AB:1",
+        "https://rwm.nl/rest/adressen/0123/afvalstromen",
+        "https://rwm.nl/rest/adressen/0123/afvalstromen",
+    ]
+
+
+def test_amsterdam_remembers_the_winning_variant():
+    """Later refreshes request the remembered variant only, until it fails."""
+    valid = {"huisnummertoevoeging": "a"}
+
+    def _get(url, params, **kwargs):
+        ok = valid.items() <= params.items() and "huisletter" not in params
+        return MagicMock(
+            text="x" * 300 if ok else "",
+            json=MagicMock(return_value={"params": params}),
+        )
+
+    session = MagicMock()
+    session.get.side_effect = _get
+    params_list = amsterdam._build_query_params("1234AB", "1", "a")
+    address_cache = {}
+
+    def fetch():
+        return amsterdam._fetch_waste_data_raw_temp(
+            session,
+            "https://example",
+            params_list,
+            timeout=(1, 1),
+            verify=True,
+            address_cache=address_cache,
+            cache_key="amsterdam|1234AB|1|a",
+        )
+
+    # The third variant was already requested when the second won
+    assert fetch() == {"params": params_list[1]}
+    assert session.get.call_count == 3
+
+    session.get.reset_mock()
+    assert fetch() == {"params": params_list[1]}
+    assert session.get.call_count == 1
+
+    # The remembered variant stops working: all variants are probed again
+    valid.clear()
+    valid["huisnummertoevoeging"] = "A"
+    session.get.reset_mock()
+    assert fetch() == {"params": params_list[3]}
+    assert session.get.call_count == 1 + len(params_list)
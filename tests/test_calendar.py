@@ -18,6 +18,7 @@ from custom_components.afvalwijzer.calendar import (
     _async_remove_stale_calendars,
     async_setup_entry,
 )
+from custom_components.afvalwijzer.common.schedule_index import ScheduleIndex
 from custom_components.afvalwijzer.common.sensor_utils import (
     build_device_info,
     initial_color_for_waste_type,
@@ -759,3 +760,20 @@ def test_remove_all_calendars_ignores_other_domains():
         _async_remove_all_calendars(_make_hass(), "test_entry")
 
     registry.async_remove.assert_not_called()
+
+
+def test_next_event_is_cached_until_the_index_changes():
+    """The event lookup is reused until the coordinator publishes a new index."""
+    today = date.today()
+    coordinator = SimpleNamespace(
+        config={"include_today": True, "provider": "mijnafvalwijzer"},
+        waste_data_with_today={},
+        schedule_index=ScheduleIndex([("gft", today)]),
+    )
+    calendar = AfvalwijzerCalendar(coordinator, "test_entry_id")
+
+    first = calendar.event
+    assert calendar.event is first
+
+    coordinator.schedule_index = ScheduleIndex([("papier", today)])
+    assert calendar.event.summary == "Mijnafvalwijzer: Papier"
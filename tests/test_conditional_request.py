@@ -0,0 +1,242 @@
+"""Tests for conditional (ETag / Last-Modified) schedule requests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from custom_components.afvalwijzer.collector import icalendar, mijnafvalhulp
+from custom_components.afvalwijzer.common.address_cache import (
+    address_key,
+    remember_address,
+)
+from custom_components.afvalwijzer.common.conditional_request import (
+    NotModified,
+    conditional_headers,
+    update_validators,
+)
+
+_ICAL = """BEGIN:VCALENDAR
+BEGIN:VEVENT
+DTSTART;VALUE=DATE:20260105
+SUMMARY:Papier
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def _response(status, text="", headers=None):
+    response = MagicMock()
+    response.status_code = status
+    response.text = text
+    response.iter_content.return_value = [text.encode()]
+    response.headers = headers or {}
+    return response
+
+
+def test_headers_are_only_sent_for_the_same_url():
+    """Validators of one URL are never sent to another."""
+    validators = {}
+    update_validators(
+        validators,
+        "https://a/2026",
+        {"ETag": '"abc"', "Last-Modified": "Mon, 05 Jan 2026 00:00:00 GMT"},
+    )
+
+    assert conditional_headers(validators, "https://a/2026") == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 05 Jan 2026 00:00:00 GMT",
+    }
+    assert conditional_headers(validators, "https://a/2027") == {}
+    assert conditional_headers(None, "https://a/2026") == {}
+
+
+def test_update_without_validators_forgets_old_ones():
+    """A response without validators clears the stale ones."""
+    validators = {"https://a/2026": {"etag": '"abc"'}}
+    update_validators(validators, "https://a/2026", {})
+    assert validators == {}
+
+
+def test_lowercase_validator_headers_make_the_next_request_conditional():
+    """Validators sent as etag / last-modified are remembered all the same."""
+    session = MagicMock()
+    session.get.return_value = _response(
+        200,
+        _ICAL,
+        {"etag": '"v1"', "last-modified": "Mon, 05 Jan 2026 00:00:00 GMT"},
+    )
+    validators = {}
+
+    icalendar.get_waste_data_raw(
+        "goes", "1234AB", "1", "", session=session, validators=validators
+    )
+    icalendar.get_waste_data_raw(
+        "goes", "1234AB", "1", "", session=session, validators=validators
+    )
+
+    assert session.get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 05 Jan 2026 00:00:00 GMT",
+    }
+
+
+def test_icalendar_sends_validators_and_raises_on_304():
+    """The second poll is conditional; a 304 raises NotModified."""
+    session = MagicMock()
+    session.get.return_value = _response(200, _ICAL, {"ETag": '"v1"'})
+    validators = {}
+
+    waste_data_raw = icalendar.get_waste_data_raw(
+        "goes", "1234AB", "1", "", session=session, validators=validators
+    )
+
+    assert waste_data_raw
+    assert list(validators.values()) == [{"etag": '"v1"'}]
+    assert session.get.call_args.kwargs["headers"] == {}
+
+    session.get.return_value = _response(304)
+    with pytest.raises(NotModified):
+        icalendar.get_waste_data_raw(
+            "goes", "1234AB", "1", "", session=session, validators=validators
+        )
+
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert list(validators.values()) == [{"etag": '"v1"'}]
+
+
+def test_mijnafvalhulp_logs_in_once_then_polls_the_ical_url():
+    """Steady-state refreshes are a single conditional GET of the .ics."""
+    ical_url = (
+        "https://mijn.afvalhulp.nl/api/v1/ical/"
+        "0123abcd-0123-abcd-0123-0123456789ab/calendar.ics"
+    )
+    pages = {
+        "/postcode": _response(200, '<meta name="csrf-token" content="t">'),
+        "/pickup-schedule": _response(200, f'<a href="{ical_url}">'),
+    }
+    ical = {"response": _response(200, _ICAL, {"ETag": '"v1"'})}
+
+    def _get(url, **kwargs):
+        if url == ical_url:
+            return ical["response"]
+        return pages[url.removeprefix("https://mijn.afvalhulp.nl")]
+
+    session = MagicMock()
+    session.get.side_effect = _get
+    validators, address_cache = {}, {}
+
+    def fetch():
+        return mijnafvalhulp.get_waste_data_raw(
+            "mijnafvalhulp",
+            "1234AB",
+            "1",
+            "",
+            session=session,
+            validators=validators,
+            address_cache=address_cache,
+        )
+
+    assert fetch()
+    session.post.assert_called_once()
+
+    session.get.reset_mock()
+    ical["response"] = _response(304)
+    with pytest.raises(NotModified):
+        fetch()
+    assert [c.args[0] for c in session.get.call_args_list] == [ical_url]
+    assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    # A stale iCal URL runs the login flow again
+    ical["response"] = _response(200, "<html>gone</html>")
+    pages["/pickup-schedule"] = _response(200, f'<a href="{ical_url}">')
+    assert fetch() == []
+    assert session.post.call_count == 2
+
+
+@pytest.mark.parametrize("status", [401, 403, 410])
+def test_mijnafvalhulp_scrapes_again_when_the_ical_url_expires(status):
+    """A remembered iCal URL that denies access is replaced once."""
+    old_url = (
+        "https://mijn.afvalhulp.nl/api/v1/ical/"
+        "0123abcd-0123-abcd-0123-0123456789ab/calendar.ics"
+    )
+    new_url = (
+        "https://mijn.afvalhulp.nl/api/v1/ical/"
+        "4567abcd-4567-abcd-4567-4567456745ab/calendar.ics"
+    )
+    expired = _response(status)
+    expired.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        str(status), response=expired
+    )
+    responses = {
+        "https://mijn.afvalhulp.nl/postcode": _response(
+            200, '<meta name="csrf-token" content="t">'
+        ),
+        "https://mijn.afvalhulp.nl/pickup-schedule": _response(
+            200, f'<a href="{new_url}">'
+        ),
+        old_url: expired,
+        new_url: _response(200, _ICAL),
+    }
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kwargs: responses[url]
+    address_cache = {}
+    remember_address(
+        address_cache,
+        address_key("mijnafvalhulp", "https://mijn.afvalhulp.nl", "1234AB", "1", ""),
+        {"ical_url": old_url},
+    )
+
+    waste_data_raw = mijnafvalhulp.get_waste_data_raw(
+        "mijnafvalhulp", "1234AB", "1", "", session=session, address_cache=address_cache
+    )
+
+    assert waste_data_raw
+    session.post.assert_called_once()
+    assert [entry["ids"] for entry in address_cache.values()] == [{"ical_url": new_url}]
+
+
+def test_icalendar_malformed_feed_raises_invalid_data(monkeypatch, caplog):
+    """A feed the parser chokes on is reported as invalid data."""
+
+    def _parse(*args, **kwargs):
+        raise ValueError("bad date")
+
+    monkeypatch.setattr(icalendar, "iter_ical_waste_data", _parse)
+    session = MagicMock()
+    session.get.return_value = _response(200, _ICAL)
+
+    with pytest.raises(ValueError, match="Invalid and/or no data received from"):
+        icalendar.get_waste_data_raw("goes", "1234AB", "1", "", session=session)
+    assert "iCalendar invalid and/or no data received" in caplog.text
+
+
+def test_mijnafvalhulp_malformed_feed_raises_invalid_data(monkeypatch):
+    """A calendar the parser chokes on is reported as invalid data."""
+    monkeypatch.setattr(
+        mijnafvalhulp.IcalWasteParser,
+        "feed",
+        MagicMock(side_effect=KeyError("type")),
+    )
+    ical_url = "https://mijn.afvalhulp.nl/ical/00000000-0000-0000-0000-000000000000"
+    address_cache = {}
+    remember_address(
+        address_cache,
+        address_key("mijnafvalhulp", "https://mijn.afvalhulp.nl", "1234AB", "1", ""),
+        {"ical_url": ical_url},
+    )
+    session = MagicMock()
+    session.get.return_value = _response(200, _ICAL)
+
+    with pytest.raises(
+        ValueError, match=f"Invalid and/or no data received from {ical_url}"
+    ):
+        mijnafvalhulp.get_waste_data_raw(
+            "mijnafvalhulp",
+            "1234AB",
+            "1",
+            "",
+            session=session,
+            address_cache=address_cache,
+        )
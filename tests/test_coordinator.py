@@ -4,15 +4,32 @@ from datetime import timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+from custom_components.afvalwijzer.common.pickup_event import pickup_events
+from custom_components.afvalwijzer.common.refresh_scheduler import (
+    MIN_INTERVAL,
+    RefreshScheduler,
+)
+from custom_components.afvalwijzer.common.refresh_timings import TimingsWindow
+from custom_components.afvalwijzer.common.schedule_codec import (
+    decode_schedule,
+    encode_schedule,
+)
+from custom_components.afvalwijzer.common.token_store import remember_token
 from custom_components.afvalwijzer.const.const import (
     CONF_COLLECTOR,
     CONF_HOUSE_NUMBER,
     CONF_POSTAL_CODE,
 )
 from custom_components.afvalwijzer.coordinator import (
+    CACHE_REWRITE_AGE,
     AfvalwijzerDataUpdateCoordinator,
+    _build_cache_store,
+    _migrate_v1_payload,
     async_remove_cache,
 )
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util import dt as dt_util
 
 _CONFIG = {
@@ -21,14 +38,17 @@ _CONFIG = {
     CONF_HOUSE_NUMBER: "1",
 }
 
+# The schedule as collectors return it (and version 1 caches stored it)
+_RAW_SCHEDULE = [
+    {"type": "restafval", "date": "2026-07-23"},
+    {"type": "restafval", "date": "2026-08-06"},
+]
+
 _DATA = {
     "waste_data_with_today": {"restafval": "2026-07-23"},
     "waste_data_without_today": {"restafval": "2026-07-23"},
     "waste_data_custom": {"next_date": "2026-07-23"},
-    "waste_data_raw": [
-        {"type": "restafval", "date": "2026-07-23"},
-        {"type": "restafval", "date": "2026-08-06"},
-    ],
+    "waste_data_raw": pickup_events(_RAW_SCHEDULE),
     "notification_data": ["note"],
 }
 
@@ -45,13 +65,29 @@ def _make_coordinator(config=None):
     coordinator.waste_data_custom = {}
     coordinator.waste_data_raw = []
     coordinator.notification_data = []
+    coordinator._http_validators = {}
+    coordinator._address_cache = {}
+    coordinator._token_store = {}
+    coordinator._refresh_scheduler = RefreshScheduler()
+    coordinator._digests = {}
+    coordinator.changed_keys = set()
+    coordinator.data_digest = None
+    coordinator._fetched_at = None
+    coordinator._cache_digest = None
+    coordinator._cache_saved_at = None
+    coordinator._cache_dirty = False
+    coordinator.refresh_timings = TimingsWindow()
+    coordinator._timings = None
+    coordinator._cache_timings = None
     return coordinator
 
 
 def _cache_payload(*, fetched_at=None, config=None, data=None):
+    data = dict(data or _DATA)
     payload = {
         "config": dict(config or _CONFIG),
-        "data": dict(data or _DATA),
+        "schedule": encode_schedule(data["waste_data_raw"]),
+        "notification_data": data["notification_data"],
     }
     if fetched_at is not None:
         payload["fetched_at"] = fetched_at
@@ -95,18 +131,50 @@ def test_cache_config_match_and_mismatch():
 
 
 async def test_async_load_cache_applies_fresh_cache():
-    """A fresh, matching cache is loaded and applied."""
+    """A fresh, matching cache is loaded; derived views are recomputed."""
     coordinator = _make_coordinator()
-    payload = _cache_payload(fetched_at=dt_util.utcnow().isoformat())
+    next_week = (dt_util.now() + timedelta(days=7)).date()
+    schedule = pickup_events([{"type": "restafval", "date": next_week.isoformat()}])
+    payload = _cache_payload(
+        fetched_at=dt_util.utcnow().isoformat(),
+        data={**_DATA, "waste_data_raw": schedule},
+    )
     coordinator._store = SimpleNamespace(async_load=AsyncMock(return_value=payload))
 
     assert await coordinator.async_load_cache() is True
-    assert coordinator.data == _DATA
-    assert coordinator.waste_data_with_today == _DATA["waste_data_with_today"]
-    assert coordinator.waste_data_raw == _DATA["waste_data_raw"]
+    assert coordinator.data["waste_data_raw"] == coordinator.waste_data_raw
+    assert coordinator.waste_data_with_today["restafval"].date() == next_week
+    assert coordinator.waste_data_raw[0].date == next_week
     assert coordinator.notification_data == ["note"]
 
 
+def test_v1_cache_payload_migrates_to_columnar_schedule():
+    """Version 1 caches keep their schedule, notifications and metadata."""
+    fetched_at = dt_util.utcnow().isoformat()
+    old = {
+        "config": dict(_CONFIG),
+        "fetched_at": fetched_at,
+        "data": {
+            **_DATA,
+            "waste_data_raw": [
+                {"type": "restafval", "date": "2026-07-23T00:00:00"},
+                {"type": "papier", "date": "2026-08-06T00:00:00"},
+            ],
+        },
+    }
+
+    migrated = _migrate_v1_payload(old)
+
+    assert "data" not in migrated
+    assert migrated["fetched_at"] == fetched_at
+    assert migrated["config"] == _CONFIG
+    assert migrated["notification_data"] == ["note"]
+    assert [
+        (event.type, event.date.isoformat())
+        for event in decode_schedule(migrated["schedule"])
+    ] == [("restafval", "2026-07-23"), ("papier", "2026-08-06")]
+
+
 async def test_async_load_cache_rejects_stale_cache():
     """A stale cache is ignored so a fresh fetch happens instead."""
     coordinator = _make_coordinator()
@@ -141,25 +209,258 @@ async def test_async_load_cache_survives_store_errors():
 async def test_update_data_saves_cache_with_fetched_at():
     """A successful update writes the cache including a fetch timestamp."""
     coordinator = _make_coordinator()
-
-    async def _exec(fn, *args):
-        return fn(*args)
-
-    coordinator.hass = SimpleNamespace(async_add_executor_job=_exec)
-    coordinator._fetch_data = lambda: dict(_DATA)
-    save_mock = AsyncMock()
-    coordinator._store = SimpleNamespace(async_save=save_mock)
+    coordinator._async_fetch_data = AsyncMock(return_value=dict(_DATA))
+    delay_save_mock = MagicMock()
+    coordinator._store = SimpleNamespace(async_delay_save=delay_save_mock)
 
     result = await coordinator._async_update_data()
 
     assert result == _DATA
-    save_mock.assert_awaited_once()
-    saved = save_mock.await_args.args[0]
-    assert saved["data"] == _DATA
+    delay_save_mock.assert_called_once()
+    saved = delay_save_mock.call_args.args[0]()
+    assert decode_schedule(saved["schedule"])[1].date.isoformat() == "2026-08-06"
+    assert saved["notification_data"] == ["note"]
     assert saved["config"][CONF_POSTAL_CODE] == "1234AB"
     assert dt_util.parse_datetime(saved["fetched_at"]) is not None
     # The freshly saved payload must pass its own staleness check
     assert AfvalwijzerDataUpdateCoordinator._is_cache_stale(saved) is False
+    # The change history is persisted and drives the next poll
+    assert saved["refresh"]["digest"]
+    assert coordinator.update_interval >= MIN_INTERVAL
+
+
+async def test_unchanged_refresh_does_not_rewrite_cache():
+    """Identical refreshes queue one cache write until the cache ages."""
+    coordinator = _make_coordinator()
+    coordinator._async_fetch_data = AsyncMock(return_value=dict(_DATA))
+    delay_save_mock = MagicMock()
+    coordinator._store = SimpleNamespace(async_delay_save=delay_save_mock)
+
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+    assert delay_save_mock.call_count == 1
+
+    # Changed notifications are worth a write
+    coordinator._async_fetch_data.return_value = {**_DATA, "notification_data": []}
+    await coordinator._async_update_data()
+    assert delay_save_mock.call_count == 2
+
+    # An unchanged cache is rewritten once it gets old, to keep it trusted
+    coordinator._cache_saved_at -= CACHE_REWRITE_AGE
+    await coordinator._async_update_data()
+    assert delay_save_mock.call_count == 3
+
+
+async def test_flush_cache_writes_only_pending_saves():
+    """Unload flushes a queued write, and does nothing without one."""
+    coordinator = _make_coordinator()
+    coordinator._async_fetch_data = AsyncMock(return_value=dict(_DATA))
+    save_mock = AsyncMock()
+    coordinator._store = SimpleNamespace(
+        async_delay_save=MagicMock(), async_save=save_mock
+    )
+
+    await coordinator.async_flush_cache()
+    save_mock.assert_not_awaited()
+
+    await coordinator._async_update_data()
+    await coordinator.async_flush_cache()
+    save_mock.assert_awaited_once()
+
+    await coordinator.async_flush_cache()
+    save_mock.assert_awaited_once()
+
+
+async def test_failed_refresh_retries_at_the_minimum_interval():
+    """A failure does not keep the long interval of a stable schedule."""
+    coordinator = _make_coordinator()
+    coordinator.update_interval = timedelta(hours=48)
+    coordinator._async_fetch_data = AsyncMock(side_effect=OSError("timeout"))
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert coordinator.update_interval == MIN_INTERVAL
+
+
+async def test_update_data_records_refresh_timings():
+    """Every refresh, failed or not, ends up in the timings window."""
+    coordinator = _make_coordinator()
+    coordinator._async_fetch_data = AsyncMock(return_value=dict(_DATA))
+    delay_save_mock = MagicMock()
+    coordinator._store = SimpleNamespace(async_delay_save=delay_save_mock)
+
+    await coordinator._async_update_data()
+    coordinator._async_fetch_data.side_effect = OSError("timeout")
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    summary = coordinator.refresh_timings.summary()
+    assert (summary["refreshes"], summary["failures"]) == (2, 1)
+    assert summary["last"]["success"] is False
+    assert coordinator._timings is None
+
+    # Encoding the delayed cache write is charged to the refresh queuing it
+    first = coordinator._cache_timings
+    before = first.phases["cache_save"]
+    delay_save_mock.call_args.args[0]()
+    assert first.phases["cache_save"] > before
+
+
+async def test_address_cache_is_persisted_and_restored():
+    """Resolved address ids are written with the cache and loaded back."""
+    coordinator = _make_coordinator()
+    coordinator._async_fetch_data = AsyncMock(return_value=dict(_DATA))
+    delay_save_mock = MagicMock()
+    coordinator._store = SimpleNamespace(async_delay_save=delay_save_mock)
+
+    await coordinator._async_update_data()
+    # Newly resolved ids are worth a write, even if the schedule is unchanged
+    coordinator._address_cache["opzet|1234AB|1"] = {
+        "ids": {"bag_id": "0123"},
+        "resolved_at": 1.0,
+    }
+    await coordinator._async_update_data()
+    assert delay_save_mock.call_count == 2
+
+    saved = delay_save_mock.call_args.args[0]()
+    restored = _make_coordinator()
+    restored._store = SimpleNamespace(async_load=AsyncMock(return_value=saved))
+    assert await restored.async_load_cache() is True
+    assert restored._address_cache == coordinator._address_cache
+
+
+async def test_only_durable_token_changes_rewrite_the_cache():
+    """A renewed short-lived token waits for the next write; a new login does not."""
+    coordinator = _make_coordinator()
+    coordinator._async_fetch_data = AsyncMock(return_value=dict(_DATA))
+    delay_save_mock = MagicMock()
+    coordinator._store = SimpleNamespace(async_delay_save=delay_save_mock)
+
+    await coordinator._async_update_data()
+    remember_token(coordinator._token_store, "id_token", "i1", durable=False)
+    await coordinator._async_update_data()
+    assert delay_save_mock.call_count == 1
+
+    remember_token(coordinator._token_store, "refresh_token", "r1")
+    await coordinator._async_update_data()
+    assert delay_save_mock.call_count == 2
+    saved = delay_save_mock.call_args.args[0]()
+    assert saved["tokens"]["refresh_token"]["value"] == "r1"
+    assert saved["tokens"]["id_token"]["value"] == "i1"
+
+
+async def test_fetch_runs_sync_collectors_in_executor():
+    """Collectors without an async port still run in an executor thread."""
+    coordinator = _make_coordinator({**_CONFIG, CONF_COLLECTOR: "rova"})
+    executor_mock = AsyncMock(return_value=dict(_DATA))
+    coordinator.hass = SimpleNamespace(async_add_executor_job=executor_mock)
+
+    with patch(
+        "custom_components.afvalwijzer.coordinator.MainCollector.async_create"
+    ) as create_mock:
+        assert await coordinator._async_fetch_data() == _DATA
+
+    executor_mock.assert_awaited_once_with(coordinator._fetch_data)
+    create_mock.assert_not_called()
+
+
+async def test_fetch_uses_async_collector_when_available():
+    """Ported collectors run on the event loop with HA's shared aiohttp session."""
+    coordinator = _make_coordinator()
+    executor_mock = AsyncMock()
+    coordinator.hass = SimpleNamespace(async_add_executor_job=executor_mock)
+    collector = SimpleNamespace(
+        waste_data_with_today=_DATA["waste_data_with_today"],
+        waste_data_without_today=_DATA["waste_data_without_today"],
+        waste_data_custom=_DATA["waste_data_custom"],
+        waste_data_raw=_DATA["waste_data_raw"],
+        notification_data=_DATA["notification_data"],
+    )
+    websession = MagicMock()
+
+    with (
+        patch(
+            "custom_components.afvalwijzer.coordinator.async_get_clientsession",
+            return_value=websession,
+        ),
+        patch(
+            "custom_components.afvalwijzer.coordinator.MainCollector.async_create",
+            AsyncMock(return_value=collector),
+        ) as create_mock,
+    ):
+        assert await coordinator._async_fetch_data() == _DATA
+
+    executor_mock.assert_not_awaited()
+    assert create_mock.await_args.args[0] == "mijnafvalwijzer"
+    assert create_mock.await_args.kwargs["websession"] is websession
+
+
+async def test_recompute_rederives_views_without_fetching():
+    """The day-boundary recompute uses the cached schedule only."""
+    coordinator = _make_coordinator()
+    next_week = dt_util.now().replace(tzinfo=None) + timedelta(days=7)
+    coordinator.waste_data_raw = pickup_events(
+        [{"type": "papier", "date": next_week.strftime("%Y-%m-%d")}]
+    )
+    coordinator.notification_data = ["note"]
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_update_listeners = MagicMock()
+    coordinator._async_fetch_data = AsyncMock()
+
+    await coordinator.async_recompute()
+
+    coordinator._async_fetch_data.assert_not_awaited()
+    coordinator.async_request_refresh.assert_not_awaited()
+    coordinator.async_update_listeners.assert_called_once()
+    assert coordinator.waste_data_with_today["papier"].date() == next_week.date()
+    assert coordinator.data["notification_data"] == ["note"]
+
+
+async def test_recompute_without_schedule_falls_back_to_refresh():
+    """Without a cached schedule the recompute requests a normal refresh."""
+    coordinator = _make_coordinator()
+    coordinator.async_request_refresh = AsyncMock()
+
+    await coordinator.async_recompute()
+
+    coordinator.async_request_refresh.assert_awaited_once()
+
+
+def test_apply_data_reports_changed_keys():
+    """Only the sensor keys whose derived data changed are reported."""
+    coordinator = _make_coordinator()
+    coordinator._apply_data(dict(_DATA))
+    first_digest = coordinator.data_digest
+    assert {"restafval", "next_date", "notifications"} <= coordinator.changed_keys
+
+    coordinator._apply_data(dict(_DATA))
+    assert coordinator.changed_keys == set()
+    assert coordinator.data_digest == first_digest
+
+    coordinator._apply_data({**_DATA, "notification_data": []})
+    assert coordinator.changed_keys == {"notifications"}
+    assert coordinator.has_changed("notifications")
+    assert not coordinator.has_changed("restafval")
+
+
+async def test_store_migrates_v1_cache_on_load(hass, hass_storage):
+    """The real Store runs the v1 -> v2 migration when loading."""
+    hass_storage["afvalwijzer_entry.cache"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "afvalwijzer_entry.cache",
+        "data": {
+            "config": dict(_CONFIG),
+            "fetched_at": dt_util.utcnow().isoformat(),
+            "data": {**_DATA, "waste_data_raw": _RAW_SCHEDULE},
+        },
+    }
+
+    loaded = await _build_cache_store(hass, "entry").async_load()
+
+    assert "data" not in loaded
+    assert decode_schedule(loaded["schedule"])[0].type == "restafval"
 
 
 async def test_async_remove_cache_removes_store():
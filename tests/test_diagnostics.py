@@ -0,0 +1,88 @@
+"""Tests for the Afvalwijzer diagnostics and refresh timing sensors."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from custom_components.afvalwijzer.common.refresh_timings import (
+    RefreshTimings,
+    TimingsWindow,
+)
+from custom_components.afvalwijzer.const.const import (
+    CONF_COLLECTOR,
+    CONF_HOUSE_NUMBER,
+    CONF_POSTAL_CODE,
+    DOMAIN,
+)
+from custom_components.afvalwijzer.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.afvalwijzer.sensor_diagnostic import (
+    METRICS,
+    RefreshTimingSensor,
+)
+from homeassistant.const import EntityCategory
+
+_CONFIG = {
+    CONF_COLLECTOR: "mijnafvalwijzer",
+    CONF_POSTAL_CODE: "1234AB",
+    CONF_HOUSE_NUMBER: "1",
+}
+
+
+def _coordinator():
+    window = TimingsWindow()
+    for requests in (1, 2, 3):
+        timings = RefreshTimings()
+        timings.add_phase("schedule", 0.2)
+        for _ in range(requests):
+            timings.add_response(1000)
+        timings.finish(success=True)
+        window.add(timings)
+    return SimpleNamespace(
+        refresh_timings=window,
+        last_update_success=True,
+        update_interval=timedelta(hours=1),
+        waste_data_raw=[object(), object()],
+        notification_data=[],
+        waste_data_with_today={"restafval": None, "gft": None},
+    )
+
+
+async def test_diagnostics_redact_the_address_and_hold_timings():
+    """The download holds the timings summary, but not the address."""
+    coordinator = _coordinator()
+    entry = SimpleNamespace(entry_id="entry", data=dict(_CONFIG), options={})
+    hass = SimpleNamespace(
+        data={DOMAIN: {"entry": {"coordinator": coordinator, "config": _CONFIG}}}
+    )
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"][CONF_POSTAL_CODE] == "**REDACTED**"
+    assert diagnostics["entry"]["data"][CONF_COLLECTOR] == "mijnafvalwijzer"
+    assert diagnostics["coordinator"]["update_interval"] == 3600
+    assert diagnostics["coordinator"]["waste_types"] == ["gft", "restafval"]
+    assert diagnostics["refresh_timings"]["refreshes"] == 3
+    assert diagnostics["refresh_timings"]["phases_ms"]["schedule"]["p50"] == 200.0
+
+
+def test_refresh_timing_sensors_report_the_window():
+    """The sensors are disabled diagnostics reporting the p50 as state."""
+    coordinator = _coordinator()
+    sensors = {
+        key: RefreshTimingSensor(None, key, coordinator, _CONFIG) for key in METRICS
+    }
+    for sensor in sensors.values():
+        sensor._summary = coordinator.refresh_timings.summary()
+        assert sensor.entity_category == EntityCategory.DIAGNOSTIC
+        assert sensor.entity_registry_enabled_default is False
+
+    assert sensors["refresh_requests"].native_value == 2
+    assert sensors["refresh_requests"].extra_state_attributes["p95"] == 3
+    assert sensors["refresh_response_size"].native_value == 2000
+    duration = sensors["refresh_duration"].extra_state_attributes
+    assert duration["schedule_p50"] == 200.0
+    assert duration["refreshes"] == 3
+    assert sensors["refresh_duration"].entity_id == (
+        "sensor.afvalwijzer_1234ab_1_refresh_duration"
+    )
@@ -0,0 +1,146 @@
+"""Tests for the happy-eyeballs connector used by Ximmio."""
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from urllib3.util import connection as urllib3_connection
+
+from custom_components.afvalwijzer.common.dual_stack import (
+    AddressFamilies,
+    DualStackAdapter,
+    _interleave,
+    happy_eyeballs_connect,
+)
+from custom_components.afvalwijzer.common.session_pool import SessionPool
+
+# These tests open real (loopback only) sockets
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+def _info(family, address):
+    return (family, socket.SOCK_STREAM, 6, "", address)
+
+
+@pytest.fixture
+def listener():
+    """Return a listening IPv4 socket on a free local port."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    yield server
+    server.close()
+
+
+def _closed_port():
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
+
+
+def test_interleave_alternates_families():
+    """Attempts alternate families, starting with the preferred one."""
+    v6 = [_info(socket.AF_INET6, (f"::{i}", 80, 0, 0)) for i in (1, 2)]
+    v4 = [_info(socket.AF_INET, (f"10.0.0.{i}", 80)) for i in (1, 2)]
+
+    ordered = _interleave(v6 + v4, socket.AF_INET)
+    assert [info[0] for info in ordered] == [
+        socket.AF_INET,
+        socket.AF_INET6,
+        socket.AF_INET,
+        socket.AF_INET6,
+    ]
+
+
+def test_failed_address_falls_through_to_the_next(listener):
+    """A refused address does not cost a timeout; the next one is tried."""
+    port = listener.getsockname()[1]
+    infos = [
+        _info(socket.AF_INET, ("127.0.0.1", _closed_port())),
+        _info(socket.AF_INET, ("127.0.0.1", port)),
+    ]
+
+    with patch("socket.getaddrinfo", return_value=infos):
+        sock = happy_eyeballs_connect(("example", port), 5.0)
+    with sock:
+        assert sock.getpeername()[1] == port
+        assert sock.gettimeout() == 5.0
+
+
+def test_every_address_failing_raises():
+    """The last connect error is raised when nothing answers."""
+    infos = [_info(socket.AF_INET, ("127.0.0.1", _closed_port()))]
+    with (
+        patch("socket.getaddrinfo", return_value=infos),
+        pytest.raises(OSError),
+    ):
+        happy_eyeballs_connect(("example", 80), 5.0)
+
+
+def test_families_remember_the_winner_per_host(listener):
+    """A host whose IPv6 address fails is tried over IPv4 first afterwards."""
+    port = listener.getsockname()[1]
+    infos = [
+        _info(socket.AF_INET6, ("::1", _closed_port(), 0, 0)),
+        _info(socket.AF_INET, ("127.0.0.1", port)),
+    ]
+    families = AddressFamilies(default_family=socket.AF_INET6)
+
+    with patch("socket.getaddrinfo", return_value=infos):
+        families.connect(("example", port), 5.0).close()
+
+    assert families.get("example") == socket.AF_INET
+    assert families.get("other") == socket.AF_INET6
+
+
+def test_adapter_serves_requests_without_global_changes():
+    """Requests go through the adapter; urllib3's global family is untouched."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    original = urllib3_connection.allowed_gai_family
+    try:
+        adapter = DualStackAdapter()
+        # Sent through the adapter directly: Session.request is blocked in tests
+        request = requests.Request(
+            "POST", f"http://127.0.0.1:{server.server_port}/api"
+        ).prepare()
+        response = adapter.send(request, timeout=5)
+
+        assert response.json() == {}
+        assert adapter.families.get("127.0.0.1") == socket.AF_INET
+        assert urllib3_connection.allowed_gai_family is original
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_session_pool_owns_the_ximmio_adapter():
+    """Pooled sessions reach the Ximmio hosts over the pool's dual-stack adapter."""
+    pool = SessionPool()
+    first, second = pool.session(), pool.session()
+
+    adapter = first.get_adapter("https://wasteapi.ximmio.com/api/GetAddress")
+    assert isinstance(adapter, DualStackAdapter)
+    assert adapter is second.get_adapter("https://wasteprod2api.ximmio.com/api/")
+    assert not isinstance(first.get_adapter("https://example.nl/"), DualStackAdapter)
+
+    adapter.close = MagicMock()
+    pool.close()
+    adapter.close.assert_called_once()
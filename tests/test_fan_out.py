@@ -0,0 +1,188 @@
+"""Tests for overlapping the independent sub-requests of a refresh."""
+
+from datetime import timedelta
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.afvalwijzer.collector import amsterdam, main_collector
+from custom_components.afvalwijzer.collector.main_collector import MainCollector
+from custom_components.afvalwijzer.common.address_cache import remember_address
+from custom_components.afvalwijzer.common.fan_out import (
+    first_accepted,
+    run_concurrently,
+)
+from homeassistant.util import dt as dt_util
+
+
+def _slow(value, delay=0.2):
+    def _call():
+        time.sleep(delay)
+        return value
+
+    return _call
+
+
+def test_run_concurrently_overlaps_calls_and_keeps_order():
+    """Latency is that of the slowest call; results keep call order."""
+    start = time.monotonic()
+    results = run_concurrently(_slow("a"), _slow("b"), _slow("c", delay=0.05))
+
+    assert results == ["a", "b", "c"]
+    assert time.monotonic() - start < 0.35
+
+
+def test_run_concurrently_raises_the_earliest_error():
+    """Errors surface in call order, as with serial calls."""
+
+    def _fail(message):
+        def _call():
+            raise ValueError(message)
+
+        return _call
+
+    with pytest.raises(ValueError, match="first"):
+        run_concurrently(_fail("first"), _fail("second"))
+
+
+def test_first_accepted_prefers_earlier_calls():
+    """A faster but later result loses to an earlier accepted one."""
+    result = first_accepted(
+        [_slow(None, delay=0.05), _slow("preferred"), _slow("fast", delay=0)],
+        lambda value: value is not None,
+    )
+    assert result == "preferred"
+    assert first_accepted([_slow(None, delay=0)], bool) is None
+
+
+def test_amsterdam_tries_suffix_variants_with_one_ahead():
+    """The next variant is in flight with the current one, never more."""
+    seen = []
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+    second_started = threading.Event()
+
+    def _get(url, params, **kwargs):
+        with lock:
+            seen.append(params)
+            in_flight.append(params)
+            peak.append(len(in_flight))
+            if len(seen) == 2:
+                second_started.set()
+        # The first variant only answers once the next one is on its way
+        assert second_started.wait(timeout=5)
+        with lock:
+            in_flight.remove(params)
+        # Only the variants without huisletter find the address
+        return MagicMock(
+            text="" if "huisletter" in params else "x" * 300,
+            json=MagicMock(return_value={"params": params}),
+        )
+
+    session = MagicMock()
+    session.get.side_effect = _get
+    params_list = amsterdam._build_query_params("1234AB", "1", "a")
+
+    data = amsterdam._fetch_waste_data_raw_temp(
+        session, "https://example", params_list, timeout=(1, 1), verify=True
+    )
+
+    assert data == {"params": params_list[1]}
+    # The third variant was started ahead once the first was rejected
+    assert len(seen) == 3
+    assert all(params in seen for params in params_list[:3])
+    assert max(peak) == 2
+
+
+def test_first_accepted_waits_for_the_call_started_ahead():
+    """No call is left running once first_accepted returns."""
+    finished = []
+
+    def _call(value, delay):
+        def _run():
+            time.sleep(delay)
+            finished.append(value)
+            return value
+
+        return _run
+
+    result = first_accepted([_call("first", 0), _call("ahead", 0.1)], bool)
+
+    assert result == "first"
+    assert finished == ["first", "ahead"]
+
+
+def _opzet_collector(**kwargs):
+    return MainCollector(
+        "alphenaandenrijn",
+        "1234AB",
+        "1",
+        "",
+        "",
+        exclude_pickup_today="False",
+        exclude_list="",
+        default_label="geen",
+        **kwargs,
+    )
+
+
+def test_opzet_schedule_and_notifications_overlap():
+    """With the address ids known, the notifications don't wait for the schedule."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    both_started = threading.Barrier(2, timeout=5)
+
+    def _waste(*args, **kwargs):
+        both_started.wait()
+        return [{"type": "papier", "date": next_week}]
+
+    def _notifications(*args, **kwargs):
+        both_started.wait()
+        return [{"id": 1}]
+
+    with (
+        patch.object(main_collector.opzet, "get_waste_data_raw", _waste),
+        patch.object(
+            main_collector,
+            "NOTIFICATION_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_OPZET, _notifications)],
+        ),
+    ):
+        address_cache = {}
+        remember_address(address_cache, "opzet|1234AB|1", {"bag_id": "0123"})
+        collector = _opzet_collector(address_cache=address_cache)
+
+    assert collector.waste_types_provider == ["papier"]
+    assert collector.notification_data == [{"id": 1}]
+
+
+def test_opzet_notifications_wait_for_a_cold_address_lookup():
+    """Without remembered ids the address is resolved once, by the schedule."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    calls = []
+
+    def _waste(*args, address_cache, **kwargs):
+        calls.append("schedule")
+        remember_address(address_cache, "opzet|1234AB|1", {"bag_id": "0123"})
+        return [{"type": "papier", "date": next_week}]
+
+    def _notifications(*args, address_cache, **kwargs):
+        calls.append(("notifications", dict(address_cache)))
+        return [{"id": 1}]
+
+    with (
+        patch.object(main_collector.opzet, "get_waste_data_raw", _waste),
+        patch.object(
+            main_collector,
+            "NOTIFICATION_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_OPZET, _notifications)],
+        ),
+    ):
+        collector = _opzet_collector()
+
+    assert calls[0] == "schedule"
+    assert calls[1][0] == "notifications"
+    assert "opzet|1234AB|1" in calls[1][1]
+    assert collector.notification_data == [{"id": 1}]
@@ -3,6 +3,7 @@
 from datetime import timedelta
 from unittest.mock import patch
 
+from custom_components.afvalwijzer.collector import main_collector
 from custom_components.afvalwijzer.collector.main_collector import MainCollector
 from homeassistant.util import dt as dt_util
 
@@ -17,9 +18,15 @@ def test_main_collector_happy_flow():
         {"type": "papier", "date": next_week},
     ]
 
-    with patch(
-        "custom_components.afvalwijzer.collector.mijnafvalwijzer.get_waste_data_raw",
-        return_value=sample_raw,
+    with patch.object(
+        main_collector,
+        "COMBINED_PROVIDERS",
+        [
+            (
+                main_collector.SENSOR_COLLECTORS_MIJNAFVALWIJZER,
+                lambda *args, **kwargs: (sample_raw, []),
+            )
+        ],
     ):
         collector = MainCollector(
             "mijnafvalwijzer",
@@ -0,0 +1,74 @@
+"""Tests for the incremental iCal waste calendar parser."""
+
+from datetime import date
+
+from custom_components.afvalwijzer.common.ical_parser import (
+    IcalWasteParser,
+    iter_ical_waste_data,
+    parse_ical_waste_data,
+)
+
+
+def _event(day, summary="Papier"):
+    return f"BEGIN:VEVENT\r\nDTSTART;VALUE=DATE:{day}\r\nSUMMARY:{summary}\r\nEND:VEVENT\r\n"
+
+
+def _calendar(*events):
+    return "BEGIN:VCALENDAR\r\n" + "".join(events) + "END:VCALENDAR\r\n"
+
+
+def test_folded_lines_are_unfolded():
+    """A SUMMARY folded over several lines is read as one value."""
+    feed = (
+        "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nDTSTART:20260105\r\n"
+        "SUMMARY:Groente, fruit\r\n - en tuinaf\r\n\tval\r\nEND:VEVENT\r\nEND:VCALENDAR"
+    )
+    parser = IcalWasteParser()
+    pickups = parser.feed(feed) + parser.close()
+
+    assert pickups == [{"type": "gft", "date": "2026-01-05"}]
+    assert parser.calendar_seen is True
+
+
+def test_chunk_boundaries_do_not_matter():
+    """Lines, CRLFs and multi-byte characters may be split across chunks."""
+    feed = _calendar(_event("20260105", "Pápier"), _event("20260112")).encode()
+    expected = parse_ical_waste_data(feed.decode())
+
+    one_byte_chunks = [feed[i : i + 1] for i in range(len(feed))]
+    assert list(iter_ical_waste_data(one_byte_chunks)) == expected
+    assert len(expected) == 2
+
+
+def test_pickups_beyond_the_horizon_are_dropped():
+    """Only pickups up to and including the horizon are kept."""
+    feed = _calendar(_event("20260105"), _event("20270105"), _event("20260301"))
+
+    pickups = list(iter_ical_waste_data([feed], horizon=date(2026, 3, 1)))
+    assert [p["date"] for p in pickups] == ["2026-01-05", "2026-03-01"]
+
+
+def test_nested_components_do_not_leak_into_the_event():
+    """A VALARM's properties do not overwrite the event's."""
+    feed = _calendar(
+        "BEGIN:VEVENT\r\nSUMMARY:Papier\r\nDTSTART:20260105\r\n"
+        "BEGIN:VALARM\r\nSUMMARY:Reminder\r\nEND:VALARM\r\nEND:VEVENT\r\n"
+    )
+    assert parse_ical_waste_data(feed) == [{"type": "papier", "date": "2026-01-05"}]
+
+
+def test_pickups_are_yielded_while_the_feed_is_read():
+    """Events come out as soon as they are complete, not after the last chunk."""
+    consumed = []
+
+    def _chunks():
+        yield b"BEGIN:VCALENDAR\r\n"
+        for day in range(1, 29):
+            consumed.append(day)
+            yield _event(f"202602{day:02d}").encode()
+        yield b"END:VCALENDAR\r\n"
+
+    pickups = iter_ical_waste_data(_chunks())
+    assert next(pickups)["date"] == "2026-02-01"
+    assert len(consumed) <= 2
+    assert len(list(pickups)) == 27
@@ -0,0 +1,141 @@
+"""Tests for RRULE / RDATE / EXDATE expansion of iCal waste events."""
+
+from datetime import date
+
+import pytest
+
+from custom_components.afvalwijzer.common.ical_parser import iter_ical_waste_data
+from custom_components.afvalwijzer.common.ical_recurrence import iter_occurrences
+
+_END_OF_2026 = date(2026, 12, 31)
+
+
+def test_every_other_week_on_the_start_weekday():
+    """A bi-weekly rule yields every second Tuesday."""
+    dates = iter_occurrences(
+        date(2026, 1, 6), "FREQ=WEEKLY;INTERVAL=2", until=date(2026, 2, 28)
+    )
+    assert [d.day for d in dates] == [6, 20, 3, 17]
+
+
+def test_weekly_byday_and_count():
+    """BYDAY picks several weekdays; COUNT limits the total."""
+    dates = list(
+        iter_occurrences(
+            date(2026, 1, 5), "FREQ=WEEKLY;BYDAY=MO,TH;COUNT=5", until=_END_OF_2026
+        )
+    )
+    assert dates == [
+        date(2026, 1, 5),
+        date(2026, 1, 8),
+        date(2026, 1, 12),
+        date(2026, 1, 15),
+        date(2026, 1, 19),
+    ]
+
+
+def test_monthly_last_friday_until():
+    """An ordinal BYDAY picks the last Friday of each month up to UNTIL."""
+    dates = iter_occurrences(
+        date(2026, 1, 30),
+        "FREQ=MONTHLY;BYDAY=-1FR;UNTIL=20260430T000000Z",
+        until=_END_OF_2026,
+    )
+    assert list(dates) == [
+        date(2026, 1, 30),
+        date(2026, 2, 27),
+        date(2026, 3, 27),
+        date(2026, 4, 24),
+    ]
+
+
+def test_exdates_are_skipped_and_rdates_added():
+    """EXDATE removes an occurrence, RDATE adds one in date order."""
+    dates = iter_occurrences(
+        date(2026, 1, 1),
+        "FREQ=MONTHLY",
+        rdates=[date(2026, 2, 14)],
+        exdates=[date(2026, 3, 1)],
+        until=date(2026, 4, 30),
+    )
+    assert list(dates) == [
+        date(2026, 1, 1),
+        date(2026, 2, 1),
+        date(2026, 2, 14),
+        date(2026, 4, 1),
+    ]
+
+
+def test_open_ended_rules_stop_at_the_window():
+    """An endless rule is expanded lazily and only within since..until."""
+    dates = iter_occurrences(
+        date(2000, 1, 3),
+        "FREQ=WEEKLY",
+        since=date(2026, 1, 1),
+        until=date(2026, 1, 31),
+    )
+    assert [d.day for d in dates] == [5, 12, 19, 26]
+
+
+def test_unsupported_rule_only_occurs_on_dtstart():
+    """A rule with unknown parts is not guessed at."""
+    dates = iter_occurrences(
+        date(2026, 1, 5), "FREQ=WEEKLY;BYSETPOS=1", until=_END_OF_2026
+    )
+    assert list(dates) == [date(2026, 1, 5)]
+
+
+def test_recurring_feed_expands_to_pickups():
+    """One recurring VEVENT becomes one pickup per occurrence in the window."""
+    feed = (
+        "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:Papier\r\n"
+        "DTSTART;VALUE=DATE:20260105\r\nRRULE:FREQ=WEEKLY;INTERVAL=4\r\n"
+        "EXDATE;VALUE=DATE:20260202,20260302\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+    )
+    pickups = list(
+        iter_ical_waste_data([feed], since=date(2026, 1, 10), horizon=date(2026, 4, 30))
+    )
+    assert pickups == [
+        {"type": "papier", "date": "2026-03-30"},
+        {"type": "papier", "date": "2026-04-27"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "FREQ=YEARLY;BYMONTH=13",
+        "FREQ=YEARLY;BYMONTH=0",
+        "FREQ=MONTHLY;BYMONTHDAY=32",
+        "FREQ=MONTHLY;BYMONTHDAY=-32,1",
+        "FREQ=MONTHLY;BYMONTHDAY=0",
+        "FREQ=WEEKLY;BYDAY=XX",
+        "FREQ=WEEKLY;BYDAY=MO,XX",
+        "FREQ=MONTHLY;BYDAY=0FR",
+        "FREQ=MONTHLY;BYDAY=54FR",
+    ],
+)
+def test_out_of_range_rule_values_are_unsupported(rule, caplog):
+    """Rule values out of range reject the rule instead of guessing at it."""
+    dates = iter_occurrences(date(2026, 1, 5), rule, until=_END_OF_2026)
+
+    assert list(dates) == [date(2026, 1, 5)]
+    assert "Unsupported iCal recurrence rule" in caplog.text
+
+
+def test_feed_with_an_invalid_rule_keeps_its_other_events():
+    """One bad recurring event does not fail the rest of the feed."""
+    feed = (
+        "BEGIN:VCALENDAR\r\n"
+        "BEGIN:VEVENT\r\nDTSTART;VALUE=DATE:20260105\r\n"
+        "RRULE:FREQ=YEARLY;BYMONTH=13\r\nSUMMARY:GFT\r\nEND:VEVENT\r\n"
+        "BEGIN:VEVENT\r\nDTSTART;VALUE=DATE:20260107\r\n"
+        "SUMMARY:Papier\r\nEND:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    )
+
+    pickups = list(
+        iter_ical_waste_data([feed], since=date(2026, 1, 1), horizon=_END_OF_2026)
+    )
+
+    assert [pickup["date"] for pickup in pickups] == ["2026-01-05", "2026-01-07"]
@@ -1,4 +1,4 @@
-"""Tests for the midnight refresh scheduling in async_setup_entry."""
+"""Tests for the midnight recompute scheduling in async_setup_entry."""
 
 from datetime import timedelta
 from unittest.mock import AsyncMock
@@ -49,6 +49,10 @@ async def _setup_entry_with_mocks(hass, monkeypatch):
     monkeypatch.setattr(
         AfvalwijzerDataUpdateCoordinator, "async_request_refresh", refresh_mock
     )
+    recompute_mock = AsyncMock()
+    monkeypatch.setattr(
+        AfvalwijzerDataUpdateCoordinator, "async_recompute", recompute_mock
+    )
     monkeypatch.setattr(
         hass.config_entries, "async_forward_entry_setups", AsyncMock(return_value=True)
     )
@@ -56,7 +60,7 @@ async def _setup_entry_with_mocks(hass, monkeypatch):
     assert await async_setup_entry(hass, entry) is True
     await hass.async_block_till_done()
 
-    return entry, refresh_mock
+    return entry, refresh_mock, recompute_mock
 
 
 async def _teardown_entry(hass, entry):
@@ -65,20 +69,24 @@ async def _teardown_entry(hass, entry):
     await hass.async_block_till_done()
 
 
-async def test_midnight_refresh_requests_coordinator_refresh(hass, monkeypatch):
-    """The midnight trigger schedules a jittered coordinator refresh."""
-    entry, refresh_mock = await _setup_entry_with_mocks(hass, monkeypatch)
+async def test_midnight_recomputes_from_cache_without_refresh(hass, monkeypatch):
+    """At midnight the sensors are re-derived locally, without a fetch."""
+    entry, refresh_mock, recompute_mock = await _setup_entry_with_mocks(
+        hass, monkeypatch
+    )
     baseline_calls = refresh_mock.await_count
 
     midnight = dt_util.start_of_local_day() + timedelta(days=1)
     async_fire_time_changed(hass, midnight)
     await hass.async_block_till_done()
 
-    # The refresh happens after a randomized jitter of at most 600 seconds
+    # The recompute happens right at the day boundary, without jitter
+    recompute_mock.assert_awaited_once()
+
     async_fire_time_changed(hass, midnight + timedelta(seconds=601))
     await hass.async_block_till_done()
 
-    assert refresh_mock.await_count == baseline_calls + 1
+    assert refresh_mock.await_count == baseline_calls
 
     await _teardown_entry(hass, entry)
 
@@ -89,7 +97,7 @@ async def test_midnight_scheduling_does_not_leak_unload_callbacks(hass, monkeypa
     Regression test: every midnight used to register a fresh
     async_on_unload callback, growing unboundedly over the entry's life.
     """
-    entry, _ = await _setup_entry_with_mocks(hass, monkeypatch)
+    entry, _, _ = await _setup_entry_with_mocks(hass, monkeypatch)
     baseline = len(entry._on_unload)
 
     midnight = dt_util.start_of_local_day() + timedelta(days=1)
@@ -1,6 +1,21 @@
-"""Tests for MainCollector.provider_supports_notifications in main_collector.py."""
+"""Tests for MainCollector provider capability checks and dispatch."""
 
+import asyncio
+from datetime import timedelta
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.afvalwijzer.collector import main_collector
 from custom_components.afvalwijzer.collector.main_collector import MainCollector
+from custom_components.afvalwijzer.common.address_cache import (
+    cached_address,
+    remember_address,
+)
+from custom_components.afvalwijzer.common.conditional_request import NotModified
+from custom_components.afvalwijzer.common.pickup_event import PickupEvent
+from homeassistant.util import dt as dt_util
 
 
 def test_opzet_provider_supports_notifications():
@@ -31,3 +46,439 @@ def test_provider_supports_notifications_is_case_and_whitespace_insensitive():
 def test_provider_supports_notifications_handles_none():
     """A missing provider (e.g. unset config) does not raise."""
     assert MainCollector.provider_supports_notifications(None) is False
+
+
+def test_provider_supports_async():
+    """Ported collectors report async support, the rest fall back to sync."""
+    assert MainCollector.provider_supports_async("mijnafvalwijzer") is True
+    assert MainCollector.provider_supports_async(" Cyclus ") is True
+    assert MainCollector.provider_supports_async("rova") is False
+    assert MainCollector.provider_supports_async(None) is False
+
+
+async def test_async_create_uses_async_getters():
+    """async_create fetches waste and notifications through the async getters."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    waste_getter = AsyncMock(return_value=[{"type": "papier", "date": next_week}])
+    notification_getter = AsyncMock(return_value=[{"id": 1}])
+    websession = MagicMock()
+
+    with (
+        patch.object(
+            main_collector,
+            "ASYNC_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_RD4, waste_getter)],
+        ),
+        patch.object(
+            main_collector,
+            "ASYNC_NOTIFICATION_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_RD4, notification_getter)],
+        ),
+    ):
+        collector = await MainCollector.async_create(
+            "rd4",
+            "1234ab",
+            "1",
+            "",
+            "",
+            exclude_pickup_today="False",
+            exclude_list="",
+            default_label="geen",
+            websession=websession,
+        )
+
+    waste_getter.assert_awaited_once_with("rd4", "1234AB", "1", "", session=websession)
+    assert collector.waste_types_provider == ["papier"]
+    assert collector.notification_data == [{"id": 1}]
+
+
+async def test_async_create_uses_one_combined_request():
+    """Schedule and notifications of a combined provider come from one call."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    combined_getter = AsyncMock(
+        return_value=([{"type": "papier", "date": next_week}], [{"id": 1}])
+    )
+    notification_getter = AsyncMock(return_value=[])
+    websession = MagicMock()
+
+    with (
+        patch.object(
+            main_collector,
+            "ASYNC_COMBINED_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_MIJNAFVALWIJZER, combined_getter)],
+        ),
+        patch.object(
+            main_collector,
+            "ASYNC_NOTIFICATION_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_MIJNAFVALWIJZER, notification_getter)],
+        ),
+    ):
+        collector = await MainCollector.async_create(
+            "mijnafvalwijzer",
+            "1234ab",
+            "1",
+            "",
+            "",
+            exclude_pickup_today="False",
+            exclude_list="",
+            default_label="geen",
+            websession=websession,
+        )
+
+    combined_getter.assert_awaited_once_with(
+        "mijnafvalwijzer", "1234AB", "1", "", session=websession
+    )
+    notification_getter.assert_not_awaited()
+    assert collector.waste_types_provider == ["papier"]
+    assert collector.notification_data == [{"id": 1}]
+
+
+def test_combined_provider_is_fetched_once():
+    """The sync path also reads the notifications from the schedule fetch."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    combined_getter = MagicMock(
+        return_value=([{"type": "papier", "date": next_week}], [{"id": 1}])
+    )
+    notification_getter = MagicMock(return_value=[])
+
+    with (
+        patch.object(
+            main_collector,
+            "COMBINED_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_MIJNAFVALWIJZER, combined_getter)],
+        ),
+        patch.object(
+            main_collector,
+            "NOTIFICATION_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_MIJNAFVALWIJZER, notification_getter)],
+        ),
+    ):
+        collector = _make_collector("mijnafvalwijzer")
+
+    combined_getter.assert_called_once()
+    notification_getter.assert_not_called()
+    assert collector.notification_data == [{"id": 1}]
+
+
+def _make_collector(provider, house_number="1"):
+    return MainCollector(
+        provider,
+        "1234AB",
+        house_number,
+        "",
+        "",
+        exclude_pickup_today="False",
+        exclude_list="",
+        default_label="geen",
+    )
+
+
+def test_aliases_of_one_endpoint_share_an_in_flight_fetch():
+    """Concurrent refreshes for aliases of one OPZET host fetch only once."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    release = threading.Event()
+    calls = []
+
+    def _fetch(provider, *args, **kwargs):
+        calls.append(provider)
+        release.wait(timeout=5)
+        return [{"type": "papier", "date": next_week}]
+
+    collectors = []
+    with (
+        patch.object(main_collector.opzet, "get_waste_data_raw", _fetch),
+        patch.object(
+            main_collector.opzet, "get_notification_data_raw", return_value=[]
+        ),
+    ):
+        threads = [
+            threading.Thread(target=lambda p=p: collectors.append(_make_collector(p)))
+            for p in ("cyclus", "montfoort", "uithoorn")
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert [c.waste_types_provider for c in collectors] == [["papier"]] * 3
+
+
+def test_shared_fetch_stores_into_every_collector():
+    """Collectors that shared a fetch keep its validators and address ids."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    url = "https://example/afvalstromen"
+    release = threading.Event()
+    calls = []
+
+    def _fetch(provider, *args, validators, address_cache, **kwargs):
+        calls.append(provider)
+        release.wait(timeout=5)
+        validators[url] = {"etag": '"v2"'}
+        remember_address(address_cache, "opzet|1234AB|1", {"bag_id": "0123"})
+        return [{"type": "papier", "date": next_week}]
+
+    stores = {provider: ({}, {}) for provider in ("cyclus", "montfoort")}
+
+    def _refresh(provider):
+        validators, address_cache = stores[provider]
+        MainCollector(
+            provider,
+            "1234AB",
+            "1",
+            "",
+            "",
+            exclude_pickup_today="False",
+            exclude_list="",
+            default_label="geen",
+            validators=validators,
+            address_cache=address_cache,
+        )
+
+    with (
+        patch.object(main_collector.opzet, "get_waste_data_raw", _fetch),
+        patch.object(main_collector, "NOTIFICATION_PROVIDERS", []),
+    ):
+        threads = [
+            threading.Thread(target=_refresh, args=(provider,)) for provider in stores
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    assert len(calls) == 1
+    for validators, address_cache in stores.values():
+        assert validators == {url: {"etag": '"v2"'}}
+        assert cached_address(address_cache, "opzet|1234AB|1") == {"bag_id": "0123"}
+
+
+async def test_async_shared_fetch_stores_into_every_collector():
+    """The async single flight hands the leader's validators to its followers."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    url = "https://example/rd4"
+    calls = []
+
+    async def _fetch(provider, *args, validators, **kwargs):
+        calls.append(provider)
+        await asyncio.sleep(0.05)
+        validators[url] = {"etag": '"v2"'}
+        return [{"type": "papier", "date": next_week}]
+
+    stores = [{}, {}]
+    with (
+        patch.object(
+            main_collector,
+            "ASYNC_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_RD4, _fetch)],
+        ),
+        patch.object(main_collector, "ASYNC_NOTIFICATION_PROVIDERS", []),
+    ):
+        await asyncio.gather(
+            *(
+                MainCollector.async_create(
+                    "rd4",
+                    "1234AB",
+                    "1",
+                    "",
+                    "",
+                    exclude_pickup_today="False",
+                    exclude_list="",
+                    default_label="geen",
+                    websession=MagicMock(),
+                    validators=validators,
+                )
+                for validators in stores
+            )
+        )
+
+    assert len(calls) == 1
+    assert stores == [{url: {"etag": '"v2"'}}] * 2
+
+
+def test_coalesce_key_is_per_endpoint_and_address():
+    """Aliases of one endpoint share a key; other addresses and getters do not."""
+    sensor_set = main_collector.SENSOR_COLLECTORS_OPZET
+    waste_getter = main_collector.opzet.get_waste_data_raw
+    notification_getter = main_collector.opzet.get_notification_data_raw
+
+    def _key(provider, house_number, getter=waste_getter):
+        collector = SimpleNamespace(
+            provider=provider,
+            postal_code="1234AB",
+            house_number=house_number,
+            suffix="",
+            street_name="",
+            _validators=None,
+        )
+        return MainCollector._coalesce_key(collector, sensor_set, getter)
+
+    assert _key("prezero", "1") == _key("suez", "1")
+    assert _key("prezero", "1") != _key("prezero", "2")
+    assert _key("prezero", "1") != _key("cyclus", "1")
+    assert _key("prezero", "1") != _key("prezero", "1", notification_getter)
+
+
+def test_not_modified_reuses_cached_schedule():
+    """A 304 for the schedule re-derives the sensors from the cached schedule."""
+    next_week = dt_util.now().date() + timedelta(days=7)
+    cached = [PickupEvent.on("papier", next_week)]
+    validators = {"https://example/afvalstromen": {"etag": '"v1"'}}
+    waste_getter = MagicMock(side_effect=NotModified("https://example/afvalstromen"))
+
+    with (
+        patch.object(main_collector.opzet, "get_waste_data_raw", waste_getter),
+        patch.object(
+            main_collector.opzet, "get_notification_data_raw", return_value=[]
+        ),
+    ):
+        collector = MainCollector(
+            "alphenaandenrijn",
+            "1234AB",
+            "1",
+            "",
+            "",
+            exclude_pickup_today="False",
+            exclude_list="",
+            default_label="geen",
+            validators=validators,
+            cached_waste_data_raw=cached,
+        )
+
+    assert waste_getter.call_args.kwargs["validators"] is validators
+    assert collector.not_modified is True
+    assert collector.waste_types_provider == ["papier"]
+    assert collector.waste_data_raw == cached
+
+
+def test_validators_only_sent_to_conditional_providers():
+    """Getters without conditional request support are called as before."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    waste_getter = MagicMock(return_value=[{"type": "papier", "date": next_week}])
+
+    with patch.object(main_collector.rova, "get_waste_data_raw", waste_getter):
+        collector = MainCollector(
+            "rova",
+            "1234AB",
+            "1",
+            "",
+            "",
+            exclude_pickup_today="False",
+            exclude_list="",
+            default_label="geen",
+            validators={},
+            cached_waste_data_raw=[],
+        )
+
+    assert "validators" not in waste_getter.call_args.kwargs
+    assert collector.not_modified is False
+
+
+def test_address_cache_shared_by_schedule_and_notification_getters():
+    """Both getters of an address-caching provider see the entry's cache."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    address_cache = {}
+    waste_getter = MagicMock(return_value=[{"type": "papier", "date": next_week}])
+    notification_getter = MagicMock(return_value=[])
+
+    with (
+        patch.object(main_collector.opzet, "get_waste_data_raw", waste_getter),
+        patch.object(
+            main_collector,
+            "NOTIFICATION_PROVIDERS",
+            [(main_collector.SENSOR_COLLECTORS_OPZET, notification_getter)],
+        ),
+    ):
+        MainCollector(
+            "alphenaandenrijn",
+            "1234AB",
+            "1",
+            "",
+            "",
+            exclude_pickup_today="False",
+            exclude_list="",
+            default_label="geen",
+            address_cache=address_cache,
+        )
+
+    assert waste_getter.call_args.kwargs["address_cache"] is address_cache
+    assert notification_getter.call_args.kwargs["address_cache"] is address_cache
+
+
+def test_address_cache_only_sent_to_supporting_providers():
+    """Getters without address caching are called as before."""
+    next_week = (dt_util.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    waste_getter = MagicMock(return_value=[{"type": "papier", "date": next_week}])
+
+    with patch.object(main_collector.rova, "get_waste_data_raw", waste_getter):
+        MainCollector(
+            "rova",
+            "1234AB",
+            "1",
+            "",
+            "",
+            exclude_pickup_today="False",
+            exclude_list="",
+            default_label="geen",
+            address_cache={},
+        )
+
+    assert "address_cache" not in waste_getter.call_args.kwargs
+    assert MainCollector.provider_supports_address_cache("RWM") is True
+    assert MainCollector.provider_supports_address_cache("rova") is False
+
+
+def _mijnafvalwijzer_session(*payloads):
+    session = MagicMock()
+    responses = []
+    for payload in payloads:
+        response = MagicMock()
+        response.json.return_value = payload
+        responses.append(response)
+    session.get.side_effect = responses
+    return session
+
+
+def test_mijnafvalwijzer_combined_getter_reads_one_response():
+    """Schedule and mededelingen are parsed from the same document."""
+    today = dt_util.now().strftime("%Y-%m-%d")
+    session = _mijnafvalwijzer_session(
+        {
+            "ophaaldagen": {"data": [{"date": "2026-01-05", "type": "papier"}]},
+            "data": {"mededelingen": {"data": [{"id": 7, "text": "<b>Let op</b>"}]}},
+        }
+    )
+
+    waste, notifications = (
+        main_collector.mijnafvalwijzer.get_waste_and_notification_data_raw(
+            "mijnafvalwijzer", "1234AB", "1", "", session=session
+        )
+    )
+
+    assert session.get.call_count == 1
+    assert f"&afvaldata={today}" in session.get.call_args.args[0]
+    assert waste == [{"type": "papier", "date": "2026-01-05"}]
+    assert [(n["id"], n["content"]) for n in notifications] == [(7, "Let op")]
+
+
+def test_mijnafvalwijzer_combined_getter_falls_back_without_mededelingen():
+    """A schedule response without mededelingen costs one more request."""
+    session = _mijnafvalwijzer_session(
+        {"ophaaldagen": {"data": [{"date": "2026-01-05", "type": "papier"}]}},
+        {"data": {"mededelingen": {"data": [{"id": 7, "text": "Let op"}]}}},
+    )
+
+    waste, notifications = (
+        main_collector.mijnafvalwijzer.get_waste_and_notification_data_raw(
+            "mijnafvalwijzer", "1234AB", "1", "", session=session
+        )
+    )
+
+    assert session.get.call_count == 2
+    assert "afvaldata" not in session.get.call_args.args[0]
+    assert waste == [{"type": "papier", "date": "2026-01-05"}]
+    assert [n["id"] for n in notifications] == [7]
@@ -0,0 +1,63 @@
+"""Tests for the compact pickup event model."""
+
+from datetime import date, datetime
+import sys
+
+import pytest
+
+from custom_components.afvalwijzer.common.pickup_event import (
+    PickupEvent,
+    pickup_events,
+)
+
+
+def test_raw_schedules_are_normalized_once():
+    """Types are stripped and lowercased; every date form becomes an ordinal."""
+    events = pickup_events(
+        [
+            {"type": " Papier ", "date": "2026-01-05"},
+            {"type": "gft", "date": datetime(2026, 1, 12, 7, 30)},
+            {"type": "pmd", "date": "2026-01-19T00:00:00"},
+            {"type": "restafval", "date": date(2026, 1, 26)},
+        ]
+    )
+
+    assert events == [
+        PickupEvent.on("papier", date(2026, 1, 5)),
+        PickupEvent.on("gft", date(2026, 1, 12)),
+        PickupEvent.on("pmd", date(2026, 1, 19)),
+        PickupEvent.on("restafval", date(2026, 1, 26)),
+    ]
+    assert pickup_events(events) == events
+
+
+def test_ignored_and_unusable_items_are_dropped():
+    """Ignored types, missing types and unparseable dates are skipped."""
+    assert (
+        pickup_events(
+            [
+                {"type": "ignore", "date": "2026-01-05"},
+                {"type": "", "date": "2026-01-05"},
+                {"type": "papier", "date": "soon"},
+                {"type": "papier"},
+            ]
+        )
+        == []
+    )
+
+
+def test_events_are_immutable_interned_and_small():
+    """Events share their type strings and are smaller than the dicts they replace."""
+    first, second = pickup_events(
+        [
+            {"type": "".join(["pa", "pier"]), "date": "2026-01-05"},
+            {"type": "".join(["pap", "ier"]), "date": "2026-01-12"},
+        ]
+    )
+
+    assert first.type is second.type
+    assert first.date == date(2026, 1, 5)
+    with pytest.raises(AttributeError):
+        first.ordinal = 0
+    assert not hasattr(first, "__dict__")
+    assert sys.getsizeof(first) < sys.getsizeof({"type": "papier", "date": "x"})
@@ -0,0 +1,143 @@
+"""Tests for the adaptive refresh interval."""
+
+from datetime import timedelta
+
+from custom_components.afvalwijzer.common.pickup_event import pickup_events
+from custom_components.afvalwijzer.common.refresh_scheduler import (
+    IMMINENT_PICKUP,
+    MAX_INTERVAL,
+    MIN_INTERVAL,
+    SHORT_HORIZON_INTERVAL,
+    STABLE_INTERVAL,
+    RefreshScheduler,
+    schedule_digest,
+)
+from homeassistant.util import dt as dt_util
+
+
+def _schedule(now, *days):
+    today = dt_util.as_local(now).date()
+    return pickup_events(
+        {"type": "papier", "date": (today + timedelta(days=day)).isoformat()}
+        for day in days
+    )
+
+
+def _far_schedule(now):
+    """Return a long schedule whose next pickup is well away."""
+    return _schedule(now, 10, 40, 70, 100)
+
+
+def test_digest_ignores_order_and_date_representation():
+    """The same schedule hashes the same, whatever the date type or order."""
+    now = dt_util.utcnow()
+    schedule = _schedule(now, 3, 17)
+    reordered = pickup_events(
+        {"type": event.type, "date": dt_util.start_of_local_day(event.date)}
+        for event in reversed(schedule)
+    )
+
+    assert schedule_digest(schedule) == schedule_digest(reordered)
+    assert schedule_digest(schedule) != schedule_digest(_schedule(now, 3, 18))
+
+
+def test_interval_grows_while_the_schedule_stays_the_same():
+    """Poll often right after a change, rarely once it has settled."""
+    scheduler = RefreshScheduler()
+    now = dt_util.utcnow()
+    schedule = _far_schedule(now)
+
+    assert scheduler.record(schedule, now) is True
+    assert scheduler.next_interval(schedule, now) == MIN_INTERVAL
+
+    later = now + timedelta(days=3)
+    assert scheduler.record(_far_schedule(now), later) is False
+    assert scheduler.next_interval(schedule, later) == STABLE_INTERVAL
+
+    much_later = now + timedelta(days=31)
+    assert scheduler.next_interval(_schedule(now, 40, 70, 100), much_later) == (
+        MAX_INTERVAL
+    )
+
+
+def test_imminent_pickup_polls_before_the_pickup_day():
+    """One poll as a pickup becomes imminent; then the history decides."""
+    scheduler = RefreshScheduler()
+    now = dt_util.utcnow()
+    scheduler.record(_far_schedule(now), now - timedelta(days=60))
+
+    # Three days out: wake up when the pickup becomes imminent
+    schedule = _schedule(now, 3, 40)
+    interval = scheduler.next_interval(schedule, now)
+    pickup_day = dt_util.start_of_local_day(dt_util.as_local(now).date())
+    pickup_day += timedelta(days=3)
+    assert now + interval == pickup_day - IMMINENT_PICKUP
+
+    # Inside the window the settled schedule is polled rarely again
+    assert scheduler.next_interval(schedule, now + interval) == MAX_INTERVAL
+
+
+def test_weekly_multi_type_schedule_polls_about_once_per_pickup_day():
+    """A settled weekly schedule costs a handful of polls per week."""
+    scheduler = RefreshScheduler()
+    start = dt_util.start_of_local_day(dt_util.now())
+    today = start.date()
+    scheduler.record(_far_schedule(start), start - timedelta(days=60))
+    # Mon restafval and gft, Wed papier, Fri pmd every other week, for a year
+    monday = today - timedelta(days=today.weekday())
+    schedule = pickup_events(
+        {
+            "type": waste_type,
+            "date": (monday + timedelta(weeks=week, days=weekday)).isoformat(),
+        }
+        for week in range(52)
+        for waste_type, weekday, every in (
+            ("restafval", 0, 1),
+            ("gft", 0, 1),
+            ("papier", 2, 1),
+            ("pmd", 4, 2),
+        )
+        if week % every == 0
+    )
+
+    polls = []
+    now = start + timedelta(weeks=1)
+    while now < start + timedelta(weeks=3):
+        polls.append(now)
+        now += scheduler.next_interval(schedule, now)
+
+    # One poll as each of the 5 pickup days in two weeks becomes imminent,
+    # plus the 48 hour polls in between
+    assert len(polls) <= 12
+    for event in schedule:
+        pickup_day = dt_util.start_of_local_day(event.date)
+        if start + timedelta(weeks=1, hours=36) <= pickup_day < polls[-1]:
+            assert any(
+                pickup_day - IMMINENT_PICKUP <= poll < pickup_day for poll in polls
+            )
+
+
+def test_short_horizon_polls_more_often():
+    """A schedule about to run out is refreshed more often."""
+    scheduler = RefreshScheduler()
+    now = dt_util.utcnow()
+    scheduler.record(_far_schedule(now), now - timedelta(days=60))
+
+    assert scheduler.next_interval(_schedule(now, 5, 9), now) <= (
+        SHORT_HORIZON_INTERVAL
+    )
+    assert scheduler.next_interval([], now) == MIN_INTERVAL
+
+
+def test_history_round_trips():
+    """The change history survives a restart through the cache."""
+    scheduler = RefreshScheduler()
+    now = dt_util.utcnow()
+    scheduler.record(_far_schedule(now), now)
+
+    restored = RefreshScheduler()
+    restored.restore(scheduler.as_dict())
+
+    assert restored.digest == scheduler.digest
+    assert restored.changed_at == now
+    assert restored.record(_far_schedule(now), now) is False
@@ -0,0 +1,176 @@
+"""Tests for the per-phase refresh timings."""
+
+from types import SimpleNamespace
+
+import pytest
+import requests
+from requests.hooks import dispatch_hook
+
+from custom_components.afvalwijzer.common import refresh_timings
+from custom_components.afvalwijzer.common.fan_out import run_concurrently
+from custom_components.afvalwijzer.common.refresh_timings import (
+    RefreshTimings,
+    TimingsWindow,
+    TrackedClientSession,
+    current_timings,
+    percentile,
+    phase,
+    recording,
+    track_session,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace perf_counter with a clock that only moves when told to."""
+    now = SimpleNamespace(value=0.0)
+    monkeypatch.setattr(
+        refresh_timings, "time", SimpleNamespace(perf_counter=lambda: now.value)
+    )
+    return now
+
+
+def test_nested_phases_are_charged_their_self_time(clock):
+    """A phase is not charged for the phases nested in it."""
+    timings = RefreshTimings()
+    with recording(timings):
+        with phase("schedule"):
+            clock.value += 1.0
+            with phase("auth"):
+                clock.value += 0.5
+            with phase("parse"):
+                clock.value += 0.25
+        with phase("transform"):
+            clock.value += 0.125
+    timings.finish(success=True)
+
+    assert timings.phases["schedule"] == 1.0
+    assert timings.phases["auth"] == 0.5
+    assert timings.phases["parse"] == 0.25
+    assert timings.phases["transform"] == 0.125
+    assert timings.duration == sum(timings.phases.values())
+
+
+def test_phase_outside_a_recording_does_nothing():
+    """Without a recording phases are free, also as a decorator."""
+
+    @phase("parse")
+    def _parse():
+        return current_timings()
+
+    assert _parse() is None
+
+
+def test_fan_out_threads_record_into_the_refresh():
+    """Calls run by fan_out in pool threads add to the caller's recording."""
+
+    def _notifications():
+        with phase("notifications"):
+            return current_timings()
+
+    timings = RefreshTimings()
+    with recording(timings):
+        results = run_concurrently(lambda: None, _notifications)
+
+    assert results[1] is timings
+    assert timings.phases["notifications"] > 0
+
+
+def _response(body: bytes, headers: dict[str, str]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers.update(headers)
+    return response
+
+
+def test_tracked_session_counts_requests_and_response_bytes():
+    """The response hook counts every response of a recorded refresh."""
+    session = track_session(track_session(requests.Session()))
+    assert len(session.hooks["response"]) == 1
+
+    timings = RefreshTimings()
+    with recording(timings):
+        for response in (
+            _response(b"x" * 10, {"Content-Length": "10"}),
+            _response(b"x" * 7, {}),
+        ):
+            dispatch_hook("response", session.hooks, response, stream=False)
+        # The body of a streamed response is not read just to count it
+        dispatch_hook("response", session.hooks, _response(b"x", {}), stream=True)
+    dispatch_hook("response", session.hooks, _response(b"x", {}), stream=False)
+
+    assert (timings.requests, timings.response_bytes) == (3, 17)
+
+
+async def test_tracked_client_session_counts_aiohttp_responses():
+    """Responses through the wrapped aiohttp session are counted."""
+
+    class _Request:
+        def __init__(self, response):
+            self.response = response
+
+        async def __aenter__(self):
+            return self.response
+
+        async def __aexit__(self, *exc_info):
+            return None
+
+    class _Session:
+        closed = False
+
+        def request(self, method, url, **kwargs):
+            return _Request(SimpleNamespace(method=method, content_length=42))
+
+    session = TrackedClientSession(_Session())
+    timings = RefreshTimings()
+    with recording(timings):
+        async with session.get("https://example.nl") as response:
+            assert response.method == "GET"
+        async with session.post("https://example.nl") as response:
+            pass
+
+    assert (timings.requests, timings.response_bytes) == (2, 84)
+    assert session.closed is False
+
+
+def test_percentile_uses_nearest_rank():
+    """p50 and p95 are values that actually occurred."""
+    values = [float(value) for value in range(1, 21)]
+
+    assert percentile(values, 50) == 10.0
+    assert percentile(values, 95) == 19.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) is None
+
+
+def test_window_summarizes_the_last_refreshes(clock):
+    """The window keeps its size and summarizes what it holds."""
+    window = TimingsWindow(size=3)
+    for seconds, success in ((9.0, True), (1.0, True), (2.0, False), (3.0, True)):
+        timings = RefreshTimings()
+        with recording(timings), phase("schedule"):
+            clock.value += seconds
+        timings.add_response(100)
+        timings.finish(success=success)
+        window.add(timings)
+
+    summary = window.summary()
+
+    assert len(window) == summary["refreshes"] == 3
+    assert summary["failures"] == 1
+    assert summary["duration_ms"] == {"p50": 2000.0, "p95": 3000.0}
+    assert summary["phases_ms"]["schedule"]["p50"] == 2000.0
+    assert summary["phases_ms"]["auth"] == {"p50": 0.0, "p95": 0.0}
+    assert summary["requests"] == {"p50": 1, "p95": 1}
+    assert summary["last"]["duration_ms"] == 3000.0
+    assert window.last is timings
+
+
+def test_empty_window_summary():
+    """Without refreshes there is nothing to summarize."""
+    summary = TimingsWindow().summary()
+
+    assert summary["refreshes"] == 0
+    assert summary["duration_ms"] == {"p50": None, "p95": None}
+    assert summary["last"] is None
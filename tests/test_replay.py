@@ -0,0 +1,119 @@
+"""Tests for the offline replay harness in tests/replay."""
+
+import pytest
+import requests
+
+from custom_components.afvalwijzer.collector.main_collector import MainCollector
+from tests.replay.client import RecordingSession, ReplaySession
+from tests.replay.harness import replay_fixture
+from tests.replay.server import ReplayServer, fixture_names, load_fixture
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+# conftest blocks Session.request; these sessions only talk to 127.0.0.1
+_SESSION_REQUEST = requests.Session.request
+
+
+@pytest.fixture(autouse=True)
+def _allow_replay_requests(monkeypatch):
+    monkeypatch.setattr(ReplaySession, "request", _SESSION_REQUEST)
+    monkeypatch.setattr(RecordingSession, "request", _SESSION_REQUEST)
+
+
+@pytest.fixture
+def server():
+    """Return a running replay server without exchanges."""
+    with ReplayServer() as replay_server:
+        yield replay_server
+
+
+@pytest.mark.parametrize("name", fixture_names())
+def test_fixture_replays_through_main_collector(server, name):
+    """Every request of a refresh is answered and yields a schedule."""
+    first, second = replay_fixture(server, name, load_fixture(name), refreshes=2)
+
+    for report in (first, second):
+        assert report.error is None
+        assert report.misses == []
+        assert report.pickups > 0
+    # Cached addresses, tokens and validators never cost extra requests
+    assert 0 < second.requests <= first.requests
+
+
+@pytest.mark.parametrize("name", ["icalendar", "mijnafvalwijzer", "opzet", "rd4"])
+def test_async_providers_replay_through_async_create(server, monkeypatch, name):
+    """Providers with native asyncio getters are fetched as the coordinator does."""
+    created = []
+    async_create = MainCollector.async_create
+
+    async def _async_create(*args, **kwargs):
+        created.append(type(kwargs["websession"]).__name__)
+        return await async_create(*args, **kwargs)
+
+    monkeypatch.setattr(MainCollector, "async_create", _async_create)
+
+    (report,) = replay_fixture(server, name, load_fixture(name))
+
+    assert report.error is None
+    assert report.pickups > 0
+    assert created == ["ReplayClientSession"]
+
+
+def test_replay_keeps_original_url_and_cookie_domain(server):
+    """Collectors see the URL they asked for; cookies keep their domain."""
+    server.load(
+        [
+            {
+                "host": "example.nl",
+                "path": "/login",
+                "headers": {"Set-Cookie": "session=abc; Path=/"},
+                "body": "ok",
+            }
+        ]
+    )
+    session = ReplaySession(server.url)
+
+    response = session.get("https://example.nl/login?user=x")
+
+    assert response.url == "https://example.nl/login?user=x"
+    assert response.cookies.get("session", domain="example.nl") == "abc"
+    assert session.cookies.get("session", domain="example.nl") == "abc"
+    stats = server.reset()
+    assert (stats.requests, stats.bytes_received) == (1, 2)
+
+
+def test_unmatched_requests_are_misses(server):
+    """A request without a recorded response gets a 404 and is reported."""
+    session = ReplaySession(server.url)
+
+    assert session.get("https://example.nl/missing").status_code == 404
+    assert server.reset().misses == ["GET example.nl/missing"]
+
+
+def test_failure_injection(server):
+    """With a failure rate of 1 every request is answered with a 503."""
+    server.failure_rate = 1.0
+
+    (report,) = replay_fixture(server, "rova", load_fixture("rova"))
+
+    assert report.error is not None
+    assert report.failures == report.requests == 1
+
+
+def test_recording_session_keeps_exchanges(server):
+    """Recorded exchanges are fixtures the server can replay."""
+    exchange = {
+        "method": "GET",
+        "host": server.url.removeprefix("http://"),
+        "path": "/calendar",
+        "query": {"year": "2026"},
+        "status": 200,
+        "headers": {"Content-Type": "application/json", "ETag": '"1"'},
+        "json": {"items": [1, 2]},
+    }
+    server.load([exchange])
+    session = RecordingSession()
+
+    session.get(f"{server.url}/calendar", params={"year": "2026"})
+
+    assert session.exchanges == [exchange]
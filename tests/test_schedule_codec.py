@@ -0,0 +1,49 @@
+"""Tests for the columnar schedule cache encoding."""
+
+from datetime import date, datetime
+import json
+
+from custom_components.afvalwijzer.common.pickup_event import (
+    PickupEvent,
+    pickup_events,
+)
+from custom_components.afvalwijzer.common.schedule_codec import (
+    decode_schedule,
+    encode_schedule,
+)
+
+
+def test_round_trip_accepts_strings_and_datetimes():
+    """Encoded schedules decode to the same types and dates, in order."""
+    schedule = [
+        {"type": "gft", "date": "2026-01-05"},
+        {"type": "papier", "date": datetime(2026, 1, 12)},
+        {"type": "gft", "date": "2026-01-19T00:00:00"},
+    ]
+
+    encoded = encode_schedule(pickup_events(schedule))
+
+    assert encoded["types"] == ["gft", "papier"]
+    assert encoded["type_index"] == [0, 1, 0]
+    assert decode_schedule(encoded) == [
+        PickupEvent.on("gft", date(2026, 1, 5)),
+        PickupEvent.on("papier", date(2026, 1, 12)),
+        PickupEvent.on("gft", date(2026, 1, 19)),
+    ]
+
+
+def test_encoding_is_several_times_smaller_than_the_dict_list():
+    """A year of pickups takes a fraction of the JSON dict-list size."""
+    schedule = [
+        {"type": waste_type, "date": datetime.fromordinal(739252 + day).isoformat()}
+        for day in range(0, 365, 7)
+        for waste_type in ("gft", "papier", "restafval", "pmd")
+    ]
+
+    encoded = encode_schedule(pickup_events(schedule))
+    assert len(json.dumps(encoded)) * 3 < len(json.dumps(schedule))
+
+
+def test_empty_schedule():
+    """An empty schedule survives the round trip."""
+    assert decode_schedule(encode_schedule([])) == []
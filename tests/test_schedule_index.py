@@ -0,0 +1,69 @@
+"""Tests for the date-sorted schedule index used by the calendar."""
+
+from datetime import date, datetime
+
+from custom_components.afvalwijzer.common.schedule_index import (
+    ScheduleIndex,
+    build_schedule_index,
+)
+
+
+def _index():
+    return ScheduleIndex(
+        [
+            ("papier", date(2026, 3, 2)),
+            ("gft", date(2026, 1, 5)),
+            ("Restafval", date(2026, 1, 5)),
+            ("gft", date(2026, 1, 19)),
+        ]
+    )
+
+
+def test_between_is_sorted_and_inclusive():
+    """Range queries return pickups by date, including both bounds."""
+    index = _index()
+
+    assert index.between(date(2026, 1, 5), date(2026, 1, 19)) == [
+        ("gft", date(2026, 1, 5)),
+        ("Restafval", date(2026, 1, 5)),
+        ("gft", date(2026, 1, 19)),
+    ]
+    assert index.between(date(2026, 1, 6), date(2026, 1, 18)) == []
+
+
+def test_queries_per_type_are_case_insensitive():
+    """Per-type queries only see that type."""
+    index = _index()
+
+    assert index.between(date(2026, 1, 1), date(2026, 12, 31), waste_type="GFT") == [
+        ("gft", date(2026, 1, 5)),
+        ("gft", date(2026, 1, 19)),
+    ]
+    assert index.next_pickup(date(2026, 1, 6), waste_type="restafval") is None
+    assert index.between(date(2026, 1, 1), date(2026, 12, 31), waste_type="glas") == []
+
+
+def test_next_pickup_groups_types_on_the_same_date():
+    """The next pickup lists every type collected that day once."""
+    index = _index()
+
+    assert index.next_pickup(date(2026, 1, 1)) == (
+        date(2026, 1, 5),
+        ["gft", "Restafval"],
+    )
+    assert index.next_pickup(date(2026, 1, 6)) == (date(2026, 1, 19), ["gft"])
+    assert index.next_pickup(date(2026, 3, 3)) is None
+
+
+def test_build_applies_exclude_list_and_fallback():
+    """Excluded types are dropped; next-per-type data is used without raw data."""
+    raw = [
+        {"type": "gft", "date": datetime(2026, 1, 5)},
+        {"type": "papier", "date": "2026-01-12T00:00:00"},
+    ]
+    assert len(build_schedule_index(raw, {}, "papier")) == 1
+
+    fallback = build_schedule_index([], {"gft": "2026-01-05", "pmd": "geen"}, "")
+    assert fallback.between(date(2026, 1, 1), date(2026, 1, 31)) == [
+        ("gft", date(2026, 1, 5))
+    ]
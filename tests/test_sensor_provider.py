@@ -339,3 +339,36 @@ async def test_timestamp_state_survives_real_ha_validation(hass):
     state = hass.states.get(sensor.entity_id)
     assert state.state not in (None, "unknown", "unavailable")
     assert dt_util.parse_datetime(state.state) is not None
+
+
+def test_unchanged_key_skips_state_write():
+    """A refresh that did not change this sensor's data does not write state."""
+    coordinator = FakeCoordinator(provider_data={"papier": "2026-07-23"})
+    coordinator.changed_keys = {"papier"}
+    cfg = {
+        CONF_COLLECTOR: "mijnafvalwijzer",
+        CONF_POSTAL_CODE: "1234AB",
+        CONF_HOUSE_NUMBER: "1",
+        CONF_SUFFIX: "",
+        CONF_DEFAULT_LABEL: "geen",
+    }
+    sensor = ProviderSensor(_make_hass(), "papier", coordinator, cfg)
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 1
+
+    # Another waste type changed; this one did not
+    coordinator.changed_keys = {"gft"}
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 1
+
+    # Availability changes are always written
+    coordinator.last_update_success = False
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 2
+
+    coordinator.last_update_success = True
+    coordinator.changed_keys = {"papier"}
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 3
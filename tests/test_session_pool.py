@@ -0,0 +1,96 @@
+"""Tests for the shared HTTP connection pool."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from custom_components.afvalwijzer.common.session_pool import (
+    SessionPool,
+    async_get_session_pool,
+    async_release_session_pool,
+)
+from custom_components.afvalwijzer.const.const import DATA_SESSION_POOL, DOMAIN
+
+
+def test_sessions_share_adapters_but_not_cookies():
+    """Sessions from one pool reuse connections but keep their own cookies."""
+    pool = SessionPool()
+    first = pool.session()
+    second = pool.session()
+
+    assert first.get_adapter("https://a.example/") is second.get_adapter(
+        "https://b.example/"
+    )
+    assert first.get_adapter("http://a.example/") is second.get_adapter(
+        "http://a.example/"
+    )
+
+    first.cookies.set("CB_SESSION", "abc")
+    assert "CB_SESSION" not in second.cookies
+
+
+def test_adapter_pool_sizes_are_bounded():
+    """The shared adapters are built with the configured pool bounds."""
+    pool = SessionPool(pool_connections=3, pool_maxsize=2)
+    adapter = pool.session().get_adapter("https://a.example/")
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 2
+
+
+def test_session_close_keeps_shared_connections_open():
+    """Closing one refresh's session must not close the shared pools."""
+    pool = SessionPool()
+    session = pool.session()
+    adapter = session.get_adapter("https://a.example/")
+    adapter.close = MagicMock()
+
+    session.cookies.set("token", "x")
+    session.close()
+
+    adapter.close.assert_not_called()
+    assert not session.cookies
+
+
+def test_evict_idle_only_after_timeout():
+    """Pooled connections are closed only once the pool has been idle."""
+    pool = SessionPool(idle_timeout=timedelta(minutes=10))
+    adapter = pool.session().get_adapter("https://a.example/")
+    adapter.close = MagicMock()
+    last_used = pool._last_used
+
+    assert pool.evict_idle(now=last_used + 60) is False
+    adapter.close.assert_not_called()
+
+    assert pool.evict_idle(now=last_used + 601) is True
+    adapter.close.assert_called()
+
+    # Evicted adapters stay mounted and are reused by later sessions
+    assert pool.session().get_adapter("https://a.example/") is adapter
+
+
+def test_release_reports_last_user():
+    """The pool reports when its last config entry released it."""
+    pool = SessionPool()
+    pool.acquire("a")
+    pool.acquire("b")
+
+    assert pool.release("a") is False
+    assert pool.release("b") is True
+
+
+async def test_pool_lives_in_hass_data_until_last_entry_unloads(hass):
+    """All entries get the same pool; it is closed after the last release."""
+    first = async_get_session_pool(hass, "entry_a")
+    second = async_get_session_pool(hass, "entry_b")
+
+    assert first is second
+    assert hass.data[DOMAIN][DATA_SESSION_POOL] is first
+
+    first.close = MagicMock()
+    async_release_session_pool(hass, "entry_a")
+    first.close.assert_not_called()
+    assert DATA_SESSION_POOL in hass.data[DOMAIN]
+
+    async_release_session_pool(hass, "entry_b")
+    first.close.assert_called_once()
+    assert DATA_SESSION_POOL not in hass.data[DOMAIN]
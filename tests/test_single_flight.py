@@ -0,0 +1,114 @@
+"""Tests for the single-flight request coalescing helper."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from custom_components.afvalwijzer.common.single_flight import SingleFlight
+
+
+def _run_concurrently(single_flight, key, fn, callers):
+    results = [None] * callers
+    errors = [None] * callers
+
+    def _call(index):
+        try:
+            results[index] = single_flight.do(key, fn)
+        except Exception as err:  # noqa: BLE001 - collected for the assertions
+            errors[index] = err
+
+    threads = [threading.Thread(target=_call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_concurrent_threads_share_one_call():
+    """Threads asking for the same key while a call is in flight share it."""
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def _fetch():
+        calls.append(1)
+        release.wait(timeout=5)
+        return ["schedule"]
+
+    threads, results, errors = _run_concurrently(single_flight, "key", _fetch, 4)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert results == [["schedule"]] * 4
+    assert errors == [None] * 4
+    assert single_flight.in_flight() == 0
+
+
+def test_exceptions_are_shared_and_not_cached():
+    """A failing call fails every waiter, and the next call runs again."""
+    single_flight = SingleFlight()
+
+    def _fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        single_flight.do("key", _fail)
+
+    assert single_flight.do("key", lambda: "ok") == "ok"
+
+
+def test_sequential_calls_are_not_coalesced():
+    """Only concurrent calls are shared; results are never cached."""
+    single_flight = SingleFlight()
+    calls = []
+
+    for _ in range(3):
+        single_flight.do("key", lambda: calls.append(1))
+
+    assert len(calls) == 3
+
+
+async def test_concurrent_coroutines_share_one_call():
+    """Coroutines awaiting the same key share a single in-flight call."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def _fetch():
+        calls.append(1)
+        await release.wait()
+        return ["schedule"]
+
+    waiters = asyncio.gather(
+        *(single_flight.async_do("key", _fetch) for _ in range(3)),
+        single_flight.async_do("other", _fetch),
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiters == [["schedule"]] * 4
+    assert len(calls) == 2
+    assert single_flight.in_flight() == 0
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    """One waiter being cancelled leaves the shared call running for others."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def _fetch():
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(single_flight.async_do("key", _fetch))
+    second = asyncio.ensure_future(single_flight.async_do("key", _fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
@@ -0,0 +1,216 @@
+"""Tests for reusing login tokens of Burgerportaal and Omrin."""
+
+import base64
+import json
+from unittest.mock import MagicMock
+
+import requests
+
+from custom_components.afvalwijzer.collector import burgerportaal, circulus, omrin
+from custom_components.afvalwijzer.common.token_store import (
+    TOKEN_EXPIRY_MARGIN,
+    durable_tokens,
+    jwt_expiry,
+    remember_token,
+    stable_value,
+    valid_token,
+)
+
+_CALENDAR = [{"collectionDate": "2026-01-05T00:00:00", "fraction": "Papier"}]
+_CALENDAR_ITEM = {"code": "papier", "dates": ["2026-01-05"]}
+
+
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode()
+    return f"header.{payload.rstrip('=')}.signature"
+
+
+def _response(data, status=200):
+    response = MagicMock(status_code=status, content=b"x")
+    response.json.return_value = data
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            str(status), response=response
+        )
+    return response
+
+
+def test_tokens_are_renewed_before_they_expire():
+    """A token within the expiry margin is no longer handed out."""
+    store = {}
+    remember_token(store, "id_token", "abc", expires_in=3600, now=1000.0)
+
+    assert valid_token(store, "id_token", now=1000.0) == "abc"
+    near_expiry = 1000.0 + 3600 - TOKEN_EXPIRY_MARGIN.total_seconds()
+    assert valid_token(store, "id_token", now=near_expiry) is None
+    assert valid_token(None, "id_token") is None
+
+
+def test_stable_value_is_created_once():
+    """The device id is generated on first use and kept afterwards."""
+    store = {}
+    factory = MagicMock(side_effect=["device-1", "device-2"])
+
+    assert stable_value(store, "device_id", factory) == "device-1"
+    assert stable_value(store, "device_id", factory) == "device-1"
+    factory.assert_called_once()
+
+
+def test_only_durable_tokens_are_worth_a_write():
+    """Short-lived tokens do not count as a cache change."""
+    store = {}
+    remember_token(store, "refresh_token", "r")
+    remember_token(store, "id_token", "i", expires_in=3600, durable=False)
+    assert list(durable_tokens(store)) == ["refresh_token"]
+
+
+def test_jwt_expiry_reads_exp_claim():
+    """The exp claim decides when Omrin logs in again."""
+    assert jwt_expiry(_jwt(1893456000)) == 1893456000.0
+    assert jwt_expiry("not-a-jwt") is None
+
+
+def test_burgerportaal_reuses_the_anonymous_account():
+    """Only the first refresh signs up; later ones renew the id token."""
+    session = MagicMock()
+    session.post.side_effect = lambda url, **kwargs: _response(
+        {"refreshToken": "refresh"}
+        if "signupNewUser" in url
+        else {"id_token": "id", "expires_in": "3600"}
+    )
+    session.get.side_effect = lambda url, **kwargs: _response(
+        _CALENDAR if url.endswith("/calendar") else [{"addressId": "a1"}]
+    )
+    store, addresses = {}, {}
+
+    def fetch():
+        return burgerportaal.get_waste_data_raw(
+            "groningen",
+            "9711AA",
+            "1",
+            "",
+            session=session,
+            token_store=store,
+            address_cache=addresses,
+        )
+
+    assert fetch() == [{"type": "papier", "date": "2026-01-05"}]
+    assert session.post.call_count == 2
+    assert session.get.call_count == 2
+
+    # Within the id token's lifetime: a single schedule request
+    assert fetch() == [{"type": "papier", "date": "2026-01-05"}]
+    assert session.post.call_count == 2
+    assert session.get.call_count == 3
+
+    # Expired id token: renewed with the stored refresh token, no new signup
+    store["id_token"]["expires_at"] = 0
+    fetch()
+    urls = [call.args[0] for call in session.post.call_args_list]
+    assert sum("signupNewUser" in url for url in urls) == 1
+    assert session.get.call_count == 4
+
+
+def test_omrin_reuses_token_and_device_id():
+    """Omrin logs in once per token lifetime, always as the same device."""
+    session = MagicMock()
+    calendar = {"data": {"fetchCalendar": [{"date": "2026-01-05", "type": "papier"}]}}
+    responses = {
+        "login": _response({"success": True, "data": {"accessToken": _jwt(4e9)}}),
+        "graphql": _response(calendar),
+    }
+    session.post.side_effect = lambda url, **kwargs: responses[
+        "login" if url.endswith("/login") else "graphql"
+    ]
+    store = {}
+
+    def fetch():
+        return omrin.get_waste_data_raw(
+            "omrin", "8401AA", "1", "", session=session, token_store=store
+        )
+
+    fetch()
+    fetch()
+    logins = [c for c in session.post.call_args_list if c.args[0].endswith("/login")]
+    assert len(logins) == 1
+
+    # A revoked token triggers one new login, with the same device id
+    responses["graphql"] = _response({}, status=401)
+    session.post.side_effect = [
+        responses["graphql"],
+        responses["login"],
+        _response(calendar),
+    ]
+    assert fetch() == [{"type": "papier", "date": "2026-01-05"}]
+    logins = [c for c in session.post.call_args_list if c.args[0].endswith("/login")]
+    assert len(logins) == 2
+    device_ids = {c.kwargs["json"]["DeviceId"] for c in logins}
+    assert device_ids == {store["device_id"]["value"]}
+
+
+def test_omrin_logs_in_again_after_a_graphql_auth_error():
+    """A stored token answered with GraphQL errors and a 200 is replaced."""
+    session = MagicMock()
+    calendar = {"data": {"fetchCalendar": [{"date": "2026-01-05", "type": "papier"}]}}
+    session.post.side_effect = [
+        _response({"errors": [{"message": "The current user is not authorized"}]}),
+        _response({"success": True, "data": {"accessToken": "opaque-token"}}),
+        _response(calendar),
+    ]
+    store = {}
+    remember_token(store, "access_token", "revoked-token", expires_at=4e9)
+
+    waste_data_raw = omrin.get_waste_data_raw(
+        "omrin", "8401AA", "1", "", session=session, token_store=store
+    )
+
+    assert waste_data_raw == [{"type": "papier", "date": "2026-01-05"}]
+    urls = [c.args[0] for c in session.post.call_args_list]
+    assert [url.rsplit("/", 1)[-1] for url in urls] == ["graphql", "login", "graphql"]
+    assert store["access_token"]["value"] == "opaque-token"
+    # A token without an exp claim does not live forever
+    assert store["access_token"]["expires_at"] is not None
+
+
+def test_circulus_reuses_cookies_until_the_session_expires():
+    """Only an expired session runs the login flow again."""
+    session = MagicMock(cookies=requests.cookies.RequestsCookieJar())
+    calendar = {"customData": {"response": {"garbage": [_CALENDAR_ITEM]}}}
+    schedule = {"response": _response(calendar)}
+
+    def _cookie_response(data, value):
+        response = _response(data)
+        response.cookies = requests.cookies.cookiejar_from_dict({"CB_SESSION": value})
+        return response
+
+    def _get(url, **kwargs):
+        if "afvalkalender.json" in url:
+            return schedule["response"]
+        return _cookie_response({}, "__AT=token&___TS=1")
+
+    session.get.side_effect = _get
+    session.post.side_effect = lambda url, **kwargs: _cookie_response(
+        {"flashMessage": None}, "logged-in"
+    )
+    store = {}
+
+    def fetch():
+        return circulus.get_waste_data_raw(
+            "circulus", "7411AA", "1", "", session=session, token_store=store
+        )
+
+    assert fetch() == [{"type": "papier", "date": "2026-01-05"}]
+    assert fetch() == [{"type": "papier", "date": "2026-01-05"}]
+    assert session.post.call_count == 1
+    assert session.get.call_args.kwargs["cookies"] == {"CB_SESSION": "logged-in"}
+
+    # An expired session is answered without customData: log in once more
+    expired = _response({"flashMessage": "login"})
+    responses = iter([expired, _response(calendar)])
+    session.get.side_effect = lambda url, **kwargs: (
+        next(responses)
+        if "afvalkalender.json" in url
+        else _cookie_response({}, "__AT=token&___TS=2")
+    )
+    assert fetch() == [{"type": "papier", "date": "2026-01-05"}]
+    assert session.post.call_count == 2
@@ -0,0 +1,62 @@
+"""Tests for the single-pass waste data transformer."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from custom_components.afvalwijzer.common.pickup_event import pickup_events
+from custom_components.afvalwijzer.common.waste_data_transformer import (
+    WasteDataTransformer,
+)
+
+_NOW = datetime(2026, 7, 9, 12, 0)
+
+
+def _transform(waste_data, exclude_pickup_today="True", exclude_list=""):
+    with patch(
+        "custom_components.afvalwijzer.common.waste_data_transformer.dt_util.now",
+        return_value=_NOW,
+    ):
+        return WasteDataTransformer(
+            pickup_events(waste_data), exclude_pickup_today, exclude_list, "geen"
+        )
+
+
+def test_sensor_structures():
+    """Next pickups, day sensors and the next pickup come from one pass."""
+    transformer = _transform(
+        [
+            {"type": "papier", "date": "2026-07-12"},
+            {"type": "gft", "date": "2026-07-09"},
+            {"type": "pmd", "date": "2026-07-10"},
+            {"type": "gft", "date": "2026-07-23"},
+            {"type": "restafval", "date": "2026-07-10"},
+            {"type": "textiel", "date": "2026-06-01"},
+            {"type": "ignore", "date": "2026-07-10"},
+        ],
+        exclude_list="papier",
+    )
+
+    assert transformer.waste_data_with_today == {
+        "gft": datetime(2026, 7, 9),
+        "pmd": datetime(2026, 7, 10),
+        "restafval": datetime(2026, 7, 10),
+        "textiel": "geen",
+    }
+    assert transformer.waste_data_provider["gft"] == datetime(2026, 7, 23)
+    assert transformer.waste_types_provider == ["gft", "pmd", "restafval", "textiel"]
+    assert transformer.waste_data_custom == {
+        "next_date": datetime(2026, 7, 10),
+        "next_in_days": 1,
+        "next_type": "pmd, restafval",
+        "today": "gft",
+        "tomorrow": "pmd, restafval",
+        "day_after_tomorrow": "geen",
+    }
+
+
+def test_empty_schedule_uses_the_default_label():
+    """Without pickups every custom sensor shows the default label."""
+    transformer = _transform([])
+
+    assert transformer.waste_data_provider == {}
+    assert set(transformer.waste_data_custom.values()) == {"geen"}